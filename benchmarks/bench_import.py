@@ -0,0 +1,96 @@
+"""Import-time benchmark for the Evopell integration.
+
+Measures, each in a fresh interpreter, the cold import of the integration
+package and of every platform, checks that the full register list
+(register_map) stays unloaded during a normal setup, and times the CPU work
+async_setup_entry does before the first request: compiling the register
+catalog and registering the polled parameters. Network I/O is not included.
+Requires Home Assistant to be installed.
+
+    python benchmarks/bench_import.py [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import subprocess
+import sys
+
+ROOT = Path(__file__).parent.parent
+PACKAGE = "custom_components.evopell"
+PLATFORMS = ("binary_sensor", "button", "number", "select", "sensor")
+
+_SETUP_SNIPPET = f"""
+import sys, time
+import {PACKAGE}
+from {PACKAGE}.catalog import get_catalog
+
+start = time.perf_counter()
+catalog = get_catalog()
+param_map = {{d.tid: d.name for d in catalog.polled}}
+poll_tiers = {{d.tid: d.poll_tier for d in catalog.polled}}
+setup = time.perf_counter() - start
+
+start = time.perf_counter()
+get_catalog()
+cached = time.perf_counter() - start
+
+lazy = "{PACKAGE}.register_map" not in sys.modules
+start = time.perf_counter()
+from {PACKAGE}.const import EVOPELL_PARAM_MAP
+full_map = time.perf_counter() - start
+print(setup, cached, full_map, lazy, len(EVOPELL_PARAM_MAP))
+"""
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def cold_import(module: str, repeat: int) -> float:
+    """Return the best cumulative import time of module in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        stderr = _run(f"import {module}", "-X", "importtime").stderr
+        for line in stderr.splitlines():
+            # import time: self [us] | cumulative | imported package
+            fields = line.removeprefix("import time:").split("|")
+            if len(fields) == 3 and fields[2].strip() == module:
+                best = min(best, int(fields[1]) / 1e6)
+    return best
+
+
+def main() -> int:
+    """Print the import and setup timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for module in (
+        PACKAGE,
+        f"{PACKAGE}.const",
+        *(f"{PACKAGE}.{platform}" for platform in PLATFORMS),
+    ):
+        print(f"{module:>40}: {cold_import(module, args.repeat) * 1e3:8.1f} ms")
+
+    results = [_run(_SETUP_SNIPPET).stdout.split() for _ in range(args.repeat)]
+    setup = min(float(r[0]) for r in results)
+    cached = min(float(r[1]) for r in results)
+    full_map = min(float(r[2]) for r in results)
+    lazy = all(r[3] == "True" for r in results)
+    print(f"{'catalog compile (first entry)':>40}: {setup * 1e3:8.2f} ms")
+    print(f"{'catalog reuse (next entries)':>40}: {cached * 1e6:8.2f} us")
+    print(f"{'full register list, lazy load':>40}: {full_map * 1e3:8.2f} ms")
+    print(f"{'register_map unloaded after setup':>40}: {lazy}")
+    return 0 if lazy else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+"""Benchmark suite for the poll, parse and fan-out pipeline.
+
+Runs EvopellHub and EvopellCoordinator against the in-process controller
+simulator (tools/simulator.py) and measures:
+
+* parse throughput of _parse_xml_response (registers/s),
+* full poll cycle latency of all polled catalog registers per chunk size,
+* entity fan-out cost of one refresh (one listener per catalog entity),
+* memory per device with 1, 10 and 100 simulated controllers.
+
+The suite runs --rounds times and keeps the best value of every metric, which
+filters out noise from other processes. Results are written as JSON and
+compared with a saved baseline; a metric worse than the baseline by more than
+--tolerance fails the run. Requires Home Assistant to be installed.
+
+    python benchmarks/bench_pipeline.py [--save] [--rounds 5] [--tolerance 0.25]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+from pathlib import Path
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import MappingProxyType
+from typing import Any
+
+ROOT = Path(__file__).parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / "tools")]
+
+from homeassistant.components.network import async_get_adapters  # noqa: E402
+from homeassistant.config_entries import SOURCE_USER, ConfigEntry  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from simulator import EvopellSimulator, SimulatorConfig  # noqa: E402
+
+from custom_components.evopell.catalog import get_catalog  # noqa: E402
+from custom_components.evopell.const import DOMAIN  # noqa: E402
+from custom_components.evopell.evopell import (  # noqa: E402
+    EvopellCoordinator,
+    EvopellHub,
+)
+from custom_components.evopell.tuning import TuningState  # noqa: E402
+
+BASELINE = Path(__file__).parent / "baselines" / "pipeline.json"
+CHUNK_SIZES = (5, 10, 20, 40)
+DEVICE_COUNTS = (1, 10, 100)
+
+
+def _metric(value: float, unit: str, better: str) -> dict[str, Any]:
+    return {"value": round(value, 3), "unit": unit, "better": better}
+
+
+def _new_hub(hass: HomeAssistant, base_url: str) -> EvopellHub:
+    """Create a hub set up like async_setup_entry does with default options.
+
+    Domyślnie hub korzysta ze wspólnej sesji HTTP Home Assistanta.
+    """
+    hub = EvopellHub(hass, base_url, None, None)
+    for descriptor in get_catalog().polled:
+        hub.param_map[descriptor.tid] = descriptor.name
+        hub.registers_data.declare(
+            descriptor.tid, descriptor.value_type, descriptor.divider
+        )
+    return hub
+
+
+async def bench_parse(hub: EvopellHub, repeat: int) -> dict[str, Any]:
+    """Measure registers parsed per second from a full catalog response."""
+    tids = list(hub.param_map)
+    url = f"{hub.base_url}/getregister.cgi?device=0&{'&'.join(tids)}"
+    async with hub._session.get(url) as resp:  # noqa: SLF001
+        body = await resp.read()
+    count = len(hub._parse_xml_response(body))  # noqa: SLF001
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(100):
+            hub._parse_xml_response(body)  # noqa: SLF001
+        best = min(best, (time.perf_counter() - start) / 100)
+    return {"parse_throughput": _metric(count / best, "registers/s", "higher")}
+
+
+async def bench_poll(hub: EvopellHub, repeat: int) -> dict[str, Any]:
+    """Measure one poll of all polled registers at fixed chunk sizes."""
+    tids = list(hub.param_map)
+    results: dict[str, Any] = {}
+    for chunk_size in CHUNK_SIZES:
+        samples = []
+        for _ in range(repeat):
+            hub.tuner.restore(TuningState(chunk_size=chunk_size, concurrency=1))
+            start = time.perf_counter()
+            await hub.async_fetch_registers(0, *tids)
+            samples.append(time.perf_counter() - start)
+        results[f"poll_latency_chunk_{chunk_size}"] = _metric(
+            min(samples) * 1e3, "ms", "lower"
+        )
+    return results
+
+
+async def bench_fanout(
+    hass: HomeAssistant, hub: EvopellHub, repeat: int
+) -> dict[str, Any]:
+    """Measure notifying one listener per catalog entity after a refresh."""
+    # Bez odpytywania: koordynator nie planuje odświeżeń po dodaniu słuchaczy
+    entry = ConfigEntry(
+        data={},
+        discovery_keys=MappingProxyType({}),
+        domain=DOMAIN,
+        entry_id="bench",
+        minor_version=1,
+        options={},
+        pref_disable_polling=True,
+        source=SOURCE_USER,
+        subentries_data=None,
+        title="bench",
+        unique_id=None,
+        version=1,
+    )
+    coordinator = EvopellCoordinator(hass, entry, hub, "bench", 30)
+    table = hub.registers_data
+
+    def _listener(tid: str):
+        def _update() -> None:
+            # Encja przy zapisie stanu odczytuje zdekodowaną wartość
+            register = table.get(tid)
+            if register is not None:
+                register.native_value  # noqa: B018
+
+        return _update
+
+    tids = [d.tid for d in get_catalog().polled]
+    unsubs = [coordinator.async_add_listener(_listener(tid), tid) for tid in tids]
+    coordinator.last_update_success = True
+    coordinator._notified_success = True  # noqa: SLF001
+
+    results: dict[str, Any] = {}
+    for label, changed in (("all", set(tids)), ("none", set())):
+        best = float("inf")
+        for _ in range(repeat):
+            coordinator._changed_keys = set(changed)  # noqa: SLF001
+            start = time.perf_counter()
+            coordinator.async_update_listeners()
+            best = min(best, time.perf_counter() - start)
+        results[f"fanout_changed_{label}"] = _metric(best * 1e6, "us", "lower")
+    for unsub in unsubs:
+        unsub()
+    return results
+
+
+async def bench_memory(hass: HomeAssistant, base_url: str) -> dict[str, Any]:
+    """Measure memory retained per device after one full poll."""
+    results: dict[str, Any] = {}
+    for count in DEVICE_COUNTS:
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        hubs = [_new_hub(hass, base_url) for _ in range(count)]
+        for hub in hubs:
+            await hub.async_fetch_registers(0, *hub.param_map)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        for hub in hubs:
+            await hub.async_close()
+        results[f"memory_per_device_{count}"] = _metric(
+            retained / count / 1024, "KiB", "lower"
+        )
+    return results
+
+
+def best_of(rounds: list[dict[str, Any]]) -> dict[str, Any]:
+    """Return the best value of every metric over several rounds."""
+    pick = {"higher": max, "lower": min}
+    return {
+        name: pick[metric["better"]](
+            (result[name] for result in rounds), key=lambda m: m["value"]
+        )
+        for name, metric in rounds[0].items()
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> int:
+    """Print the comparison with the baseline; return number of regressions."""
+    regressions = 0
+    for name, metric in results.items():
+        base = baseline.get(name)
+        if base is None or not base["value"]:
+            print(f"{name:>28}: {metric['value']:>12} {metric['unit']} (new)")
+            continue
+        ratio = metric["value"] / base["value"]
+        worse = (
+            ratio < 1 - tolerance
+            if metric["better"] == "higher"
+            else ratio > 1 + tolerance
+        )
+        regressions += worse
+        print(
+            f"{name:>28}: {metric['value']:>12} {metric['unit']} "
+            f"(baseline {base['value']}, x{ratio:.2f}){' REGRESSION' if worse else ''}"
+        )
+    return regressions
+
+
+async def run(repeat: int, rounds: int) -> list[dict[str, Any]]:
+    """Run all benchmarks against a fresh simulator, once per round."""
+    simulator = EvopellSimulator(
+        SimulatorConfig(latency=0.0, jitter=0.0, trajectory=None, seed=0)
+    )
+    base_url = await simulator.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        # Resolver wspólnej sesji HTTP potrzebuje wczytanych interfejsów sieci
+        await async_get_adapters(hass)
+        hub = _new_hub(hass, base_url)
+        rounds_results: list[dict[str, Any]] = []
+        try:
+            for _ in range(rounds):
+                results = await bench_parse(hub, repeat)
+                results |= await bench_poll(hub, repeat)
+                results |= await bench_fanout(hass, hub, repeat)
+                results |= await bench_memory(hass, base_url)
+                rounds_results.append(results)
+        finally:
+            await hub.async_close()
+            await simulator.stop()
+            await hass.async_stop(force=True)
+    return rounds_results
+
+
+def main() -> int:
+    """Run the suite, compare with the baseline and optionally save it."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save", action="store_true", help="overwrite the baseline")
+    args = parser.parse_args()
+
+    results = best_of(asyncio.run(run(args.repeat, max(1, args.rounds))))
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    regressions = compare(results, baseline, args.tolerance)
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        print(f"baseline saved to {args.baseline}")
+        return 0
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
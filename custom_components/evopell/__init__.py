@@ -1,6 +1,7 @@
 """The Evopell http Integration."""
 
 import logging
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, CONF_SCAN_INTERVAL
@@ -8,14 +9,31 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .catalog import get_catalog
 from .const import (
+    CONF_ADAPTIVE_SCAN_INTERVAL,
+    CONF_DEDICATED_CONNECTION,
     CONF_EVOPELL_PASSWORD,
     CONF_EVOPELL_USER,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_STREAMING_PARSE,
+    CONF_VERIFY_WRITES,
+    DEFAULT_ADAPTIVE_SCAN_INTERVAL,
+    DEFAULT_DEDICATED_CONNECTION,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_STREAMING_PARSE,
+    DEFAULT_VERIFY_WRITES,
     DOMAIN,
-    EVOPELL_PARAM_MAP,
-    EVOPELL_PARAM_MAP1,
 )
+from .discovery import capability_store_key
 from .evopell import EvopellCoordinator, EvopellHub
+from .fleet import EvopellFleet
+from .store import (
+    ENTRY_STORE_KINDS,
+    DeviceInfoStore,
+    async_remove_stores,
+    entry_store_key,
+)
 
 PLATFORMS = ["binary_sensor", "button", "number", "select", "sensor"]
 
@@ -41,6 +59,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     password = entry.options.get(
         CONF_EVOPELL_PASSWORD, entry.data[CONF_EVOPELL_PASSWORD]
     )
+    max_concurrent_requests = entry.options.get(
+        CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+    )
+    streaming_parse = entry.options.get(CONF_STREAMING_PARSE, DEFAULT_STREAMING_PARSE)
+    verify_writes = entry.options.get(CONF_VERIFY_WRITES, DEFAULT_VERIFY_WRITES)
+    dedicated_connection = entry.options.get(
+        CONF_DEDICATED_CONNECTION, DEFAULT_DEDICATED_CONNECTION
+    )
+    adaptive_scan_interval = entry.options.get(
+        CONF_ADAPTIVE_SCAN_INTERVAL, DEFAULT_ADAPTIVE_SCAN_INTERVAL
+    )
 
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
@@ -53,22 +82,52 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         password=password,
         timeout_seconds=5,
         max_retries=3,
-        param_map=EVOPELL_PARAM_MAP,
+        max_concurrent_requests=max_concurrent_requests,
+        streaming_parse=streaming_parse,
+        dedicated_connection=dedicated_connection,
+        limiter=EvopellFleet.async_get(hass).limiter,
+    )
+    coordinator = EvopellCoordinator(
+        hass,
+        entry,
+        hub,
+        name,
+        scan_interval,
+        verify_writes=verify_writes,
+        adaptive_scan_interval=adaptive_scan_interval,
     )
-    coordinator = EvopellCoordinator(hass, entry, hub, name, scan_interval)
 
-    for tid, cfg in EVOPELL_PARAM_MAP1.items():
-        if (
-            cfg.get("type") == "sensor"
-            or cfg.get("type") == "number"
-            or cfg.get("type") == "binary_sensor"
-        ):
-            coordinator.hub.param_map[tid] = str(cfg.get("description", tid))
+    catalog = get_catalog()
+    for descriptor in catalog.polled:
+        coordinator.hub.param_map[descriptor.tid] = descriptor.name
+        coordinator.poll_tiers[descriptor.tid] = descriptor.poll_tier
+        hub.registers_data.declare(
+            descriptor.tid, descriptor.value_type, descriptor.divider
+        )
+    for descriptor in catalog.by_tid.values():
+        if descriptor.dependents:
+            coordinator.dependents[descriptor.tid] = descriptor.dependents
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][name] = {"evopell": coordinator}
 
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        if await coordinator.async_restore_snapshot():
+            # Encje startują z ostatnimi znanymi wartościami, odczyt idzie w tle
+            entry.async_create_background_task(
+                hass, coordinator.async_refresh(), f"{DOMAIN} first refresh {name}"
+            )
+        else:
+            await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Nieudany start nie może zostawić otwartej puli połączeń huba
+        await coordinator.async_shutdown()
+        await hub.async_close()
+        hass.data[DOMAIN].pop(name, None)
+        raise
+    entry.async_create_background_task(
+        hass, coordinator.discovery.async_run(), f"{DOMAIN} discovery {name}"
+    )
     # hass.data[DOMAIN][name] = {"evopell": coordinator}
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -80,12 +139,44 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 async def async_unload_entry(hass: HomeAssistant, entry):
     """Zdejmuje integrację i jej platformy, gdy użytkownik ją usuwa/wyłącza."""
     evopell: EvopellCoordinator = hass.data[DOMAIN][entry.data["name"]]["evopell"]
-    await evopell.hub.async_close()
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.data["name"])
+        # Hub zamykamy dopiero po zdjęciu encji, które mogą z niego korzystać
+        await evopell.hub.async_close()
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Usuwa dane zapisane dla usuniętego wpisu konfiguracji."""
+    keys = [entry_store_key(entry.entry_id, kind) for kind in ENTRY_STORE_KINDS]
+
+    # Mapa możliwości jest wspólna dla sterowników z tym samym firmware,
+    # usuwamy ją dopiero razem z ostatnim wpisem, który z niej korzysta
+    if (profile := await _async_capability_key(hass, entry.entry_id)) is not None:
+        shared = [
+            other
+            for other in hass.config_entries.async_entries(DOMAIN)
+            if other.entry_id != entry.entry_id
+            and await _async_capability_key(hass, other.entry_id) == profile
+        ]
+        if not shared:
+            keys.append(profile)
+
+    await async_remove_stores(hass, *keys)
+
+
+async def _async_capability_key(hass: HomeAssistant, entry_id: str) -> str | None:
+    """Return the capability map key of the device cached for an entry."""
+    identity = await DeviceInfoStore(
+        hass, entry_store_key(entry_id, "device")
+    ).async_load()
+    if identity is None:
+        return None
+    return capability_store_key(
+        identity.get("device_type"), identity.get("device_soft_version")
+    )
+
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant, entry, device_entry
 ) -> bool:
@@ -101,11 +192,38 @@ async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> Non
 class EvopellEntity(CoordinatorEntity[EvopellCoordinator]):
     """Main class for Evopell entities."""
 
-    def __init__(self, coordinator: EvopellCoordinator) -> None:
-        """Inicjalizacja encji powiązanej z koordynatorem."""
-        super().__init__(coordinator)
+    def __init__(
+        self, coordinator: EvopellCoordinator, register: str | None = None
+    ) -> None:
+        """Inicjalizacja encji powiązanej z koordynatorem.
+
+        Encje z podanym rejestrem są powiadamiane tylko o jego zmianach.
+        """
+        super().__init__(coordinator, context=register)
+        self._register = register
 
     @property
     def device_info(self) -> DeviceInfo | None:
         """Device info."""
         return self.coordinator.device_info
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Mark values restored from the snapshot until the register is read."""
+        attributes = super().extra_state_attributes
+        if (
+            self._register is not None
+            and self._register in self.coordinator.hub.stale_registers
+        ):
+            return {**(attributes or {}), "stale": True}
+        return attributes
+
+    async def async_update(self) -> None:
+        """Update the entity, reading its register even if it is not due."""
+        description = getattr(self, "entity_description", None)
+        if (
+            description is not None
+            and description.key in self.coordinator.hub.param_map
+        ):
+            self.coordinator.async_request_registers(description.key)
+        await super().async_update()
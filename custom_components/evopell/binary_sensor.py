@@ -7,12 +7,13 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME
+from homeassistant.const import CONF_NAME, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import EvopellCoordinator, EvopellEntity
-from .const import DOMAIN, EVOPELL_PARAM_MAP1
+from .catalog import get_catalog
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,24 +28,10 @@ async def async_setup_entry(
     name = config_entry.data[CONF_NAME]
     evopell = hass.data[DOMAIN][name]["evopell"]
 
-    entities = []
-    for tid, cfg in EVOPELL_PARAM_MAP1.items():
-        if cfg.get("type") != "binary_sensor":
-            continue
-
-        name = str(cfg.get("description", tid))
-        icon = str(cfg.get("icon"))
-        evopell.hub.param_map[tid] = name
-        entities.append(
-            EvopellBinarySensor(
-                evopell,
-                BinarySensorEntityDescription(
-                    key=tid,
-                    name=name,
-                    icon=icon,
-                ),
-            )
-        )
+    entities = [
+        EvopellBinarySensor(evopell, descriptor.entity_description)
+        for descriptor in get_catalog().by_platform[Platform.BINARY_SENSOR]
+    ]
     async_add_entities(entities)
 
 
@@ -57,7 +44,7 @@ class EvopellBinarySensor(EvopellEntity, BinarySensorEntity):
         description: BinarySensorEntityDescription,
     ) -> None:
         """Inicjalizuje encję sensora Evopell."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
         self.entity_description = description
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{self.coordinator.name}_{description.key}"
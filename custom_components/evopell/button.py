@@ -6,12 +6,13 @@ import logging
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME
+from homeassistant.const import CONF_NAME, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import EvopellCoordinator, EvopellEntity
-from .const import DOMAIN, EVOPELL_PARAM_MAP1
+from .catalog import get_catalog
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,16 +26,12 @@ async def async_setup_entry(
     name = config_entry.data[CONF_NAME]
     evopell = hass.data[DOMAIN][name]["evopell"]
 
-    entities = []
-    for tid, cfg in EVOPELL_PARAM_MAP1.items():
-        if cfg.get("type") != "sensor":
-            continue
-        if cfg.get("avg") is None:
-            continue
-
-        name = str(cfg.get("description", tid)).lower()
-        name = f"Reset {name}"
-        entities.append(EvopellAvgResetButton(evopell, tid, name))
+    entities = [
+        EvopellAvgResetButton(
+            evopell, descriptor.tid, f"Reset {descriptor.name.lower()}"
+        )
+        for descriptor in get_catalog().by_platform[Platform.BUTTON]
+    ]
 
     async_add_entities(entities)
 
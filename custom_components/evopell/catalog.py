@@ -0,0 +1,212 @@
+"""Compiled register catalog shared by all platforms and config entries."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import cache
+from types import MappingProxyType
+
+from homeassistant.components.binary_sensor import BinarySensorEntityDescription
+from homeassistant.components.number import NumberEntityDescription
+from homeassistant.components.select import SelectEntityDescription
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntityDescription
+from homeassistant.const import Platform
+from homeassistant.helpers.entity import EntityDescription
+
+from .const import (
+    EVOPELL_PARAM_MAP1,
+    EVOPELL_PARMAS_TO_TEXT_MAP,
+    POLL_TIER_FAST,
+    VALUE_TYPE_FLOAT,
+    VALUE_TYPE_RAW,
+    VALUE_TYPE_TIMESTAMP,
+)
+from .utils import (
+    parse_number_device_class,
+    parse_number_mode,
+    parse_sensor_device_class,
+    parse_sensor_state_class,
+    parse_sensor_unit,
+    to_float,
+)
+
+TYPE_SENSOR = "sensor"
+TYPE_NUMBER = "number"
+TYPE_USER_NUMBER = "user_number"
+TYPE_BINARY_SENSOR = "binary_sensor"
+TYPE_SCRIPT = "script"
+TYPE_TEXT_SELECT = "text_select"
+
+# Rodzaje rejestrów odczytywane z urządzenia przy każdym odświeżaniu
+POLLED_TYPES = frozenset((TYPE_SENSOR, TYPE_NUMBER, TYPE_BINARY_SENSOR))
+
+
+@dataclass(frozen=True, slots=True)
+class RegisterDescriptor:
+    """Immutable, pre-parsed description of one catalog entry."""
+
+    tid: str
+    type: str
+    name: str
+    entity_description: EntityDescription | None
+    poll_tier: str = POLL_TIER_FAST
+    dependents: tuple[str, ...] = ()
+    divider: int | None = None
+    value_type: str = VALUE_TYPE_RAW
+    avg_name: str | None = None
+    options: Mapping[str, Mapping[str, str]] | None = None
+    text_map: Mapping[str, str] | None = None
+    text_attributes: Mapping[str, str] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class RegisterCatalog:
+    """Register descriptors indexed by tid and by platform."""
+
+    by_tid: Mapping[str, RegisterDescriptor]
+    by_platform: Mapping[str, tuple[RegisterDescriptor, ...]]
+    polled: tuple[RegisterDescriptor, ...]
+
+
+@cache
+def get_catalog() -> RegisterCatalog:
+    """Compile EVOPELL_PARAM_MAP1 once per process."""
+    by_tid: dict[str, RegisterDescriptor] = {}
+    by_platform: dict[str, list[RegisterDescriptor]] = {
+        platform: []
+        for platform in (
+            Platform.BINARY_SENSOR,
+            Platform.BUTTON,
+            Platform.NUMBER,
+            Platform.SELECT,
+            Platform.SENSOR,
+        )
+    }
+
+    for tid, cfg in EVOPELL_PARAM_MAP1.items():
+        descriptor = _compile(tid, cfg)
+        by_tid[tid] = descriptor
+        if descriptor.type == TYPE_SENSOR:
+            by_platform[Platform.SENSOR].append(descriptor)
+            if descriptor.avg_name is not None:
+                by_platform[Platform.BUTTON].append(descriptor)
+        elif descriptor.type in (TYPE_NUMBER, TYPE_USER_NUMBER):
+            by_platform[Platform.NUMBER].append(descriptor)
+        elif descriptor.type == TYPE_BINARY_SENSOR:
+            by_platform[Platform.BINARY_SENSOR].append(descriptor)
+        elif descriptor.type == TYPE_SCRIPT and descriptor.options is not None:
+            by_platform[Platform.SELECT].append(descriptor)
+
+    for tid, text_map in EVOPELL_PARMAS_TO_TEXT_MAP.items():
+        name = by_tid[tid].name
+        by_platform[Platform.SELECT].append(
+            RegisterDescriptor(
+                tid=tid,
+                type=TYPE_TEXT_SELECT,
+                name=name,
+                entity_description=SelectEntityDescription(
+                    key=tid, name=name, options=list(text_map.values())
+                ),
+                text_map=MappingProxyType(dict(text_map)),
+            )
+        )
+
+    return RegisterCatalog(
+        by_tid=MappingProxyType(by_tid),
+        by_platform=MappingProxyType(
+            {platform: tuple(items) for platform, items in by_platform.items()}
+        ),
+        polled=tuple(d for d in by_tid.values() if d.type in POLLED_TYPES),
+    )
+
+
+def _compile(tid: str, cfg: Mapping[str, object]) -> RegisterDescriptor:
+    """Parse one EVOPELL_PARAM_MAP1 entry into a descriptor."""
+    register_type = str(cfg.get("type"))
+    name = str(cfg.get("description", tid))
+    entity_description: EntityDescription | None = None
+    divider: int | None = None
+    avg_name: str | None = None
+    options: Mapping[str, Mapping[str, str]] | None = None
+    text_attributes: Mapping[str, str] | None = None
+    value_type = VALUE_TYPE_RAW
+
+    if register_type == TYPE_SENSOR:
+        if (raw_divider := cfg.get("divider")) and int(str(raw_divider)) > 1:
+            divider = int(str(raw_divider))
+        if avg := cfg.get("avg"):
+            avg_name = str(avg)
+        try:
+            display_precision: int | None = int(str(cfg.get("display_precision")))
+        except ValueError:
+            display_precision = None
+        entity_description = SensorEntityDescription(
+            key=tid,
+            name=name,
+            device_class=parse_sensor_device_class(_str(cfg, "device_class")),
+            native_unit_of_measurement=parse_sensor_unit(
+                _str(cfg, "native_unit_of_measurement")
+            ),
+            state_class=parse_sensor_state_class(_str(cfg, "state_class")),
+            icon=_str(cfg, "icon"),
+            suggested_display_precision=display_precision,
+        )
+        if entity_description.device_class == SensorDeviceClass.TIMESTAMP:
+            value_type = VALUE_TYPE_TIMESTAMP
+        elif divider is not None:
+            value_type = VALUE_TYPE_FLOAT
+        if tid in EVOPELL_PARMAS_TO_TEXT_MAP:
+            text_attributes = MappingProxyType(
+                {v: k for k, v in EVOPELL_PARMAS_TO_TEXT_MAP[tid].items()}
+            )
+    elif register_type in (TYPE_NUMBER, TYPE_USER_NUMBER):
+        value_type = VALUE_TYPE_FLOAT
+        entity_description = NumberEntityDescription(
+            key=tid,
+            name=name,
+            device_class=parse_number_device_class(_str(cfg, "device_class")),
+            native_unit_of_measurement=parse_sensor_unit(
+                _str(cfg, "native_unit_of_measurement")
+            ),
+            icon=_str(cfg, "icon"),
+            mode=parse_number_mode(_str(cfg, "mode")),
+            native_step=to_float(str(cfg.get("step"))),
+        )
+    elif register_type == TYPE_BINARY_SENSOR:
+        entity_description = BinarySensorEntityDescription(
+            key=tid, name=name, icon=_str(cfg, "icon")
+        )
+    elif register_type == TYPE_SCRIPT:
+        raw_options = cfg.get("options")
+        if isinstance(raw_options, dict):
+            options = MappingProxyType(
+                {
+                    option: MappingProxyType(dict(values))
+                    for option, values in raw_options.items()
+                }
+            )
+            entity_description = SelectEntityDescription(
+                key=tid, name=name, options=list(options)
+            )
+
+    dependents = cfg.get("dependents")
+    return RegisterDescriptor(
+        tid=tid,
+        type=register_type,
+        name=name,
+        entity_description=entity_description,
+        poll_tier=str(cfg.get("poll", POLL_TIER_FAST)),
+        dependents=tuple(str(dependents).split(",")) if dependents else (),
+        divider=divider,
+        value_type=str(cfg.get("value_type", value_type)),
+        avg_name=avg_name,
+        options=options,
+        text_attributes=text_attributes,
+    )
+
+
+def _str(cfg: Mapping[str, object], key: str) -> str | None:
+    """Return a catalog attribute as str, or None when it is not set."""
+    value = cfg.get(key)
+    return str(value) if value else None
@@ -12,11 +12,21 @@ from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, CONF_SCAN_INTER
 from homeassistant.core import HomeAssistant, callback
 
 from .const import (
+    CONF_ADAPTIVE_SCAN_INTERVAL,
+    CONF_DEDICATED_CONNECTION,
     CONF_EVOPELL_PASSWORD,
     CONF_EVOPELL_USER,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_STREAMING_PARSE,
+    CONF_VERIFY_WRITES,
+    DEFAULT_ADAPTIVE_SCAN_INTERVAL,
+    DEFAULT_DEDICATED_CONNECTION,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
     DEFAULT_NAME,
     DEFAULT_PORT,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STREAMING_PARSE,
+    DEFAULT_VERIFY_WRITES,
     DOMAIN,
 )
 
@@ -36,6 +46,13 @@ OPTIONS_SCHEMA = vol.Schema(
         vol.Required(CONF_EVOPELL_USER): str,
         vol.Required(CONF_EVOPELL_PASSWORD): str,
         vol.Required(CONF_SCAN_INTERVAL): int,
+        vol.Required(CONF_MAX_CONCURRENT_REQUESTS): vol.All(
+            int, vol.Range(min=1, max=8)
+        ),
+        vol.Required(CONF_STREAMING_PARSE): bool,
+        vol.Required(CONF_VERIFY_WRITES): bool,
+        vol.Required(CONF_DEDICATED_CONNECTION): bool,
+        vol.Required(CONF_ADAPTIVE_SCAN_INTERVAL): bool,
     }
 )
 
@@ -123,6 +140,21 @@ class EvopellOptionsFlow(config_entries.OptionsFlow):
                 CONF_SCAN_INTERVAL,
                 self._entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
             ),
+            CONF_MAX_CONCURRENT_REQUESTS: self._entry.options.get(
+                CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+            ),
+            CONF_STREAMING_PARSE: self._entry.options.get(
+                CONF_STREAMING_PARSE, DEFAULT_STREAMING_PARSE
+            ),
+            CONF_VERIFY_WRITES: self._entry.options.get(
+                CONF_VERIFY_WRITES, DEFAULT_VERIFY_WRITES
+            ),
+            CONF_DEDICATED_CONNECTION: self._entry.options.get(
+                CONF_DEDICATED_CONNECTION, DEFAULT_DEDICATED_CONNECTION
+            ),
+            CONF_ADAPTIVE_SCAN_INTERVAL: self._entry.options.get(
+                CONF_ADAPTIVE_SCAN_INTERVAL, DEFAULT_ADAPTIVE_SCAN_INTERVAL
+            ),
         }
 
         schema = vol.Schema(
@@ -136,6 +168,24 @@ class EvopellOptionsFlow(config_entries.OptionsFlow):
                 vol.Required(
                     CONF_SCAN_INTERVAL, default=defaults[CONF_SCAN_INTERVAL]
                 ): int,
+                vol.Required(
+                    CONF_MAX_CONCURRENT_REQUESTS,
+                    default=defaults[CONF_MAX_CONCURRENT_REQUESTS],
+                ): vol.All(int, vol.Range(min=1, max=8)),
+                vol.Required(
+                    CONF_STREAMING_PARSE, default=defaults[CONF_STREAMING_PARSE]
+                ): bool,
+                vol.Required(
+                    CONF_VERIFY_WRITES, default=defaults[CONF_VERIFY_WRITES]
+                ): bool,
+                vol.Required(
+                    CONF_DEDICATED_CONNECTION,
+                    default=defaults[CONF_DEDICATED_CONNECTION],
+                ): bool,
+                vol.Required(
+                    CONF_ADAPTIVE_SCAN_INTERVAL,
+                    default=defaults[CONF_ADAPTIVE_SCAN_INTERVAL],
+                ): bool,
             }
         )
 
@@ -6,6 +6,58 @@ CONF_EVOPELL_PASSWORD = "evopell_password"
 DEFAULT_NAME = "evopell"
 DEFAULT_SCAN_INTERVAL = 30
 DEFAULT_PORT = 80
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+DEFAULT_MAX_CONCURRENT_REQUESTS = 1
+CONF_STREAMING_PARSE = "streaming_parse"
+DEFAULT_STREAMING_PARSE = False
+CONF_VERIFY_WRITES = "verify_writes"
+DEFAULT_VERIFY_WRITES = False
+CONF_DEDICATED_CONNECTION = "dedicated_connection"
+DEFAULT_DEDICATED_CONNECTION = False
+CONF_ADAPTIVE_SCAN_INTERVAL = "adaptive_scan_interval"
+DEFAULT_ADAPTIVE_SCAN_INTERVAL = False
+
+POLL_TIER_FAST = "fast"
+POLL_TIER_NORMAL = "normal"
+POLL_TIER_SLOW = "slow"
+POLL_TIER_ON_DEMAND = "on_demand"
+# Co ile cykli odświeżania odczytywany jest rejestr z danego poziomu;
+# rejestry "on_demand" czytane są tylko przy starcie i na żądanie encji
+POLL_TIER_CYCLES: dict[str, int] = {
+    POLL_TIER_FAST: 1,
+    POLL_TIER_NORMAL: 2,
+    POLL_TIER_SLOW: 10,
+}
+
+# Typ wartości rejestru, na który hub dekoduje odpowiedź urządzenia
+VALUE_TYPE_RAW = "raw"
+VALUE_TYPE_FLOAT = "float"
+VALUE_TYPE_TIMESTAMP = "timestamp"
+
+# Wspólny dla wszystkich wpisów menedżer sterowników (hass.data)
+DATA_FLEET = f"{DOMAIN}_fleet"
+# Ile żądań HTTP do wszystkich sterowników może być w toku jednocześnie
+FLEET_MAX_IN_FLIGHT = 8
+
+# Interwał odświeżania zależny od stanu kotła: mnożnik skonfigurowanego
+# scan_interval dla każdej wartości pl_status
+SCAN_INTERVAL_STATE_REGISTER = "pl_status"
+SCAN_INTERVAL_ALARM = "alarm"
+SCAN_INTERVAL_FACTORS: dict[str, float] = {
+    "0": 4.0,  # Stop
+    "1": 0.5,  # Rozpalanie
+    "2": 1.0,  # Praca
+    "3": 0.5,  # Wygaszanie
+    "4": 1.0,  # Czyszczenie
+    SCAN_INTERVAL_ALARM: 0.5,
+}
+# Rejestry i wartości oznaczające alarm; mają pierwszeństwo przed pl_status
+SCAN_INTERVAL_ALARM_REGISTERS: dict[str, str] = {
+    "tryb_auto_state": "2",  # Alarmowy
+}
+# Tyle kolejnych odczytów wolniejszego stanu przed wydłużeniem interwału
+SCAN_INTERVAL_SLOWDOWN_AFTER = 3
+MIN_SCAN_INTERVAL = 10
 
 EVOPELL_PARMAS_TO_TEXT_MAP: dict[str, dict[str, str]] = {
     "tryb_auto_state": {
@@ -39,6 +91,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "tkot_value": {
         "type": "sensor",
+        "poll": "fast",
         "description": "Temperatura kotła",
         "device_class": "SensorDeviceClass.TEMPERATURE",
         "native_unit_of_measurement": "UnitOfTemperature.CELSIUS",
@@ -46,6 +99,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "tsp_value": {
         "type": "sensor",
+        "poll": "fast",
         "description": "Temperatura spalin",
         "device_class": "SensorDeviceClass.TEMPERATURE",
         "native_unit_of_measurement": "UnitOfTemperature.CELSIUS",
@@ -62,6 +116,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "t1_value": {
         "type": "sensor",
+        "poll": "fast",
         "description": "Temperatura za zaworem 3D",
         "device_class": "SensorDeviceClass.TEMPERATURE",
         "native_unit_of_measurement": "UnitOfTemperature.CELSIUS",
@@ -69,6 +124,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "tpow_value": {
         "type": "sensor",
+        "poll": "fast",
         "description": "Temperatura powrotu",
         "device_class": "SensorDeviceClass.TEMPERATURE",
         "native_unit_of_measurement": "UnitOfTemperature.CELSIUS",
@@ -77,6 +133,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "temp_tank_lo": {
         "type": "sensor",
+        "poll": "normal",
         "description": "Temperatura bufora dół",
         "device_class": "SensorDeviceClass.TEMPERATURE",
         "native_unit_of_measurement": "UnitOfTemperature.CELSIUS",
@@ -84,6 +141,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "temp_tank_hi": {
         "type": "sensor",
+        "poll": "normal",
         "description": "Temperatura bufora góra",
         "device_class": "SensorDeviceClass.TEMPERATURE",
         "native_unit_of_measurement": "UnitOfTemperature.CELSIUS",
@@ -91,6 +149,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "pl_power_kw": {
         "type": "sensor",
+        "poll": "fast",
         "description": "Moc obliczona",
         "device_class": "SensorDeviceClass.POWER",
         "native_unit_of_measurement": "UnitOfPower.KILO_WATT",
@@ -100,6 +159,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "act_dm_speed": {
         "type": "sensor",
+        "poll": "fast",
         "description": "Moc dmuchawy",
         "native_unit_of_measurement": "PERCENTAGE",
         "state_class": "SensorStateClass.MEASUREMENT",
@@ -108,6 +168,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "ob1_zaw4d_pos": {
         "type": "sensor",
+        "poll": "fast",
         "description": "Procent otwarcia zaworu 3d",
         "native_unit_of_measurement": "PERCENTAGE",
         "state_class": "SensorStateClass.MEASUREMENT",
@@ -115,16 +176,19 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "zaw4d_dir": {
         "type": "sensor",
+        "poll": "normal",
         "description": "Kierunek otwarcia zaworu 3d",
         "icon": "mdi:swap-horizontal",
     },
     "tryb_auto_state": {
         "type": "sensor",
+        "poll": "normal",
         "description": "Tryb pracy",
         "icon": "mdi:information-outline",
     },
     "fuel_level": {
         "type": "sensor",
+        "poll": "normal",
         "description": "Poziom pelletu",
         "native_unit_of_measurement": "PERCENTAGE",
         "state_class": "SensorStateClass.MEASUREMENT",
@@ -132,6 +196,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "pl_fuel_flow": {
         "type": "sensor",
+        "poll": "normal",
         "description": "Przepływ pelletu",
         "native_unit_of_measurement": "OWN.kg/h",
         "state_class": "SensorStateClass.MEASUREMENT",
@@ -140,6 +205,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "dp_value": {
         "type": "sensor",
+        "poll": "fast",
         "description": "Ciśnienie w komorze spalania",
         "device_class": "SensorDeviceClass.PRESSURE",
         "native_unit_of_measurement": "UnitOfPressure.PA",
@@ -147,6 +213,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "mpl_temp": {
         "type": "sensor",
+        "poll": "normal",
         "description": "Temperatura podajnika",
         "device_class": "SensorDeviceClass.TEMPERATURE",
         "native_unit_of_measurement": "UnitOfTemperature.CELSIUS",
@@ -154,17 +221,20 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "pl_tfire": {
         "type": "sensor",
+        "poll": "slow",
         "description": "Ilość rozpaleń",
         "state_class": "SensorStateClass.TOTAL_INCREASING",
         "icon": "mdi:counter",
     },
     "pl_status": {
         "type": "sensor",
+        "poll": "fast",
         "description": "Status",
         "icon": "mdi:information-outline",
     },
     "dm_set_rpm": {
         "type": "sensor",
+        "poll": "fast",
         "description": "Ustawione obroty dmuchawy",
         "native_unit_of_measurement": "OWN.rpm",
         "state_class": "SensorStateClass.MEASUREMENT",
@@ -172,6 +242,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "mpl_dm_rpm": {
         "type": "sensor",
+        "poll": "fast",
         "description": "Aktualne obroty dmuchawy",
         "native_unit_of_measurement": "OWN.rpm",
         "state_class": "SensorStateClass.MEASUREMENT",
@@ -179,6 +250,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "pod_ton": {
         "type": "sensor",
+        "poll": "normal",
         "description": "Czas pracy podajnika",
         "native_unit_of_measurement": "OWN.s",
         "mode": "NumberMode.BOX",
@@ -188,6 +260,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "pod_toff": {
         "type": "sensor",
+        "poll": "normal",
         "description": "Czas przerwy podajnika",
         "native_unit_of_measurement": "OWN.s",
         "mode": "NumberMode.BOX",
@@ -197,6 +270,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "add_fuel": {
         "type": "sensor",
+        "poll": "slow",
         "description": "Waga pelletu dodanego podczas zasypu",
         "native_unit_of_measurement": "OWN.kg",
         "state_class": "SensorStateClass.MEASUREMENT",
@@ -204,6 +278,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "time_to_empty": {
         "type": "sensor",
+        "poll": "slow",
         "description": "Czas do opróżnienia zasobnika",
         "native_unit_of_measurement": "OWN.min",
         "mode": "NumberMode.BOX",
@@ -211,6 +286,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "mod2_imp_l": {
         "type": "sensor",
+        "poll": "on_demand",
         "description": "Wydajność przepływomierza",
         "native_unit_of_measurement": "OWN.imp/l",
         "state_class": "SensorStateClass.MEASUREMENT",
@@ -218,21 +294,25 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "out_pomp1": {
         "type": "binary_sensor",
+        "poll": "fast",
         "description": "Pompa CO",
         "icon": "mdi:pump",
     },
     "out_dm": {
         "type": "binary_sensor",
+        "poll": "fast",
         "description": "Dmuchawa",
         "icon": "mdi:fan",
     },
     "out_tank": {
         "type": "binary_sensor",
+        "poll": "fast",
         "description": "Pompa bufora",
         "icon": "mdi:pump",
     },
     "tank_tzad": {
         "type": "number",
+        "poll": "slow",
         "description": "Temperatura zadana w buforze",
         "device_class": "NumberDeviceClass.TEMPERATURE",
         "native_unit_of_measurement": "UnitOfTemperature.CELSIUS",
@@ -242,6 +322,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "tpow_min": {
         "type": "number",
+        "poll": "slow",
         "description": "Minimalna temperatura powrotu",
         "device_class": "NumberDeviceClass.TEMPERATURE",
         "native_unit_of_measurement": "UnitOfTemperature.CELSIUS",
@@ -251,6 +332,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "kot_tzad": {
         "type": "number",
+        "poll": "slow",
         "description": "Temperatura zadana w kotła",
         "device_class": "NumberDeviceClass.TEMPERATURE",
         "native_unit_of_measurement": "UnitOfTemperature.CELSIUS",
@@ -260,6 +342,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "ob1_zaw4d_tzad": {
         "type": "number",
+        "poll": "slow",
         "description": "Temperatura zadana za zaworem 3D",
         "device_class": "NumberDeviceClass.TEMPERATURE",
         "native_unit_of_measurement": "UnitOfTemperature.CELSIUS",
@@ -269,6 +352,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "ob1_zaw4d_max": {
         "type": "number",
+        "poll": "slow",
         "description": "Maksymalny kąt otwarcia zaworu 3D",
         "native_unit_of_measurement": "PERCENTAGE",
         "mode": "NumberMode.BOX",
@@ -277,6 +361,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "pl_calib_perf": {
         "type": "number",
+        "poll": "on_demand",
         "description": "Wydajność podajnika po kalibracji",
         "native_unit_of_measurement": "OWN.kg/6min",
         "mode": "NumberMode.BOX",
@@ -285,6 +370,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "pl_fuel_calor": {
         "type": "number",
+        "poll": "on_demand",
         "description": "Wartość opałowa pelletu",
         "native_unit_of_measurement": "OWN.MJ/kg",
         "mode": "NumberMode.BOX",
@@ -301,6 +387,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "pl_fuel_period": {
         "type": "number",
+        "poll": "slow",
         "description": "Okres pracy podajnika",
         "native_unit_of_measurement": "OWN.s",
         "mode": "NumberMode.BOX",
@@ -309,6 +396,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "pl_plimit": {
         "type": "number",
+        "poll": "slow",
         "description": "Ograniczona moc kotła",
         "native_unit_of_measurement": "PERCENTAGE",
         "mode": "NumberMode.BOX",
@@ -318,30 +406,36 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "pl_fuel_max": {
         "type": "number",
+        "poll": "slow",
         "description": "Moc maksymalna",
         "native_unit_of_measurement": "UnitOfPower.KILO_WATT",
         "mode": "NumberMode.BOX",
         "display_precision": "0",
         "icon": "mdi:fire",
         "step": "1",
+        "dependents": "pl_fuel_min",
     },
     "pl_fuel_min": {
         "type": "number",
+        "poll": "slow",
         "description": "Moc minimalna",
         "native_unit_of_measurement": "UnitOfPower.KILO_WATT",
         "mode": "NumberMode.BOX",
         "display_precision": "0",
         "icon": "mdi:fire",
         "step": "1",
+        "dependents": "pl_fuel_max",
     },
     "next_fuel_time": {
         "type": "sensor",
+        "poll": "slow",
         "description": "Data następnego zasypu",
         "device_class": "SensorDeviceClass.TIMESTAMP",
         "icon": "mdi:clock-outline",
     },
     "pl_clean_toff": {
         "type": "number",
+        "poll": "slow",
         "description": "Czas pomiędzy czyszczeniem",
         "native_unit_of_measurement": "OWN.min",
         "mode": "NumberMode.BOX",
@@ -350,6 +444,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "pl_wyg_cnt": {
         "type": "number",
+        "poll": "slow",
         "description": "Ilość cykli czyszczenia",
         "mode": "NumberMode.BOX",
         "icon": "mdi:recycle-variant",
@@ -357,6 +452,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "pl_wyg_tclean": {
         "type": "number",
+        "poll": "slow",
         "description": "Czas ruchu rusztu",
         "native_unit_of_measurement": "OWN.s",
         "mode": "NumberMode.BOX",
@@ -365,6 +461,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "tank_hi_cal": {
         "type": "number",
+        "poll": "on_demand",
         "description": "Poprawka temperatury bufora góra",
         "native_unit_of_measurement": "UnitOfTemperature.CELSIUS",
         "mode": "NumberMode.BOX",
@@ -373,6 +470,7 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "tank_lo_cal": {
         "type": "number",
+        "poll": "on_demand",
         "description": "Poprawka temperatury bufora dół",
         "native_unit_of_measurement": "UnitOfTemperature.CELSIUS",
         "mode": "NumberMode.BOX",
@@ -381,547 +479,38 @@ EVOPELL_PARAM_MAP1: dict[str, dict[str, str | dict[str, dict[str, str]]]] = {
     },
     "pl_dm_max": {
         "type": "number",
+        "poll": "slow",
         "description": "Dmuchawa dla mocy maksymalnej",
         "native_unit_of_measurement": "PERCENTAGE",
         "mode": "NumberMode.BOX",
         "display_precision": "0",
         "icon": "mdi:wind-power",
         "step": "1",
+        "dependents": "pl_dm_min",
     },
     "pl_dm_min": {
         "type": "number",
+        "poll": "slow",
         "description": "Dmuchawa dla mocy mainimalnej",
         "native_unit_of_measurement": "PERCENTAGE",
         "mode": "NumberMode.BOX",
         "display_precision": "0",
         "icon": "mdi:wind-power",
         "step": "1",
+        "dependents": "pl_dm_max",
     },
 }
 
-EVOPELL_PARAM_MAP = {
-    "device_id": "",
-    "device_name": "",
-    "device_type": "",
-    "device_soft_version": "",
-    "device_hard_version": "",
-    "auth_user": "",
-    "accesslevel": "",
-    "datetime": "",
-    "daytime": "",
-    "date": "",
-    "time": "",
-    "localtimezone": "",
-    "eth_mac": "",
-    "eth_ip": "",
-    "eth_mask": "",
-    "eth_gate": "",
-    "eth_dhcp": "",
-    "eth_ip_ro": "",
-    "eth_mask_ro": "",
-    "eth_gate_ro": "",
-    "eth_iface": "",
-    "remote_server_status": "",
-    "rf_module": "",
-    "rf_update": "",
-    "rf_offset": "",
-    "log": "",
-    "power_state": "",
-    "tkot_cal": "",
-    "tpow_cal": "",
-    "tpod_value": "",
-    "tpod_cal": "",
-    "tcwu_value": "",
-    "tcwu_cal": "",
-    "twew_value": "",
-    "twew_cal": "",
-    "tzew_value": "",
-    "tzew_cal": "",
-    "t1_cal": "",
-    "t2_value": "",
-    "t2_cal": "",
-    "tsp_cal": "",
-    "tzew_act": "",
-    "di_zawl": "",
-    "di_zas": "",
-    "di_alarm": "",
-    "di_termik": "",
-    "di_stb": "",
-    "di_rs_reset": "",
-    "di_rs_out": "",
-    "di_pod_state": "",
-    "di_term1": "",
-    "di_term2": "",
-    "out_pomp1": "",
-    "out_pomp2": "",
-    "out_cwu": "",
-    "out_miesz": "",
-    "out_pod": "",
-    "out_dm": "",
-    "out_zaw4d": "",
-    "out_aux": "",
-    "alarm_ipconflict": "",
-    "alarm_sdcard": "",
-    "alarm_tkot": "",
-    "alarm_tpow": "",
-    "alarm_tpod": "",
-    "alarm_tcwu": "",
-    "alarm_twew": "",
-    "alarm_tzew": "",
-    "alarm_t1": "",
-    "alarm_t2": "",
-    "alarm_tsp": "",
-    "alarm_termik": "",
-    "alarm_tkot_90": "",
-    "alarm_tpod_hi": "",
-    "alarm_pod_zaplon": "",
-    "alarm_zew": "",
-    "alarm_zasobnik": "",
-    "alarm_stb": "",
-    "alarm_out_pod": "",
-    "alarm_otw_zasob": "",
-    "alarm_tco1_hi": "",
-    "kot_tact": "",
-    "kot_prog": "",
-    "kot_tzad": "",
-    "kot_tobn": "",
-    "pog_en": "",
-    "pog_krzyw1": "",
-    "pog_krzyw2": "",
-    "kot_status": "",
-    "kot_st_tobn": "",
-    "ob1_typ": "",
-    "ob1_prog": "",
-    "ob1_tzad": "",
-    "ob1_tobn": "",
-    "ob1_tmax": "",
-    "ob1_pomp_on": "",
-    "ob1_pomp_off": "",
-    "ob1_pok_lo": "",
-    "ob1_pok_norm": "",
-    "ob1_pok_hi": "",
-    "ob1_pok_hist": "",
-    "ob1_pok_pre": "",
-    "ob1_pok_tact": "",
-    "ob1_pok_tzad": "",
-    "ob1_zaw4d_prog": "",
-    "ob1_zaw4d_tzad": "",
-    "ob1_pog_en": "",
-    "ob1_pog_krzyw1": "",
-    "ob1_pog_krzyw2": "",
-    "ob1_pump_pok": "",
-    "ob1_zaw4d_pos": "",
-    "ob1_pok_typ": "",
-    "ob1_zaw4d_max": "",
-    "ob2_typ": "",
-    "ob2_prog": "",
-    "ob2_tzad": "",
-    "ob2_tobn": "",
-    "ob2_tmax": "",
-    "ob2_pomp_on": "",
-    "ob2_pomp_off": "",
-    "ob2_pok_lo": "",
-    "ob2_pok_norm": "",
-    "ob2_pok_hi": "",
-    "ob2_pok_hist": "",
-    "ob2_pok_pre": "",
-    "ob2_pok_tact": "",
-    "ob2_pok_tzad": "",
-    "ob2_pok_typ": "",
-    "zima_lato": "",
-    "zima_lato_state": "",
-    "autolato_prog": "",
-    "autolato_tzew": "",
-    "tryb_auto_state": "Tryb pracy",
-    "autolato_hist": "",
-    "cwu_prog": "",
-    "cwu_tact": "",
-    "cwu_tzad": "",
-    "cwu_tobn": "",
-    "cwu_hist1": "",
-    "cwu_hist2": "",
-    "cwu_podb_kot": "",
-    "cwu_out_state": "",
-    "cwu_state": "",
-    "cwu_st_tobn": "",
-    "cyrk_prog": "",
-    "cyrk_pomp_on": "",
-    "cyrk_pomp_off": "",
-    "cyrk_pomp_ton": "",
-    "tpow_min": "",
-    "pomp_ton": "",
-    "tzew_sensor": "",
-    "ochr_pow": "",
-    "pomp_ext_func": "",
-    "pod_tmax": "",
-    "pod_typ": "",
-    "di_alarm_time": "",
-    "di_alarm_inv": "",
-    "di_alarm_stop": "",
-    "di_zas_en": "",
-    "di_zas_delay": "",
-    "install_type": "",
-    "zaw4d_open_time": "",
-    "zaw4d_hist": "",
-    "zaw4d_p": "",
-    "zaw4d_i": "",
-    "zaw4d_dir": "",
-    "fuel_level": "Poziom pelletu",
-    "fuel_level_enum": "",
-    "pod_run_time": "",
-    "pod_run_time_str": "",
-    "pod_run_time_last": "",
-    "pod_run_time_hour": "",
-    "next_fuel_time": "Data następnego zasypu",
-    "add_fuel": "Waga pelletu dodanego podczas zasypu",
-    "add_fuel_time": "",
-    "time_to_empty": "Czas oprożnienia zasobnika",
-    "stats_pwr": "",
-    "act_dm_speed": "",
-    "kot_hist": "",
-    "kot_hist2": "",
-    "pl_status": "",
-    "pl_fuel_flow": "",
-    "pl_flame": "",
-    "pl_flame_b": "",
-    "pl_tfire": "Ilość rozpaleń",
-    "pl_hfire": "",
-    "pl_power": "",
-    "pl_clean": "",
-    "pl_clean_toff": "Czas pomiędzy czyszczeniem",
-    "pl_roz_dm": "",
-    "pl_roz_fire": "",
-    "pl_roz_fuel": "",
-    "pl_roz_stab": "",
-    "pl_wyg_dm": "",
-    "pl_wyg_tmin": "",
-    "pl_wyg_tmax": "",
-    "pl_wyg_fire": "",
-    "pl_wyg_tclean": "Czas ruchu rusztu",
-    "pl_fuel_period": "Okres pracy podajnika",
-    "pl_calib_en": "",
-    "pl_calib_perf": "",
-    "pl_calib_time": "",
-    "pl_fuel_calor": "",
-    "pl_kot_pmax": "",
-    "pl_fuel_max": "Moc maksymalna",
-    "pl_fuel_min": "Moc minimalna",
-    "pl_dm_max": "Dmuchawa dla mocy maksymalnej",
-    "pl_dm_min": "Dmuchawa dla mocy mainimalnej",
-    "mpl_feed": "",
-    "mpl_heat": "",
-    "mpl_clean": "",
-    "mpl_temp": "",
-    "mpl_opto": "",
-    "mpl_dm_rpm": "Aktualne obroty dmuchawy",
-    "mpl_hall_en": "",
-    "mpl_dm_max": "",
-    "mpl_alarm": "",
-    "alarm_rozp": "",
-    "tr_gr_tsp": "",
-    "upd_fr_name": "",
-    "panel_cd1": "",
-    "en_scr": "",
-    "en_ext_out": "",
-    "upd_pgs": "",
-    "trv_calib_day": "",
-    "trv_calib_hour": "",
-    "trv_mode": "",
-    "wnd_time": "",
-    "wnd_hist": "",
-    "wnd_cfg": "",
-    "kot_tmin": "",
-    "pl_power_kw": "",
-    "exh_fan_speed": "",
-    "ob1_pl_wyg": "",
-    "ob2_pl_wyg": "",
-    "pid_k": "",
-    "pid_ti": "",
-    "pid_td": "",
-    "pid_factor": "",
-    "fuel_fill": "",
-    "pl_plimit": "Ograniczona moc kotła",
-    "burner": "",
-    "prot_serv": "",
-    "en_serv": "",
-    "pod_man_runtime": "",
-    "limit_power": "",
-    "mod1": "",
-    "mod2": "",
-    "mod2_imp_l": "Wydajność przepływomierza",
-    "mod2_flow": "",
-    "mod2_power": "",
-    "mod2_energy": "",
-    "exh_fan_mode": "",
-    "wh_global": "",
-    "wh_yr": "",
-    "wh_mon": "",
-    "ob3_typ": "",
-    "ob3_prog": "",
-    "ob3_tzad": "",
-    "ob3_tobn": "",
-    "ob3_tmax": "",
-    "ob3_pomp_on": "",
-    "ob3_pomp_off": "",
-    "ob3_pok_lo": "",
-    "ob3_pok_norm": "",
-    "ob3_pok_hi": "",
-    "ob3_pok_hist": "",
-    "ob3_pok_pre": "",
-    "ob3_pok_tact": "",
-    "ob3_pok_tzad": "",
-    "ob3_pok_typ": "",
-    "ob3_zaw4d_prog": "",
-    "ob3_zaw4d_tzad": "",
-    "ob3_pog_en": "",
-    "ob3_pog_krzyw1": "",
-    "ob3_pog_krzyw2": "",
-    "ob3_pump_pok": "",
-    "ob3_zaw4d_pos": "",
-    "ob3_zaw4d_max": "",
-    "ob3_out_pump": "",
-    "ob3_out_zaw4d": "",
-    "ob3_t1_alarm": "",
-    "ob3_t2_alarm": "",
-    "ob3_t1": "",
-    "ob3_t2": "",
-    "ob3_t1_cal": "",
-    "ob3_t2_cal": "",
-    "ob3_hitemp_alarm": "",
-    "ob3_mr3_alarm": "",
-    "ob3_di_term": "",
-    "ob3_zaw4d_open_time": "",
-    "ob3_zaw4d_hist": "",
-    "ob3_zaw4d_p": "",
-    "ob3_zaw4d_i": "",
-    "ob3_zaw4d_dir": "",
-    "ob3_pl_wyg": "",
-    "ob4_typ": "",
-    "ob4_prog": "",
-    "ob4_tzad": "",
-    "ob4_tobn": "",
-    "ob4_tmax": "",
-    "ob4_pomp_on": "",
-    "ob4_pomp_off": "",
-    "ob4_pok_lo": "",
-    "ob4_pok_norm": "",
-    "ob4_pok_hi": "",
-    "ob4_pok_hist": "",
-    "ob4_pok_pre": "",
-    "ob4_pok_tact": "",
-    "ob4_pok_tzad": "",
-    "ob4_pok_typ": "",
-    "ob4_zaw4d_prog": "",
-    "ob4_zaw4d_tzad": "",
-    "ob4_pog_en": "",
-    "ob4_pog_krzyw1": "",
-    "ob4_pog_krzyw2": "",
-    "ob4_pump_pok": "",
-    "ob4_zaw4d_pos": "",
-    "ob4_zaw4d_max": "",
-    "ob4_out_pump": "",
-    "ob4_out_zaw4d": "",
-    "ob4_t1_alarm": "",
-    "ob4_t2_alarm": "",
-    "ob4_t1": "",
-    "ob4_t2": "",
-    "ob4_t1_cal": "",
-    "ob4_t2_cal": "",
-    "ob4_hitemp_alarm": "",
-    "ob4_mr3_alarm": "",
-    "ob4_di_term": "",
-    "ob4_zaw4d_open_time": "",
-    "ob4_zaw4d_hist": "",
-    "ob4_zaw4d_p": "",
-    "ob4_zaw4d_i": "",
-    "ob4_zaw4d_dir": "",
-    "ob4_pl_wyg": "",
-    "ob5_typ": "",
-    "ob5_prog": "",
-    "ob5_tzad": "",
-    "ob5_tobn": "",
-    "ob5_tmax": "",
-    "ob5_pomp_on": "",
-    "ob5_pomp_off": "",
-    "ob5_pok_lo": "",
-    "ob5_pok_norm": "",
-    "ob5_pok_hi": "",
-    "ob5_pok_hist": "",
-    "ob5_pok_pre": "",
-    "ob5_pok_tact": "",
-    "ob5_pok_tzad": "",
-    "ob5_pok_typ": "",
-    "ob5_zaw4d_prog": "",
-    "ob5_zaw4d_tzad": "",
-    "ob5_pog_en": "",
-    "ob5_pog_krzyw1": "",
-    "ob5_pog_krzyw2": "",
-    "ob5_pump_pok": "",
-    "ob5_zaw4d_pos": "",
-    "ob5_zaw4d_max": "",
-    "ob5_out_pump": "",
-    "ob5_out_zaw4d": "",
-    "ob5_t1_alarm": "",
-    "ob5_t2_alarm": "",
-    "ob5_t1": "",
-    "ob5_t2": "",
-    "ob5_t1_cal": "",
-    "ob5_t2_cal": "",
-    "ob5_hitemp_alarm": "",
-    "ob5_mr3_alarm": "",
-    "ob5_di_term": "",
-    "ob5_zaw4d_open_time": "",
-    "ob5_zaw4d_hist": "",
-    "ob5_zaw4d_p": "",
-    "ob5_zaw4d_i": "",
-    "ob5_zaw4d_dir": "",
-    "ob5_pl_wyg": "",
-    "ob6_typ": "",
-    "ob6_prog": "",
-    "ob6_tzad": "",
-    "ob6_tobn": "",
-    "ob6_tmax": "",
-    "ob6_pomp_on": "",
-    "ob6_pomp_off": "",
-    "ob6_pok_lo": "",
-    "ob6_pok_norm": "",
-    "ob6_pok_hi": "",
-    "ob6_pok_hist": "",
-    "ob6_pok_pre": "",
-    "ob6_pok_tact": "",
-    "ob6_pok_tzad": "",
-    "ob6_pok_typ": "",
-    "ob6_zaw4d_prog": "",
-    "ob6_zaw4d_tzad": "",
-    "ob6_pog_en": "",
-    "ob6_pog_krzyw1": "",
-    "ob6_pog_krzyw2": "",
-    "ob6_pump_pok": "",
-    "ob6_zaw4d_pos": "",
-    "ob6_zaw4d_max": "",
-    "ob6_out_pump": "",
-    "ob6_out_zaw4d": "",
-    "ob6_t1_alarm": "",
-    "ob6_t2_alarm": "",
-    "ob6_t1": "",
-    "ob6_t2": "",
-    "ob6_t1_cal": "",
-    "ob6_t2_cal": "",
-    "ob6_hitemp_alarm": "",
-    "ob6_mr3_alarm": "",
-    "ob6_di_term": "",
-    "ob6_zaw4d_open_time": "",
-    "ob6_zaw4d_hist": "",
-    "ob6_zaw4d_p": "",
-    "ob6_zaw4d_i": "",
-    "ob6_zaw4d_dir": "",
-    "ob6_pl_wyg": "",
-    "prod_date": "",
-    "rf_status": "",
-    "node_add": "",
-    "node_del": "",
-    "node_st": "",
-    "node_time": "",
-    "ob1_pok_heat": "",
-    "ob2_pok_heat": "",
-    "ob3_pok_heat": "",
-    "ob4_pok_heat": "",
-    "ob5_pok_heat": "",
-    "ob6_pok_heat": "",
-    "pl_roz_tmax": "",
-    "pl_roz_dm2": "",
-    "pl_roz_theat": "",
-    "pl_min_time": "",
-    "pl_tptotal": "",
-    "mpl_di_hall2": "",
-    "dp_value": "",
-    "dp_alarm": "",
-    "pl_roz_tsp": "",
-    "pl_wyg_tsp": "",
-    "alarm_poz_ruszt": "",
-    "dm_set_rpm": "Ustaw obrotów dmuchawy",
-    "pod_ton": "Czas pracy podajnika",
-    "pod_toff": "Czas przerwy podajnika",
-    "pl_stab_fuel": "",
-    "pl_stab_dm": "",
-    "rp_min_cis": "",
-    "rp_min_obr": "",
-    "rp_min_hist": "",
-    "rp_max_cis": "",
-    "rp_max_obr": "",
-    "rp_max_hist": "",
-    "rp_kor_obr": "",
-    "rp_delay": "",
-    "rp_active": "",
-    "od_cis": "",
-    "od_delay": "",
-    "alarm_cis": "",
-    "typ_kotla": "",
-    "proc_state": "",
-    "proc_time": "",
-    "przedm_en": "",
-    "przedm_toff": "",
-    "przedm_ton": "",
-    "przedm_dm": "",
-    "pl_status_ext": "",
-    "clean_hsleep": "",
-    "clean_tsleep": "",
-    "proc_stop": "",
-    "dop_dm_up": "",
-    "dop_wait": "",
-    "clean_burn_time": "",
-    "clean_act_kg": "",
-    "clean_exch_kg": "",
-    "alarm_clean_exch": "",
-    "od_pmin": "",
-    "pl_wyg_state": "",
-    "lcd_hdr": "",
-    "dp_en": "",
-    "pl_wyg_cnt": "",
-    "out_clean_wym": "",
-    "clwym_en": "",
-    "alarm_clwym": "",
-    "clwym_toff": "",
-    "clwym_ton": "",
-    "clwym_err": "",
-    "clwym_time": "",
-    "pl_cykl_pmax": "",
-    "pl_ruszt_en": "",
-    "tank_en": "",
-    "fun_cwu": "",
-    "temp_tank_hi": "",
-    "tank_hi_cal": "Poprawka temperatury bufora góra",
-    "temp_tank_lo": "",
-    "tank_lo_cal": "Poprawka temperatury bufora dół",
-    "alarm_tank_hi": "",
-    "alarm_tank_lo": "",
-    "alarm_tank_hitemp": "",
-    "out_tank": "",
-    "tank_tzad": "",
-    "tank_hist": "",
-    "pomp_co_ton": "",
-    "dm_man": "",
-    "hist_pump": "",
-    "hist_miesz": "",
-    "hist_pump_co": "",
-    "wsp_moc": "",
-    "clsln_en": "",
-    "clsln_ton": "",
-    "clsln_toff": "",
-    "clsln_dm": "",
-    "fire_time": "",
-    "alarm_rozp_ext": "",
-    "silent": "",
-    "ob1_term_delay": "",
-    "ob1_term_state": "",
-    "ob2_term_delay": "",
-    "ob2_term_state": "",
-    "ob3_term_delay": "",
-    "ob3_term_state": "",
-    "ob4_term_delay": "",
-    "ob4_term_state": "",
-    "ob5_term_delay": "",
-    "ob5_term_state": "",
-    "ob6_term_delay": "",
-    "ob6_term_state": "",
-}
+
+def __getattr__(name: str):
+    """Load the full register list only when it is first needed.
+
+    Pełna lista rejestrów (524 pozycje) nie jest potrzebna do zwykłego
+    odpytywania encji, więc nie jest budowana przy imporcie const.
+    """
+    if name == "EVOPELL_PARAM_MAP":
+        from .register_map import EVOPELL_PARAM_MAP
+
+        globals()[name] = EVOPELL_PARAM_MAP
+        return EVOPELL_PARAM_MAP
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
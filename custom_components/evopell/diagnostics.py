@@ -0,0 +1,139 @@
+"""Diagnostics support for Evopell."""
+
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+import statistics
+import sys
+import time
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_NAME
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_EVOPELL_PASSWORD, CONF_EVOPELL_USER, DOMAIN
+from .evopell import EvopellCoordinator
+from .fleet import EvopellFleet
+
+TO_REDACT = {
+    CONF_HOST,
+    CONF_EVOPELL_USER,
+    CONF_EVOPELL_PASSWORD,
+    "eth_mac",
+    "eth_ip",
+    "device_id",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: EvopellCoordinator = hass.data[DOMAIN][entry.data[CONF_NAME]][
+        "evopell"
+    ]
+    hub = coordinator.hub
+    fleet = EvopellFleet.async_get(hass)
+    table = hub.registers_data
+    now = time.monotonic()
+
+    tids = list(hub.param_map)
+    chunk_size = hub.tuner.chunk_size
+    ages = [
+        now - updated_at
+        for tid in table
+        if (updated_at := table[tid].updated_at) is not None
+    ]
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": async_redact_data(entry.options, TO_REDACT),
+        },
+        "device": async_redact_data(hub.identity or {}, TO_REDACT),
+        "scheduler": {
+            "update_interval": coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None,
+            "poll_phase": round(coordinator.poll_phase, 3),
+            "boiler_state": coordinator.scan_interval.state
+            if coordinator.scan_interval
+            else None,
+            "poll_cycle": coordinator.poll_cycle,
+            "last_update_success": coordinator.last_update_success,
+        },
+        "request_plan": {
+            "registers": len(tids),
+            "tiers": dict(Counter(coordinator.poll_tiers.get(tid) for tid in tids)),
+            "requested": sorted(coordinator.requested_registers),
+            "unsupported": sorted(coordinator.discovery.unsupported),
+            "quarantined": hub.quarantined_registers,
+            "chunk_size": chunk_size,
+            "concurrency": hub.tuner.concurrency,
+            "chunks": [
+                tids[i : i + chunk_size] for i in range(0, len(tids), chunk_size)
+            ],
+        },
+        "registers": {
+            "stored": len(table),
+            "stale": len(hub.stale_registers),
+            "age_seconds": {
+                "min": round(min(ages), 1),
+                "median": round(statistics.median(ages), 1),
+                "max": round(max(ages), 1),
+            }
+            if ages
+            else None,
+        },
+        "requests": {
+            "circuit": hub.circuit_breaker.state,
+            "latency_ms": {
+                endpoint: [round(sample * 1000, 1) for sample in window.samples]
+                for endpoint, window in hub.metrics.latency.items()
+            },
+            "retries": hub.metrics.retries,
+            "timeouts": hub.metrics.timeouts,
+            "bytes_last_cycle": hub.metrics.bytes_last_cycle,
+            "cycle_overruns": hub.metrics.cycle_overruns,
+            "errors": [
+                {"age_seconds": round(time.time() - at, 1), "endpoint": e, "error": m}
+                for at, e, m in hub.metrics.errors
+            ],
+        },
+        "fleet": {
+            "max_in_flight": fleet.limiter.limit,
+            "in_flight": fleet.limiter.in_flight,
+            "waiting": fleet.limiter.waiting,
+        },
+        "memory_bytes": {
+            "register_store": _sizeof(table),
+            "average_stores": sum(
+                _sizeof(sensor.average_state) for sensor in coordinator.avg.values()
+            ),
+        },
+    }
+
+
+def _sizeof(obj: Any, seen: set[int] | None = None) -> int:
+    """Estimate the memory retained by an object and everything it references."""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, array)) or obj is None:
+        return size
+    if isinstance(obj, dict):
+        return size + sum(_sizeof(k, seen) + _sizeof(v, seen) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(_sizeof(item, seen) for item in obj)
+    if hasattr(obj, "__dict__"):
+        size += _sizeof(vars(obj), seen)
+    for slot in getattr(type(obj), "__slots__", ()):
+        if hasattr(obj, slot):
+            size += _sizeof(getattr(obj, slot), seen)
+    return size
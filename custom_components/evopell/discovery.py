@@ -0,0 +1,153 @@
+"""Background discovery of registers supported by an Evopell device."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from aiohttp import ClientError, ClientResponseError
+from defusedxml import DefusedXmlException
+from defusedxml.ElementTree import ParseError
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+from .retry import CircuitOpenError
+from .store import CapabilityStore
+
+if TYPE_CHECKING:
+    from .evopell import EvopellHub
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def capability_store_key(model: str | None, sw_version: str | None) -> str:
+    """Return the storage key of the capability map of a device profile."""
+    return f"{DOMAIN}_capabilities_{slugify(f'{model}_{sw_version}')}"
+
+
+class RegisterDiscovery:
+    """Records which of the polled registers the device supports.
+
+    Mapa jest zapisywana per typ urządzenia i wersję oprogramowania, więc po
+    restarcie (i dla innych sterowników z tym samym firmware) skan nie jest
+    powtarzany, a koordynator od razu nie pyta o rejestry nieobsługiwane.
+    Skan idzie partiami wielkości tunera z przerwami, żeby nie przeszkadzać
+    zwykłemu odpytywaniu.
+
+    Za nieobsługiwany uznajemy tylko rejestr pominięty w poprawnej odpowiedzi.
+    Rejestr zwrócony ze statusem błędu zostaje niesklasyfikowany; chwilowe
+    błędy obsługuje kwarantanna huba, która ponawia odczyt z rosnącą przerwą.
+    """
+
+    # Opóźnienie [s] startu skanu po uruchomieniu integracji
+    START_DELAY = 60.0
+    # Przerwa [s] między kolejnymi partiami rejestrów
+    BATCH_DELAY = 10.0
+    # Przerwa [s] po nieudanej partii, zanim spróbujemy ponownie
+    ERROR_DELAY = 300.0
+    # Po tylu nieudanych próbach partia jest pomijana do następnego skanu
+    MAX_BATCH_ATTEMPTS = 3
+
+    def __init__(self, hass: HomeAssistant, hub: EvopellHub) -> None:
+        """Initialize RegisterDiscovery."""
+        self._hass = hass
+        self._hub = hub
+        self.store: CapabilityStore | None = None
+
+    @property
+    def unsupported(self) -> set[str]:
+        """Return registers the device is known not to support."""
+        if self.store is None:
+            return set()
+        return self.store.state.unsupported
+
+    async def async_load(self) -> None:
+        """Load the capability map for the device profile read by the hub."""
+        info = self._hub.device_info
+        if not info:
+            return
+        self.store = CapabilityStore(
+            self._hass, capability_store_key(info.get("model"), info.get("sw_version"))
+        )
+        await self.store.async_load()
+
+    async def async_run(self) -> None:
+        """Probe every polled register not classified yet, in small batches."""
+        if self.store is None:
+            return
+        state = self.store.state
+        pending = [
+            tid
+            for tid in self._hub.param_map
+            if tid not in state.supported and tid not in state.unsupported
+        ]
+        if not pending:
+            return
+        await asyncio.sleep(self.START_DELAY)
+        _LOGGER.debug(
+            "Discovering %d registers on %s", len(pending), self._hub.base_url
+        )
+
+        # Górna granica partii po odrzuceniu zbyt długiego zapytania
+        limit: int | None = None
+        attempts = 0
+        skipped = 0
+        while pending:
+            size = self._hub.tuner.chunk_size
+            batch = pending[: size if limit is None else min(size, limit)]
+            try:
+                result = await self._hub.async_probe_registers(0, *batch)
+            except ClientResponseError as err:
+                if err.status in self._hub.URL_TOO_LONG_STATUSES and len(batch) > 1:
+                    limit = max(1, len(batch) // 2)
+                    _LOGGER.debug("HTTP %s, shrinking batch to %d", err.status, limit)
+                    continue
+                if err.status in (401, 403):
+                    _LOGGER.debug("Register discovery stopped: %s", err)
+                    return
+                if err.status < 500 and err.status not in (408, 429):
+                    # Ta sama partia dostałaby tę samą odpowiedź
+                    _LOGGER.debug("Skipping rejected discovery batch: %s", err)
+                    del pending[: len(batch)]
+                    skipped += len(batch)
+                    continue
+                error: Exception = err
+            except (CircuitOpenError, ClientError, TimeoutError) as err:
+                error = err
+            except (ParseError, DefusedXmlException) as err:
+                # Ta sama partia zwróciłaby ten sam błąd, zostaje niesklasyfikowana
+                _LOGGER.debug("Skipping unreadable discovery batch: %s", err)
+                del pending[: len(batch)]
+                skipped += len(batch)
+                continue
+            else:
+                del pending[: len(batch)]
+                attempts = 0
+                for tid, supported in result.items():
+                    (state.supported if supported else state.unsupported).add(tid)
+                self.store.async_delay_save()
+                await asyncio.sleep(self.BATCH_DELAY)
+                continue
+
+            attempts += 1
+            if attempts >= self.MAX_BATCH_ATTEMPTS:
+                _LOGGER.debug("Skipping discovery batch after %d errors", attempts)
+                del pending[: len(batch)]
+                skipped += len(batch)
+                attempts = 0
+                continue
+            _LOGGER.debug("Register discovery paused: %s", error)
+            await asyncio.sleep(self.ERROR_DELAY)
+
+        # Pominięte rejestry zostaną sprawdzone przy następnym uruchomieniu
+        state.complete = not skipped
+        self.store.async_delay_save(0)
+        _LOGGER.info(
+            "Register discovery on %s finished: %d supported, %d unsupported",
+            self._hub.base_url,
+            len(state.supported),
+            len(state.unsupported),
+        )
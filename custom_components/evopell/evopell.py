@@ -3,60 +3,56 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass, replace
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass
 from datetime import timedelta
 from itertools import islice
 import logging
-from typing import Any
+import math
+import random
+import time
+from typing import Any, TypeVar
 from urllib.parse import urlencode
-
-from aiohttp import BasicAuth, ClientError, ClientResponseError, ClientTimeout
+import zlib
+
+from aiohttp import (
+    BasicAuth,
+    ClientError,
+    ClientResponse,
+    ClientResponseError,
+    ClientSession,
+    ClientTimeout,
+    ServerDisconnectedError,
+    TCPConnector,
+    TraceConfig,
+    hdrs,
+)
 from defusedxml import ElementTree as ET
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-_LOGGER = logging.getLogger(__name__)
-
-
-@dataclass(frozen=True, slots=True)
-class EvopellRegister:
-    """Represents a single register entry returned by the device."""
-
-    tid: str
-    value: int | float | str
-    description: str | None = None
-    min_value: int | float | str | None = None
-    max_value: int | float | str | None = None
-    status: str | None = None
+from .const import DOMAIN, POLL_TIER_CYCLES, POLL_TIER_FAST
+from .discovery import RegisterDiscovery
+from .fleet import FairLimiter
+from .metrics import ENDPOINT_READ, ENDPOINT_WRITE, HubMetrics
+from .parsing import RegisterStreamParser
+from .registers import RegisterTable, RegisterView
+from .retry import CircuitBreaker, RetryPolicy
+from .scan_interval import AdaptiveScanInterval
+from .store import DeviceInfoStore, SnapshotStore, TuningStore, entry_store_key
+from .tuning import AdaptiveTuner
+from .utils import to_float
 
-    @staticmethod
-    def from_xml_attrib(
-        attrib: dict[str, str], description: str | None
-    ) -> EvopellRegister | None:
-        """Create register from XML attributes; returns None if required attrs are missing."""
-        tid = attrib.get("tid")
-        v = attrib.get("v")
-        if not tid or v is None:
-            return None
-
-        status = attrib.get("status")
-        if status:
-            _LOGGER.error(
-                "Register %s has status %s, skipping as read register", tid, status
-            )
-            return None
+_LOGGER = logging.getLogger(__name__)
 
-        return EvopellRegister(
-            tid=tid,
-            value=v,
-            description=description,
-            min_value=attrib.get("min"),
-            max_value=attrib.get("max"),
-        )
+_T = TypeVar("_T")
 
 
 @dataclass(frozen=True, slots=True)
@@ -83,10 +79,53 @@ class EvopellWriteRegister:
         return EvopellWriteRegister(tid=tid, vid=vid, value=value, status=status)
 
 
+@dataclass(slots=True)
+class _QuarantineEntry:
+    """Register the device answered with an error status."""
+
+    status: str
+    failures: int
+    retry_at: float
+
+
+@dataclass(slots=True)
+class _WriteBatch:
+    """Register writes collected within one coalescing window."""
+
+    values: dict[str, str]
+    future: asyncio.Future[dict[str, EvopellWriteRegister]]
+
+
 class EvopellHub:
     """Async HTTP client for fetching register data from a device."""
 
     MAX_PARAMS_PER_REQUEST = 20
+    # Odpowiedzi, którymi sterownik sygnalizuje przeciążenie
+    OVERLOAD_STATUSES = (429, 503)
+    # Ile cykli odczytu po przeciążeniu wykonujemy szeregowo
+    SERIAL_FALLBACK_CYCLES = 10
+    # Sterownik odrzuca zbyt długie zapytania tymi kodami
+    URL_TOO_LONG_STATUSES = (400, 414)
+    # Zapisy zlecone w tym oknie [s] idą jednym zapytaniem setregister.cgi
+    WRITE_COALESCE_DELAY = 0.3
+    # Zapis wartości równej odczytanej najwyżej tyle [s] temu jest pomijany
+    WRITE_SKIP_MAX_AGE = 60.0
+    # Jak długo [s] dedykowana pula trzyma bezczynne połączenie
+    KEEPALIVE_TIMEOUT = 60.0
+    # Rejestry identyfikujące urządzenie
+    IDENTITY_REGISTERS = (
+        "device_id",
+        "device_name",
+        "device_soft_version",
+        "device_type",
+        "eth_mac",
+        "device_hard_version",
+        "eth_ip",
+    )
+    # Rejestr zwracający status błędu jest ponownie odpytywany po tym czasie [s],
+    # podwajanym po każdej kolejnej porażce aż do QUARANTINE_MAX_INTERVAL
+    QUARANTINE_BASE_INTERVAL = 60.0
+    QUARANTINE_MAX_INTERVAL = 3600.0
 
     def __init__(
         self,
@@ -98,68 +137,202 @@ class EvopellHub:
         max_retries: int = 3,
         retry_delay: float = 1.5,
         param_map: dict[str, str] | None = None,
+        max_concurrent_requests: int = 1,
+        streaming_parse: bool = False,
+        dedicated_connection: bool = False,
+        limiter: FairLimiter | None = None,
     ) -> None:
         """Initialize EvopellHub."""
         self._hass = hass
-        self._session = async_get_clientsession(hass)
         self._timeout = ClientTimeout(total=timeout_seconds)
 
         self.base_url = base_url.rstrip("/")
         self.auth = (username, password) if username and password else None
+        self._headers = (
+            {hdrs.AUTHORIZATION: BasicAuth(*self.auth).encode()} if self.auth else None
+        )
+
+        self.dedicated_connection = dedicated_connection
+        self._connections_created = 0
+        self._connections_reused = 0
+        if dedicated_connection:
+            trace_config = TraceConfig()
+            trace_config.on_connection_create_end.append(self._on_connection_created)
+            trace_config.on_connection_reuseconn.append(self._on_connection_reused)
+            self._session = ClientSession(
+                connector=TCPConnector(
+                    limit_per_host=max(1, max_concurrent_requests) + 1,
+                    keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+                ),
+                trace_configs=[trace_config],
+            )
+        else:
+            self._session = async_get_clientsession(hass)
 
-        self.max_retries = max_retries
-        self.retry_delay = retry_delay
+        self.retry_policy = RetryPolicy(
+            max_retries=max(1, max_retries), base_delay=retry_delay
+        )
+        self.circuit_breaker = CircuitBreaker(self.base_url)
+        # Globalny budżet żądań wszystkich sterowników (EvopellFleet)
+        self.limiter = limiter
+        self.max_concurrent_requests = max(1, max_concurrent_requests)
+        self._serial_fallback_cycles = 0
+        self.streaming_parse = streaming_parse
+        self.tuner = AdaptiveTuner(
+            self.MAX_PARAMS_PER_REQUEST, self.max_concurrent_requests
+        )
+        self.metrics = HubMetrics()
 
         self.param_map = {}
         self.device_info: DeviceInfo | None = None
-        self.registers_data: dict[str, EvopellRegister] = {}
+        self.identity: dict[str, str] | None = None
+        self.registers_data = RegisterTable()
+        # Rejestry przywrócone z migawki, jeszcze nie odczytane na żywo
+        self.stale_registers: set[str] = set()
+        self._changed_keys: set[str] = set()
+        self._write_batches: dict[int, _WriteBatch] = {}
+        # Ostatnie wysyłanie paczki zapisów dla każdego urządzenia
+        self._write_flushes: dict[int, asyncio.Task[None]] = {}
+        self._quarantine: dict[str, _QuarantineEntry] = {}
 
     async def async_read_device_info(self) -> bool:
         """Read device info and populate self.device_info."""
-        registers = await self.async_fetch_registers(
-            0,
-            "device_id",
-            "device_name",
-            "device_soft_version",
-            "device_type",
-            "eth_mac",
-            "device_hard_version",
-            "eth_ip",
-        )
-        if len(registers) < 7:
+        identity = await self.async_read_identity()
+        if identity is None:
             return False
+        self.restore_device_info(identity)
+        return True
 
-        # Uwaga: trzymamy się Twojej kolejności
-        device_id = str(registers[0].value)
-        device_name = str(registers[1].value)
-        sw_version = str(registers[2].value)
-        model = str(registers[3].value)
-        mac_raw = str(registers[4].value)
-        hw_version = str(registers[5].value)
-        ip = str(registers[6].value)
+    async def async_read_identity(self) -> dict[str, str] | None:
+        """Read the raw identity registers, or None if any is missing."""
+        registers = await self.async_fetch_registers(0, *self.IDENTITY_REGISTERS)
+        identity = {reg.tid: str(reg.value) for reg in registers}
+        if any(tid not in identity for tid in self.IDENTITY_REGISTERS):
+            return None
+        return identity
+
+    def restore_device_info(self, identity: dict[str, str]) -> None:
+        """Build self.device_info from identity registers (live or cached)."""
+        self.identity = identity
+        device_id = identity["device_id"]
+        mac_raw = identity["eth_mac"]
 
         mac_formatted = ":".join(mac_raw[i : i + 2] for i in range(0, 12, 2)).upper()
-        configuration_url = f"http://{ip}"
+        configuration_url = f"http://{identity['eth_ip']}"
         serial_number = f"{device_id}-{mac_raw}"
 
         self.device_info = DeviceInfo(
             identifiers={("evopell", serial_number)},
-            name=device_name,
+            name=identity["device_name"],
             manufacturer="Defro",
-            model=model,
-            sw_version=sw_version,
-            hw_version=hw_version,
+            model=identity["device_type"],
+            sw_version=identity["device_soft_version"],
+            hw_version=identity["device_hard_version"],
             connections={("MAC", mac_formatted)},
             configuration_url=configuration_url,
             serial_number=serial_number,
         )
-        return True
 
     async def async_write_register_values(
         self, device_id: int, *params: dict[str, str]
     ) -> list[EvopellWriteRegister]:
-        """Write register values to device."""
-        return await self.async_write_registers(device_id, *params)
+        """Write register values to device, coalescing with concurrent writes.
+
+        Writes issued within WRITE_COALESCE_DELAY are sent as one batch in
+        which the last value per tid wins. Values equal to a freshly read
+        register are not sent at all. Each caller gets the results for its
+        own tids.
+        """
+        values: dict[str, str] = {}
+        for d in params:
+            values.update(d)
+
+        results: dict[str, EvopellWriteRegister] = {}
+        pending: dict[str, str] = {}
+        for tid, value in values.items():
+            if self._is_cached_value(tid, value):
+                _LOGGER.debug("Register %s already has value %s, skipping", tid, value)
+                results[tid] = EvopellWriteRegister(
+                    vid="",
+                    tid=tid,
+                    value=str(self.registers_data[tid].value),
+                    status="ok",
+                )
+            else:
+                pending[tid] = value
+
+        if pending:
+            batch = self._write_batches.get(device_id)
+            if batch is None:
+                batch = _WriteBatch({}, self._hass.loop.create_future())
+                self._write_batches[device_id] = batch
+                self._write_flushes[device_id] = (
+                    self._hass.async_create_background_task(
+                        self._async_flush_writes(
+                            device_id, self._write_flushes.get(device_id)
+                        ),
+                        f"evopell write {self.base_url}",
+                    )
+                )
+            batch.values.update(pending)
+            written = await asyncio.shield(batch.future)
+            results.update({tid: written[tid] for tid in pending if tid in written})
+
+        return [results[tid] for tid in values if tid in results]
+
+    async def _async_flush_writes(
+        self, device_id: int, previous: asyncio.Task[None] | None
+    ) -> None:
+        """Send the writes collected for a device once the window closes.
+
+        Paczka jest wysyłana dopiero po zakończeniu poprzedniej, więc przy
+        ponowieniach starsza wartość nie może nadpisać nowszej.
+        """
+        batch = self._write_batches[device_id]
+        try:
+            await asyncio.sleep(self.WRITE_COALESCE_DELAY)
+            # Zapisy zlecone od teraz trafiają do następnej paczki
+            del self._write_batches[device_id]
+            if previous is not None:
+                await asyncio.wait([previous])
+            _LOGGER.debug("Writing coalesced batch %s", batch.values)
+            registers = await self.async_write_registers(
+                device_id, *({tid: value} for tid, value in batch.values.items())
+            )
+        except Exception as err:  # noqa: BLE001
+            batch.future.set_exception(err)
+            # Czekający dostają wyjątek; bez nich nie zostaje on nieodebrany
+            batch.future.exception()
+        else:
+            batch.future.set_result({reg.tid: reg for reg in registers})
+        finally:
+            if self._write_batches.get(device_id) is batch:
+                del self._write_batches[device_id]
+            if not batch.future.done():
+                batch.future.cancel()
+            if self._write_flushes.get(device_id) is asyncio.current_task():
+                del self._write_flushes[device_id]
+
+    def _is_cached_value(self, tid: str, value: str) -> bool:
+        """Return True if the register was read recently with the same value.
+
+        Values restored from a snapshot were never read live, so writes to
+        those registers are always sent.
+        """
+        register = self.registers_data.get(tid)
+        if register is None or tid in self.stale_registers:
+            return False
+        updated_at = register.updated_at
+        if (
+            updated_at is None
+            or time.monotonic() - updated_at > self.WRITE_SKIP_MAX_AGE
+        ):
+            return False
+        cached = str(register.value)
+        if cached == value:
+            return True
+        cached_float = to_float(cached)
+        return cached_float is not None and cached_float == to_float(value)
 
     async def async_write_registers(
         self, device_id: int, *params: dict[str, str]
@@ -185,13 +358,14 @@ class EvopellHub:
 
     async def async_fetch_registers(
         self, device_id: int, *params: str
-    ) -> list[EvopellRegister]:
+    ) -> list[RegisterView]:
         """Fetch registers from device.
 
         If no parameters are given, all keys from the param_map are used.
-        Splits into multiple HTTP requests if necessary (max 20 params/request).
+        Splits into multiple HTTP requests if necessary, issuing several of them
+        at the same time. Chunk size and concurrency are chosen by the tuner.
         """
-        all_registers: list[EvopellRegister] = []
+        all_registers: list[RegisterView] = []
         if not params:
             if self.param_map:
                 params = tuple(self.param_map.keys())
@@ -206,25 +380,127 @@ class EvopellHub:
 
         _LOGGER.debug("Fetching registers %s from device %d", params, device_id)
 
-        for chunk in self._chunked(params, self.MAX_PARAMS_PER_REQUEST):
-            registers = await self._async_fetch_chunk(device_id, chunk)
-            all_registers.extend(registers)
+        chunks = list(self._chunked(params, self.tuner.chunk_size))
+        table = self.registers_data
+        now = time.monotonic()
+        for attribs in await self._async_fetch_chunks(device_id, chunks):
+            for attrib in attribs:
+                tid = attrib["tid"]
+                if table.update(
+                    tid,
+                    attrib["v"],
+                    attrib.get("min"),
+                    attrib.get("max"),
+                    now,
+                    self.param_map.get(tid),
+                ) or (tid in self.stale_registers):
+                    self._changed_keys.add(tid)
+                self.stale_registers.discard(tid)
+                all_registers.append(table[tid])
+        table.decode_pending()
 
-        for reg in all_registers:
-            existing = self.registers_data.get(reg.tid)
-            self.registers_data[reg.tid] = (
-                reg
-                if existing is None
-                else replace(
-                    existing,
-                    value=reg.value,
-                    description=reg.description,
-                    min_value=reg.min_value,
-                    max_value=reg.max_value,
-                )
+        return all_registers
+
+    async def async_probe_registers(
+        self, device_id: int, *params: str
+    ) -> dict[str, bool]:
+        """Check which of the given registers the device supports.
+
+        A register is supported when the device returns its value and
+        unsupported when a valid response leaves it out. Registers answered
+        with a status attribute stay unclassified. Values are not stored and
+        statuses are not logged as errors.
+        """
+        query = "&".join(params)
+        url = f"{self.base_url}/getregister.cgi?device={device_id}&{query}"
+
+        async def _read(resp: ClientResponse) -> list[dict[str, str]]:
+            return self._scan_reg_attribs(await resp.read())
+
+        supported: set[str] = set()
+        failed: set[str] = set()
+        for attrib in await self._async_request(
+            url, _read, adaptive=False, endpoint=ENDPOINT_READ
+        ):
+            if (tid := attrib.get("tid")) and attrib.get("v") is not None:
+                (failed if attrib.get("status") else supported).add(tid)
+        return {tid: tid in supported for tid in params if tid not in failed}
+
+    def restore_registers(self, registers: dict[str, list[str | None]]) -> None:
+        """Restore registers from a snapshot, marking them stale until read."""
+        for tid, (value, min_value, max_value) in registers.items():
+            self.registers_data.update(
+                tid, value or "", min_value, max_value, None, self.param_map.get(tid)
             )
+            self.stale_registers.add(tid)
+        self.registers_data.decode_pending()
+
+    def snapshot_registers(self) -> dict[str, list[str | None]]:
+        """Return registers as tid -> [value, min, max] for a snapshot."""
+        return {
+            tid: [
+                str(reg.value),
+                None if reg.min_value is None else str(reg.min_value),
+                None if reg.max_value is None else str(reg.max_value),
+            ]
+            for tid, reg in self.registers_data.items()
+            if tid not in self.stale_registers
+        }
+
+    def store_written_value(self, tid: str, value: str) -> bool:
+        """Store a value accepted by the device and mark the register changed."""
+        if not self.registers_data.set_value(tid, value):
+            return False
+        self._changed_keys.add(tid)
+        return True
 
-        return all_registers
+    def pop_changed_keys(self) -> set[str]:
+        """Return registers whose value or min/max changed since the last call."""
+        changed = self._changed_keys
+        self._changed_keys = set()
+        return changed
+
+    async def _async_fetch_chunks(
+        self, device_id: int, chunks: list[list[str]]
+    ) -> list[list[dict[str, str]]]:
+        """Fetch chunks with bounded concurrency; results keep the chunk order."""
+        if self._serial_fallback_cycles > 0:
+            self._serial_fallback_cycles -= 1
+            if self._serial_fallback_cycles == 0:
+                _LOGGER.info("Restoring concurrent fetching for %s", self.base_url)
+
+        concurrency = self.tuner.concurrency
+        if len(chunks) <= 1 or concurrency <= 1 or self._serial_fallback_cycles > 0:
+            return [await self._async_fetch_chunk(device_id, c) for c in chunks]
+
+        semaphore = asyncio.Semaphore(concurrency)
+        serial_lock = asyncio.Lock()
+
+        async def _fetch(chunk: list[str]) -> list[dict[str, str]]:
+            async with semaphore:
+                if self._serial_fallback_cycles > 0:
+                    # Sterownik zgłosił przeciążenie — reszta idzie po kolei
+                    async with serial_lock:
+                        return await self._async_fetch_chunk(device_id, chunk)
+                return await self._async_fetch_chunk(device_id, chunk)
+
+        results = await asyncio.gather(
+            *(_fetch(chunk) for chunk in chunks), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results  # type: ignore[return-value]
+
+    def _signal_overload(self, err: Exception) -> None:
+        """Switch to serial fetching after the controller reports overload."""
+        if self._serial_fallback_cycles == 0:
+            _LOGGER.warning(
+                "Device %s reports overload (%s), falling back to serial fetching",
+                self.base_url,
+                err,
+            )
+        self._serial_fallback_cycles = self.SERIAL_FALLBACK_CYCLES
 
     async def _async_write_chunk(
         self, device_id: int, params_chunk: list[dict[str, str]]
@@ -238,148 +514,255 @@ class EvopellHub:
         url = f"{self.base_url}/setregister.cgi?device={device_id}&{query}"
         _LOGGER.debug("Writing to URL: %s", url)
 
-        last_error: Exception | None = None
-
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                async with self._session.get(
-                    url,
-                    timeout=self._timeout,
-                    auth=self._build_auth(),
-                ) as resp:
-                    if resp.status in (401, 403):
-                        _LOGGER.error(
-                            "Authorization failed (401/403), stopping retries"
-                        )
-                        resp.raise_for_status()
-
-                    resp.raise_for_status()
-                    text = await resp.text()
-                    return self._parse_xml_write_response(text)
-
-            except ClientResponseError as err:
-                last_error = err
-                if err.status in (401, 403):
-                    raise
-                _LOGGER.warning(
-                    "[Attempt %d/%d] HTTP error: %s",
-                    attempt,
-                    self.max_retries,
-                    err,
-                )
-
-            except (ClientError, TimeoutError) as err:
-                last_error = err
-                _LOGGER.warning(
-                    "[Attempt %d/%d] Network error: %s",
-                    attempt,
-                    self.max_retries,
-                    err,
-                )
+        async def _read(resp: ClientResponse) -> list[EvopellWriteRegister]:
+            return self._parse_xml_write_response(await resp.read())
 
-            if attempt < self.max_retries:
-                # Nie blokujemy event loop jak time.sleep
-                await self._hass.async_add_executor_job(lambda: None)
-                await self._hass.async_add_executor_job(lambda: None)
-                await asyncio_sleep(self.retry_delay)
-
-        _LOGGER.error("Max retry attempts reached, failing")
-        if last_error:
-            raise last_error
-        return []
+        return await self._async_request(
+            url, _read, adaptive=False, endpoint=ENDPOINT_WRITE
+        )
 
     async def _async_fetch_chunk(
         self, device_id: int, params_chunk: list[str]
-    ) -> list[EvopellRegister]:
-        """Fetch one batch of up to MAX_PARAMS_PER_REQUEST parameters."""
+    ) -> list[dict[str, str]]:
+        """Fetch one batch of up to tuner.chunk_size parameters."""
         query = "&".join(params_chunk)
         url = f"{self.base_url}/getregister.cgi?device={device_id}&{query}"
         _LOGGER.debug("Fetching from URL: %s", url)
+
+        async def _read(resp: ClientResponse) -> list[dict[str, str]]:
+            if self.streaming_parse:
+                return [reg async for reg in self._async_iter_registers(resp)]
+            body = await resp.read()
+            self.metrics.add_bytes(len(body))
+            started = time.perf_counter()
+            registers = self._parse_xml_response(body)
+            self.metrics.parse_time.add(time.perf_counter() - started)
+            return registers
+
+        return await self._async_request(
+            url, _read, adaptive=True, endpoint=ENDPOINT_READ
+        )
+
+    async def _async_request(
+        self,
+        url: str,
+        read: Callable[[ClientResponse], Awaitable[_T]],
+        adaptive: bool,
+        endpoint: str,
+    ) -> _T:
+        """Send a GET request following the retry policy and circuit breaker.
+
+        Adaptive requests also feed the tuner and the overload fallback.
+        """
+        policy = self.retry_policy
         last_error: Exception | None = None
 
-        for attempt in range(1, self.max_retries + 1):
+        for attempt in range(1, policy.max_retries + 1):
+            if attempt > 1:
+                self.metrics.retries += 1
+            probe = self.circuit_breaker.before_request()
             try:
-                async with self._session.get(
-                    url,
-                    timeout=self._timeout,
-                    auth=self._build_auth(),
-                ) as resp:
-                    if resp.status in (401, 403):
-                        _LOGGER.error(
-                            "Authorization failed (401/403), stopping retries"
+                async with self._request_slot():
+                    started = time.monotonic()
+                    try:
+                        async with self._session.get(
+                            url,
+                            timeout=self._timeout,
+                            headers=self._headers,
+                        ) as resp:
+                            if resp.status in (401, 403):
+                                _LOGGER.error(
+                                    "Authorization failed (401/403), stopping retries"
+                                )
+                                resp.raise_for_status()
+
+                            resp.raise_for_status()
+                            result = await read(resp)
+
+                    except ClientResponseError as err:
+                        # Urządzenie odpowiedziało, więc jest osiągalne
+                        self.circuit_breaker.record_success()
+                        last_error = err
+                        self.metrics.add_error(endpoint, err)
+                        if err.status in (401, 403):
+                            raise
+                        if adaptive:
+                            if err.status in self.OVERLOAD_STATUSES:
+                                self._signal_overload(err)
+                            self.tuner.record_failure(
+                                f"HTTP {err.status}",
+                                chunk_too_large=err.status
+                                in self.URL_TOO_LONG_STATUSES,
+                            )
+                        _LOGGER.warning(
+                            "[Attempt %d/%d] HTTP error: %s",
+                            attempt,
+                            policy.max_retries,
+                            err,
                         )
-                        resp.raise_for_status()
-
-                    resp.raise_for_status()
-                    text = await resp.text()
-                    return self._parse_xml_response(text)
-
-            except ClientResponseError as err:
-                last_error = err
-                if err.status in (401, 403):
-                    raise
-                _LOGGER.warning(
-                    "[Attempt %d/%d] HTTP error: %s",
-                    attempt,
-                    self.max_retries,
-                    err,
-                )
 
-            except (ClientError, TimeoutError) as err:
-                last_error = err
-                _LOGGER.warning(
-                    "[Attempt %d/%d] Network error: %s",
-                    attempt,
-                    self.max_retries,
-                    err,
-                )
+                    except (ClientError, TimeoutError) as err:
+                        self.circuit_breaker.record_failure()
+                        last_error = err
+                        self.metrics.add_error(endpoint, err)
+                        if isinstance(err, TimeoutError):
+                            self.metrics.timeouts += 1
+                        if adaptive:
+                            if isinstance(err, ServerDisconnectedError):
+                                self._signal_overload(err)
+                            self.tuner.record_failure(type(err).__name__)
+                        _LOGGER.warning(
+                            "[Attempt %d/%d] Network error: %s",
+                            attempt,
+                            policy.max_retries,
+                            err,
+                        )
 
-            if attempt < self.max_retries:
-                # Nie blokujemy event loop jak time.sleep
-                await self._hass.async_add_executor_job(lambda: None)
-                await self._hass.async_add_executor_job(lambda: None)
-                await asyncio_sleep(self.retry_delay)
+                    except Exception as err:
+                        # Np. nieczytelna odpowiedź, liczymy jak awarię urządzenia
+                        self.circuit_breaker.record_failure()
+                        self.metrics.add_error(endpoint, err)
+                        raise
+
+                    else:
+                        elapsed = time.monotonic() - started
+                        self.circuit_breaker.record_success()
+                        self.metrics.latency[endpoint].add(elapsed)
+                        if adaptive:
+                            self.tuner.record_success(elapsed)
+                        return result
+            finally:
+                # Próba przerwana bez wyniku (np. anulowanie) nie blokuje kolejnych
+                if probe:
+                    self.circuit_breaker.release_probe()
+
+            if attempt < policy.max_retries:
+                await asyncio.sleep(policy.delay(attempt))
 
         _LOGGER.error("Max retry attempts reached, failing")
-        if last_error:
-            raise last_error
-        return []
+        assert last_error is not None
+        raise last_error
 
-    def _build_auth(self):
-        """Build aiohttp BasicAuth or return None."""
-        if not self.auth:
-            return None
+    def _request_slot(self) -> AbstractAsyncContextManager[None]:
+        """Return a context holding a slot of the fleet-wide request budget."""
+        if self.limiter is None:
+            return nullcontext()
+        return self.limiter.slot(self.base_url)
 
-        return BasicAuth(*self.auth)
+    @property
+    def connections_created(self) -> int | None:
+        """Return number of TCP connections opened by the dedicated pool."""
+        return self._connections_created if self.dedicated_connection else None
 
-    def _parse_xml_response(self, xml_text: str) -> list[EvopellRegister]:
-        """Parse XML response into a list of register objects."""
-        registers: list[EvopellRegister] = []
-        root = ET.fromstring(xml_text)
+    @property
+    def connections_reused(self) -> int | None:
+        """Return number of requests served over a kept-alive connection."""
+        return self._connections_reused if self.dedicated_connection else None
+
+    async def _on_connection_created(self, *_: Any) -> None:
+        self._connections_created += 1
+
+    async def _on_connection_reused(self, *_: Any) -> None:
+        self._connections_reused += 1
+
+    def _parse_xml_response(self, body: bytes) -> list[dict[str, str]]:
+        """Parse XML response into attributes of the registers read."""
+        return [
+            attrib
+            for attrib in self._scan_reg_attribs(body)
+            if self._accept_register(attrib)
+        ]
+
+    async def _async_iter_registers(
+        self, resp: ClientResponse
+    ) -> AsyncIterator[dict[str, str]]:
+        """Parse the response body while it arrives, yielding each closed <reg>."""
+        parser = RegisterStreamParser()
+        parse_time = 0.0
+        async for data in resp.content.iter_any():
+            self.metrics.add_bytes(len(data))
+            started = time.perf_counter()
+            attribs = parser.feed(data)
+            parse_time += time.perf_counter() - started
+            for attrib in attribs:
+                if self._accept_register(attrib):
+                    yield attrib
+
+        started = time.perf_counter()
+        attribs = parser.close()
+        self.metrics.parse_time.add(parse_time + time.perf_counter() - started)
+        for attrib in attribs:
+            if self._accept_register(attrib):
+                yield attrib
+
+    def _accept_register(self, attrib: dict[str, str]) -> bool:
+        """Return True if <reg> attributes describe a register that was read.
+
+        Registers answered with a status attribute are quarantined instead.
+        """
+        tid = attrib.get("tid")
+        if not tid or attrib.get("v") is None:
+            return False
+        if status := attrib.get("status"):
+            self._quarantine_register(tid, status)
+            return False
+        if tid in self._quarantine:
+            entry = self._quarantine.pop(tid)
+            _LOGGER.info(
+                "Register %s is readable again after %d failed reads",
+                tid,
+                entry.failures,
+            )
+        return True
 
-        for reg in root.findall(".//reg"):
-            item = EvopellRegister.from_xml_attrib(
-                reg.attrib, self.param_map.get(reg.attrib.get("tid", ""))
+    def _quarantine_register(self, tid: str, status: str) -> None:
+        """Stop requesting a failing register for an exponentially growing time."""
+        entry = self._quarantine.get(tid)
+        failures = entry.failures + 1 if entry else 1
+        interval = min(
+            self.QUARANTINE_MAX_INTERVAL,
+            self.QUARANTINE_BASE_INTERVAL * 2 ** (failures - 1),
+        )
+        if entry is None or entry.status != status:
+            _LOGGER.warning(
+                "Register %s has status %s, not requesting it for %.0fs",
+                tid,
+                status,
+                interval,
             )
-            if item is not None:
-                registers.append(item)
+        self._quarantine[tid] = _QuarantineEntry(
+            status, failures, time.monotonic() + interval
+        )
 
-        return registers
+    def is_quarantined(self, tid: str, now: float | None = None) -> bool:
+        """Return True while a failing register must not be requested."""
+        entry = self._quarantine.get(tid)
+        if entry is None:
+            return False
+        return entry.retry_at > (time.monotonic() if now is None else now)
 
-    def _parse_xml_write_response(self, xml_text: str) -> list[EvopellWriteRegister]:
+    @property
+    def quarantined_registers(self) -> dict[str, str]:
+        """Return quarantined registers with the status the device reported."""
+        return {tid: entry.status for tid, entry in self._quarantine.items()}
+
+    def _parse_xml_write_response(self, body: bytes) -> list[EvopellWriteRegister]:
         """Parse XML response into a list of register objects."""
         registers: list[EvopellWriteRegister] = []
-        root = ET.fromstring(xml_text)
-
-        for reg in root.findall(".//reg"):
+        for attrib in self._scan_reg_attribs(body):
             item = EvopellWriteRegister.from_xml_attrib(
-                reg.attrib, self.param_map.get(reg.attrib.get("tid", ""))
+                attrib, self.param_map.get(attrib.get("tid", ""))
             )
             if item is not None:
                 registers.append(item)
 
         return registers
 
+    @staticmethod
+    def _scan_reg_attribs(body: bytes) -> list[dict[str, str]]:
+        """Return the attributes of every <reg> element in a response."""
+        return [reg.attrib for reg in ET.fromstring(body).findall(".//reg")]
+
     @staticmethod
     def _chunked(iterable: Any, size: int):
         """Yield successive chunks (batches) of given size."""
@@ -392,20 +775,25 @@ class EvopellHub:
 
     async def async_close(self) -> None:
         """Close any resources if needed."""
-        # HA zarządza sesją aiohttp, więc tu zwykle nic nie robimy
-        return
+        # Wspólną sesją aiohttp zarządza HA, zamykamy tylko własną pulę
+        if self.dedicated_connection:
+            await self._session.close()
 
 
-# Minimalny, bezpieczny sleep async bez importu time.sleep
-async def asyncio_sleep(seconds: float) -> None:
-    """Async sleep helper."""
-
-    await asyncio.sleep(seconds)
-
-
-class EvopellCoordinator(DataUpdateCoordinator[dict[str, str]]):
+class EvopellCoordinator(DataUpdateCoordinator[Mapping[str, str]]):
     """Evopell data update coordinator."""
 
+    # Odczyt kontrolny zapisanych rejestrów następuje po tym czasie [s]
+    VERIFY_DELAY = 1.0
+    # Migawka rejestrów jest zapisywana nie częściej niż co tyle [s]
+    SNAPSHOT_INTERVAL = 300.0
+    # Starsza migawka nie jest pokazywana jako ostatnie znane wartości [s]
+    SNAPSHOT_MAX_AGE = 6 * 3600.0
+    # Maksymalne losowe opóźnienie odświeżania względem fazy urządzenia [s]
+    PHASE_JITTER = 1.0
+    # Najmniejszy odstęp od teraz do zaplanowanego odświeżenia [s]
+    PHASE_MIN_GAP = 1.0
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -413,6 +801,8 @@ class EvopellCoordinator(DataUpdateCoordinator[dict[str, str]]):
         hub: EvopellHub,
         name: str,
         scan_interval: int,
+        verify_writes: bool = False,
+        adaptive_scan_interval: bool = False,
     ) -> None:
         """Initialize EvopellCoordinator."""
         super().__init__(
@@ -423,21 +813,312 @@ class EvopellCoordinator(DataUpdateCoordinator[dict[str, str]]):
             update_interval=timedelta(seconds=scan_interval),
         )
         self.hub = hub
+        self.discovery = RegisterDiscovery(hass, hub)
         self.avg: dict[str, Any] = {}
+        self.poll_tiers: dict[str, str] = {}
+        self.tuning_store = TuningStore(
+            hass, entry_store_key(entry.entry_id, "tuning"), hub.tuner
+        )
+        self.device_store = DeviceInfoStore(
+            hass, entry_store_key(entry.entry_id, "device")
+        )
+        self.snapshot_store = SnapshotStore(
+            hass, entry_store_key(entry.entry_id, "snapshot")
+        )
+        self._snapshot_saved_at: float | None = None
+        self._poll_cycle = 0
+        self._requested: set[str] = set()
+        self._changed_keys: set[str] | None = None
+        self._notified_success: bool | None = None
+        self.verify_writes = verify_writes
+        self.dependents: dict[str, tuple[str, ...]] = {}
+        self._verify_pending: set[str] = set()
+        self._verify_unsub: CALLBACK_TYPE | None = None
+        self.scan_interval = (
+            AdaptiveScanInterval(scan_interval) if adaptive_scan_interval else None
+        )
 
     async def _async_setup(self) -> None:
-        """Run one-time setup before the first refresh."""
-        ok = await self.hub.async_read_device_info()
-        if not ok:
-            raise UpdateFailed("Unable to read device info")
+        """Run one-time setup before the first refresh.
+
+        A cached device identity is used right away and revalidated in the
+        background; only the first start has to wait for the device.
+        """
+        await self.tuning_store.async_load()
+        if identity := await self.device_store.async_load():
+            self._async_use_cached_identity(identity)
+        else:
+            ok = await self.hub.async_read_device_info()
+            if not ok:
+                raise UpdateFailed("Unable to read device info")
+            await self.device_store.async_save(self.hub.identity)
+        await self.discovery.async_load()
+
+    async def async_restore_snapshot(self) -> bool:
+        """Set up from cached identity and registers without contacting the device.
+
+        Returns False when there is nothing to restore; the caller then has
+        to run the first refresh as usual.
+        """
+        identity = await self.device_store.async_load()
+        registers = await self.snapshot_store.async_load(self.SNAPSHOT_MAX_AGE)
+        if not identity or not registers:
+            return False
+        await self.tuning_store.async_load()
+        self._async_use_cached_identity(identity)
+        await self.discovery.async_load()
+        self.hub.restore_registers(registers)
+        self.data = self._registers_values()
+        _LOGGER.debug("Restored %d registers from snapshot", len(registers))
+        return True
 
-    async def _async_update_data(self) -> dict[str, str]:
+    @callback
+    def _async_use_cached_identity(self, identity: dict[str, str]) -> None:
+        """Use a cached identity now and revalidate it in the background."""
+        self.hub.restore_device_info(identity)
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_revalidate_device_info(),
+            f"{DOMAIN} device info {self.name}",
+        )
+
+    async def _async_revalidate_device_info(self) -> None:
+        """Compare the cached identity with the device and apply changes."""
+        cached = self.hub.identity
+        try:
+            identity = await self.hub.async_read_identity()
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Unable to revalidate device info: %s", err)
+            return
+        if identity is None or identity == cached:
+            return
+
+        await self.device_store.async_save(identity)
+        if cached is None or any(
+            identity[tid] != cached.get(tid) for tid in ("device_id", "eth_mac")
+        ):
+            _LOGGER.info("Device behind %s changed, reloading", self.hub.base_url)
+            self.hass.config_entries.async_schedule_reload(self.config_entry.entry_id)
+            return
+
+        self.hub.restore_device_info(identity)
+        info = self.hub.device_info
+        device_registry = dr.async_get(self.hass)
+        if device := device_registry.async_get_device(identifiers=info["identifiers"]):
+            device_registry.async_update_device(
+                device.id,
+                name=info["name"],
+                model=info["model"],
+                sw_version=info["sw_version"],
+                hw_version=info["hw_version"],
+                configuration_url=info["configuration_url"],
+            )
+        await self.discovery.async_load()
+
+    async def _async_update_data(self) -> Mapping[str, str]:
         """Fetch fresh data for entities."""
-        _LOGGER.debug("Fetching new data from Evopell device")
+        due = self._due_registers()
+        _LOGGER.debug(
+            "Fetching %d of %d registers from Evopell device",
+            len(due),
+            len(self.hub.param_map),
+        )
+        started = time.monotonic()
+        self.hub.metrics.start_cycle()
         try:
-            return await self.hub.async_fetch_register_values(0)
+            if due:
+                await self.hub.async_fetch_registers(0, *due)
         except Exception as err:
             raise UpdateFailed("Error updating evopell data") from err
+        finally:
+            self.tuning_store.async_delay_save()
+            self.hub.metrics.end_cycle(
+                time.monotonic() - started,
+                self.update_interval.total_seconds() if self.update_interval else None,
+            )
+        self._requested.difference_update(due)
+        self._changed_keys = self.hub.pop_changed_keys()
+        self._async_save_snapshot()
+        values = self._registers_values()
+        if self.scan_interval is not None and self.scan_interval.update(values):
+            # Nowy interwał obowiązuje od planowania następnego odświeżenia
+            self.update_interval = timedelta(seconds=self.scan_interval.interval)
+        return values
+
+    @property
+    def poll_cycle(self) -> int:
+        """Return the number of poll cycles planned so far."""
+        return self._poll_cycle
+
+    @property
+    def requested_registers(self) -> frozenset[str]:
+        """Return registers requested for the next refresh regardless of tier."""
+        return frozenset(self._requested)
+
+    @property
+    def poll_phase(self) -> float:
+        """Return the device's offset inside the update interval, 0.0 to 1.0.
+
+        Faza wynika z numeru seryjnego (albo entry_id, zanim znana jest
+        tożsamość), więc jest stała między restartami i różna dla urządzeń.
+        """
+        info = self.hub.device_info
+        key = (info.get("serial_number") if info else None) or (
+            self.config_entry.entry_id
+        )
+        return zlib.crc32(key.encode()) / 2**32
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next refresh on the device's phase within the interval.
+
+        Odświeżenia są wyrównane do zegara ściennego: urządzenie odpytywane
+        jest w chwilach k * interval + faza, a nie co interval od startu HA.
+        Po restarcie sterowniki nie odpytują się więc jednocześnie. Pomijana
+        jest tylko chwila, która już minęła (lub wypada za mniej niż
+        PHASE_MIN_GAP), więc długie odpytanie nie podwaja interwału.
+        """
+        if self.update_interval is None:
+            return
+        if self.config_entry and self.config_entry.pref_disable_polling:
+            return
+        self._async_unsub_refresh()
+
+        interval = self.update_interval.total_seconds()
+        offset = self.poll_phase * interval
+        now = time.time()
+        target = (
+            math.ceil((now + self.PHASE_MIN_GAP - offset) / interval) * interval
+            + offset
+        )
+        delay = target - now + random.uniform(0, min(self.PHASE_JITTER, interval / 10))
+        self._unsub_refresh = self.hass.loop.call_at(
+            self.hass.loop.time() + delay, self._async_on_poll_phase
+        ).cancel
+
+    @callback
+    def _async_on_poll_phase(self) -> None:
+        """Start the scheduled refresh."""
+        self._unsub_refresh = None
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._handle_refresh_interval(),
+            f"{DOMAIN} refresh {self.name}",
+        )
+
+    @callback
+    def _async_save_snapshot(self) -> None:
+        """Save registers for the next startup, at most every SNAPSHOT_INTERVAL."""
+        now = time.monotonic()
+        if (
+            self._snapshot_saved_at is not None
+            and now - self._snapshot_saved_at < self.SNAPSHOT_INTERVAL
+        ):
+            return
+        self._snapshot_saved_at = now
+        self.snapshot_store.async_delay_save(self.hub.snapshot_registers)
+
+    def _registers_values(self) -> Mapping[str, str]:
+        """Return the last known value of every register."""
+        return self.hub.registers_data.value_map
+
+    def _due_registers(self) -> list[str]:
+        """Return registers due in this cycle according to their poll tier."""
+        cycle = self._poll_cycle
+        self._poll_cycle += 1
+        unsupported = self.discovery.unsupported
+        now = time.monotonic()
+        due: list[str] = []
+        for tid in self.hub.param_map:
+            if tid in unsupported or self.hub.is_quarantined(tid, now):
+                continue
+            if (
+                tid in self._requested
+                or tid not in self.hub.registers_data
+                or tid in self.hub.stale_registers
+            ):
+                due.append(tid)
+                continue
+            cycles = POLL_TIER_CYCLES.get(self.poll_tiers.get(tid, POLL_TIER_FAST))
+            if cycles is not None and cycle % cycles == 0:
+                due.append(tid)
+        return due
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only entities whose register changed in the last refresh.
+
+        Entities register with their register tid as coordinator context;
+        listeners without a context, and all listeners on availability
+        changes, are always notified.
+        """
+        changed = self._changed_keys
+        self._changed_keys = None
+        started = time.perf_counter()
+        if changed is None or self._notified_success != self.last_update_success:
+            self._notified_success = self.last_update_success
+            super().async_update_listeners()
+        else:
+            for update_callback, context in list(self._listeners.values()):
+                if context is None or context in changed:
+                    update_callback()
+        self.hub.metrics.fanout_time.add(time.perf_counter() - started)
+
+    @callback
+    def async_set_written_values(self, registers: list[EvopellWriteRegister]) -> None:
+        """Store values accepted by the device and notify entities of those registers.
+
+        Powiadamiane są wszystkie encje zapisanych rejestrów, nie tylko ta,
+        która wysłała zapis (np. liczby zmienione przez skrypt).
+        """
+        for register in registers:
+            if register.status == "ok":
+                self.hub.store_written_value(register.tid, register.value)
+        self.data = self._registers_values()
+        self._changed_keys = self.hub.pop_changed_keys()
+        self.async_update_listeners()
+
+    @callback
+    def async_request_registers(self, *tids: str) -> None:
+        """Read given registers on the next refresh regardless of their tier."""
+        self._requested.update(tids)
+
+    @callback
+    def async_schedule_verify(self, *tids: str) -> None:
+        """Schedule a read-back of written registers and their dependents."""
+        if not self.verify_writes:
+            return
+        for tid in tids:
+            self._verify_pending.add(tid)
+            self._verify_pending.update(self.dependents.get(tid, ()))
+        if self._verify_unsub is None:
+            self._verify_unsub = async_call_later(
+                self.hass, self.VERIFY_DELAY, self._async_verify_written
+            )
+
+    async def _async_verify_written(self, _now: Any = None) -> None:
+        """Read back written registers and notify only their entities."""
+        self._verify_unsub = None
+        tids = [tid for tid in self._verify_pending if tid in self.hub.param_map]
+        self._verify_pending.clear()
+        if not tids:
+            return
+        _LOGGER.debug("Verifying written registers %s", tids)
+        try:
+            await self.hub.async_fetch_registers(0, *tids)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning("Unable to verify written registers %s: %s", tids, err)
+            return
+        self.data = self._registers_values()
+        self._changed_keys = self.hub.pop_changed_keys()
+        self.async_update_listeners()
+
+    async def async_shutdown(self) -> None:
+        """Cancel a pending read-back and shut down the coordinator."""
+        if self._verify_unsub is not None:
+            self._verify_unsub()
+            self._verify_unsub = None
+        await super().async_shutdown()
 
     @property
     def device_info(self) -> DeviceInfo | None:
@@ -0,0 +1,102 @@
+"""Domain-wide coordination of all Evopell controllers in one HA instance."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_FLEET, FLEET_MAX_IN_FLIGHT
+
+
+class FairLimiter:
+    """Global in-flight request budget shared fairly between devices.
+
+    Gdy budżet jest wyczerpany, żądania czekają w kolejce FIFO swojego
+    urządzenia, a zwalniany slot trafia do urządzeń po kolei (round-robin).
+    Urządzenie z wieloma porcjami rejestrów nie zagłodzi więc pozostałych.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the limiter."""
+        self.limit = max(1, limit)
+        self.in_flight = 0
+        self._queues: OrderedDict[str, deque[asyncio.Future[None]]] = OrderedDict()
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of requests waiting for a slot."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    @asynccontextmanager
+    async def slot(self, key: str) -> AsyncIterator[None]:
+        """Hold one slot of the budget for the duration of a request."""
+        await self._acquire(key)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, key: str) -> None:
+        if self.in_flight < self.limit and not self._queues:
+            self.in_flight += 1
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(key, deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot został już przekazany, oddajemy go następnemu
+                self._release()
+            else:
+                self._discard(key, future)
+            raise
+
+    def _release(self) -> None:
+        # Slot przechodzi bezpośrednio na następne urządzenie w kolejce,
+        # licznik in_flight się nie zmienia
+        while self._queues:
+            key, queue = next(iter(self._queues.items()))
+            future = queue.popleft()
+            if queue:
+                self._queues.move_to_end(key)
+            else:
+                del self._queues[key]
+            if not future.done():
+                future.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def _discard(self, key: str, future: asyncio.Future[None]) -> None:
+        if (queue := self._queues.get(key)) is None:
+            return
+        try:
+            queue.remove(future)
+        except ValueError:
+            return
+        if not queue:
+            del self._queues[key]
+
+
+class EvopellFleet:
+    """Domain-wide state shared by all Evopell config entries.
+
+    Trzyma globalny FairLimiter, z którego korzystają huby wszystkich
+    sterowników w tej instancji HA.
+    """
+
+    def __init__(self, max_in_flight: int = FLEET_MAX_IN_FLIGHT) -> None:
+        """Initialize the fleet."""
+        self.limiter = FairLimiter(max_in_flight)
+
+    @classmethod
+    def async_get(cls, hass: HomeAssistant) -> EvopellFleet:
+        """Return the fleet of this HA instance, creating it on first use."""
+        fleet: EvopellFleet | None = hass.data.get(DATA_FLEET)
+        if fleet is None:
+            fleet = hass.data[DATA_FLEET] = cls()
+        return fleet
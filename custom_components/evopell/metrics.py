@@ -0,0 +1,109 @@
+"""Lightweight rolling metrics of Evopell requests and refresh cycles."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+import math
+import time
+
+ENDPOINT_READ = "getregister"
+ENDPOINT_WRITE = "setregister"
+
+
+class RollingWindow:
+    """Last samples of a measurement, for percentiles."""
+
+    def __init__(self, size: int = 100) -> None:
+        """Initialize the window."""
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        self._samples.append(value)
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the nearest-rank percentile, or None without samples."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(
+            0, min(len(ordered) - 1, math.ceil(percent / 100 * len(ordered)) - 1)
+        )
+        return ordered[rank]
+
+    @property
+    def samples(self) -> list[float]:
+        """Return the samples, oldest first."""
+        return list(self._samples)
+
+    @property
+    def last(self) -> float | None:
+        """Return the most recent sample."""
+        return self._samples[-1] if self._samples else None
+
+
+@dataclass
+class HubMetrics:
+    """Counters and timings kept by the hub and its coordinator.
+
+    Czasy są w sekundach; sensory diagnostyczne przeliczają je na ms.
+    """
+
+    latency: dict[str, RollingWindow] = field(
+        default_factory=lambda: {
+            ENDPOINT_READ: RollingWindow(),
+            ENDPOINT_WRITE: RollingWindow(),
+        }
+    )
+    retries: int = 0
+    timeouts: int = 0
+    parse_time: RollingWindow = field(default_factory=RollingWindow)
+    fanout_time: RollingWindow = field(default_factory=RollingWindow)
+    cycle_time: RollingWindow = field(default_factory=RollingWindow)
+    cycle_overruns: int = 0
+    bytes_last_cycle: int | None = None
+    # Ostatnie błędy zapytań: (czas time.time(), endpoint, typ i status HTTP)
+    errors: deque[tuple[float, str, str]] = field(
+        default_factory=lambda: deque(maxlen=20)
+    )
+    _bytes: int = 0
+
+    def add_error(self, endpoint: str, err: Exception) -> None:
+        """Remember a failed request attempt.
+
+        Only the exception type and HTTP status are kept; the text of aiohttp
+        errors contains the URL and host of the device.
+        """
+        description = type(err).__name__
+        if (status := getattr(err, "status", None)) is not None:
+            description = f"{description}: HTTP {status}"
+        self.errors.append((time.time(), endpoint, description))
+
+    def add_bytes(self, count: int) -> None:
+        """Account response bytes of the current cycle."""
+        self._bytes += count
+
+    def start_cycle(self) -> None:
+        """Start accounting a refresh cycle."""
+        self._bytes = 0
+
+    def end_cycle(self, duration: float, interval: float | None) -> None:
+        """Finish a refresh cycle that took duration seconds."""
+        self.bytes_last_cycle = self._bytes
+        self.cycle_time.add(duration)
+        if interval is not None and duration > interval:
+            self.cycle_overruns += 1
+
+    def latency_ms(self, endpoint: str, percent: float) -> float | None:
+        """Return a latency percentile of an endpoint in milliseconds."""
+        return _ms(self.latency[endpoint].percentile(percent))
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+def window_ms(window: RollingWindow, percent: float | None = None) -> float | None:
+    """Return the last sample, or a percentile, of a window in milliseconds."""
+    return _ms(window.last if percent is None else window.percentile(percent))
@@ -1,23 +1,17 @@
 """Number platform for Evopell integration."""
 
-from dataclasses import replace
 import logging
 
 from homeassistant.components.number import NumberEntity, NumberEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME
+from homeassistant.const import CONF_NAME, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from . import EvopellCoordinator, EvopellEntity
-from .const import DOMAIN, EVOPELL_PARAM_MAP1
-from .utils import (
-    parse_number_device_class,
-    parse_number_mode,
-    parse_sensor_unit,
-    to_float,
-)
+from .catalog import TYPE_USER_NUMBER, get_catalog
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,41 +27,11 @@ async def async_setup_entry(
     evopell = hass.data[DOMAIN][name]["evopell"]
 
     entities = []
-    for tid, cfg in EVOPELL_PARAM_MAP1.items():
-        if cfg.get("type") != "number" and cfg.get("type") != "user_number":
-            continue
-
-        name = str(cfg.get("description", tid))
-        device_class = parse_number_device_class(cfg.get("device_class"))  # type: ignore[arg-type]
-        unit = parse_sensor_unit(cfg.get("native_unit_of_measurement"))  # type: ignore[arg-type]
-        icon = str(cfg.get("icon"))  # type: ignore[arg-type]
-        mode = parse_number_mode(cfg.get("mode"))  # type: ignore[arg-type]
-        step = to_float(str(cfg.get("step")))
-
-        entityDescription = NumberEntityDescription(
-            key=tid,
-            name=name,
-            device_class=device_class,
-            native_unit_of_measurement=unit,
-            icon=icon,
-            mode=mode,
-            native_step=step,
-        )
-        if cfg.get("type") == "number":
-            evopell.hub.param_map[tid] = name  # Register parameter in hub's param_map
-            entities.append(
-                EvopellNumber(
-                    evopell,
-                    entityDescription,
-                )
-            )
-        if cfg.get("type") == "user_number":
-            entities.append(
-                EvopellUserNumber(
-                    evopell,
-                    entityDescription,
-                )
-            )
+    for descriptor in get_catalog().by_platform[Platform.NUMBER]:
+        if descriptor.type == TYPE_USER_NUMBER:
+            entities.append(EvopellUserNumber(evopell, descriptor.entity_description))
+        else:
+            entities.append(EvopellNumber(evopell, descriptor.entity_description))
 
     async_add_entities(entities)
 
@@ -81,7 +45,7 @@ class EvopellNumber(EvopellEntity, NumberEntity):
         description: NumberEntityDescription,
     ) -> None:
         """Inicjalizuje encję sensora Evopell."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
         self.entity_description = description
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{self.coordinator.name}_{description.key}"
@@ -91,36 +55,21 @@ class EvopellNumber(EvopellEntity, NumberEntity):
         """Handle updated data from the coordinator."""
         register = self.coordinator.hub.registers_data.get(self.entity_description.key)
         if register:
-            if register.min_value is not None:
-                min_val = to_float(str(register.min_value))
-                if min_val is not None:
-                    self._attr_native_min_value = min_val
-            if register.max_value is not None:
-                max_val = to_float(str(register.max_value))
-                if max_val is not None:
-                    self._attr_native_max_value = max_val
+            if register.native_min_value is not None:
+                self._attr_native_min_value = register.native_min_value
+            if register.native_max_value is not None:
+                self._attr_native_max_value = register.native_max_value
 
         super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> float | None:
         """Get native value."""
-        tid = self.entity_description.key
-        _LOGGER.debug("Native value for number %s", tid)
-        result = None
-        if tid in self.coordinator.hub.registers_data:
-            register = self.coordinator.hub.registers_data[tid]
-            if register is not None:
-                result = register.value
-
-        if result is None and isinstance(self.coordinator.data, dict):
-            result = self.coordinator.data.get(tid)
-
-        if result is not None:
-            value = to_float(str(result))
-            return value if value is not None else 0.0
-
-        return None
+        register = self.coordinator.hub.registers_data.get(self.entity_description.key)
+        if register is None:
+            return None
+        value = register.native_value
+        return value if value is not None else 0.0
 
     async def async_set_native_value(self, value: float) -> None:
         """Change the selected value."""
@@ -136,19 +85,12 @@ class EvopellNumber(EvopellEntity, NumberEntity):
             return
         _LOGGER.debug("Written registers: %s", registers)
         for k in registers:
-            if k.status == "ok":
-                self.coordinator.data[k.tid] = k.value
-                if k.tid in self.coordinator.hub.registers_data:
-                    reg = self.coordinator.hub.registers_data[k.tid]
-                    self.coordinator.hub.registers_data[k.tid] = replace(
-                        reg,
-                        value=k.value,
-                        description=reg.description,
-                        min_value=reg.min_value,
-                        max_value=reg.max_value,
-                    )
-            else:
+            if k.status != "ok":
                 _LOGGER.error("Failed to write register %s: status %s", k.tid, k.status)
+        self.coordinator.async_set_written_values(registers)
+        self.coordinator.async_schedule_verify(
+            *(k.tid for k in registers if k.status == "ok")
+        )
         self.async_write_ha_state()
 
 
@@ -161,7 +103,7 @@ class EvopellUserNumber(EvopellEntity, NumberEntity, RestoreEntity):
         description: NumberEntityDescription,
     ) -> None:
         """Inicjalizuje encję sensora Evopell."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
         self.entity_description = description
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{self.coordinator.name}_{description.key}"
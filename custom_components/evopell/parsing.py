@@ -0,0 +1,57 @@
+"""XML parsing helpers for Evopell register responses."""
+
+from __future__ import annotations
+
+from defusedxml.ElementTree import DefusedXMLParser
+
+
+class _RegisterTarget:
+    """Parser target collecting attributes of closed <reg> elements."""
+
+    def __init__(self) -> None:
+        self.closed: list[dict[str, str]] = []
+        self._current: dict[str, str] | None = None
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        if tag == "reg":
+            self._current = attrib
+
+    def end(self, tag: str) -> None:
+        if tag == "reg" and self._current is not None:
+            self.closed.append(self._current)
+            self._current = None
+
+    def data(self, data: str) -> None:
+        """Ignore text content, the device sends everything in attributes."""
+
+    def close(self) -> None:
+        """Nothing to build, registers are handed out while feeding."""
+
+
+class RegisterStreamParser:
+    """Incremental parser emitting the attributes of each <reg> as it closes.
+
+    Raw response bytes are fed to the defusedxml expat parser (DTDs, entities
+    and external references stay forbidden) with a custom target, so neither
+    an element tree nor a decoded str of the whole body is ever built.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        self._target = _RegisterTarget()
+        self._parser = DefusedXMLParser(target=self._target)
+
+    def feed(self, data: bytes) -> list[dict[str, str]]:
+        """Feed a piece of the body; return registers closed in it."""
+        self._parser.feed(data)
+        return self._drain()
+
+    def close(self) -> list[dict[str, str]]:
+        """Finish parsing; return registers closed in the last piece."""
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> list[dict[str, str]]:
+        closed = self._target.closed
+        self._target.closed = []
+        return closed
@@ -0,0 +1,528 @@
+"""Full Evopell register list, imported lazily through const.EVOPELL_PARAM_MAP."""
+
+EVOPELL_PARAM_MAP = {
+    "device_id": "",
+    "device_name": "",
+    "device_type": "",
+    "device_soft_version": "",
+    "device_hard_version": "",
+    "auth_user": "",
+    "accesslevel": "",
+    "datetime": "",
+    "daytime": "",
+    "date": "",
+    "time": "",
+    "localtimezone": "",
+    "eth_mac": "",
+    "eth_ip": "",
+    "eth_mask": "",
+    "eth_gate": "",
+    "eth_dhcp": "",
+    "eth_ip_ro": "",
+    "eth_mask_ro": "",
+    "eth_gate_ro": "",
+    "eth_iface": "",
+    "remote_server_status": "",
+    "rf_module": "",
+    "rf_update": "",
+    "rf_offset": "",
+    "log": "",
+    "power_state": "",
+    "tkot_cal": "",
+    "tpow_cal": "",
+    "tpod_value": "",
+    "tpod_cal": "",
+    "tcwu_value": "",
+    "tcwu_cal": "",
+    "twew_value": "",
+    "twew_cal": "",
+    "tzew_value": "",
+    "tzew_cal": "",
+    "t1_cal": "",
+    "t2_value": "",
+    "t2_cal": "",
+    "tsp_cal": "",
+    "tzew_act": "",
+    "di_zawl": "",
+    "di_zas": "",
+    "di_alarm": "",
+    "di_termik": "",
+    "di_stb": "",
+    "di_rs_reset": "",
+    "di_rs_out": "",
+    "di_pod_state": "",
+    "di_term1": "",
+    "di_term2": "",
+    "out_pomp1": "",
+    "out_pomp2": "",
+    "out_cwu": "",
+    "out_miesz": "",
+    "out_pod": "",
+    "out_dm": "",
+    "out_zaw4d": "",
+    "out_aux": "",
+    "alarm_ipconflict": "",
+    "alarm_sdcard": "",
+    "alarm_tkot": "",
+    "alarm_tpow": "",
+    "alarm_tpod": "",
+    "alarm_tcwu": "",
+    "alarm_twew": "",
+    "alarm_tzew": "",
+    "alarm_t1": "",
+    "alarm_t2": "",
+    "alarm_tsp": "",
+    "alarm_termik": "",
+    "alarm_tkot_90": "",
+    "alarm_tpod_hi": "",
+    "alarm_pod_zaplon": "",
+    "alarm_zew": "",
+    "alarm_zasobnik": "",
+    "alarm_stb": "",
+    "alarm_out_pod": "",
+    "alarm_otw_zasob": "",
+    "alarm_tco1_hi": "",
+    "kot_tact": "",
+    "kot_prog": "",
+    "kot_tzad": "",
+    "kot_tobn": "",
+    "pog_en": "",
+    "pog_krzyw1": "",
+    "pog_krzyw2": "",
+    "kot_status": "",
+    "kot_st_tobn": "",
+    "ob1_typ": "",
+    "ob1_prog": "",
+    "ob1_tzad": "",
+    "ob1_tobn": "",
+    "ob1_tmax": "",
+    "ob1_pomp_on": "",
+    "ob1_pomp_off": "",
+    "ob1_pok_lo": "",
+    "ob1_pok_norm": "",
+    "ob1_pok_hi": "",
+    "ob1_pok_hist": "",
+    "ob1_pok_pre": "",
+    "ob1_pok_tact": "",
+    "ob1_pok_tzad": "",
+    "ob1_zaw4d_prog": "",
+    "ob1_zaw4d_tzad": "",
+    "ob1_pog_en": "",
+    "ob1_pog_krzyw1": "",
+    "ob1_pog_krzyw2": "",
+    "ob1_pump_pok": "",
+    "ob1_zaw4d_pos": "",
+    "ob1_pok_typ": "",
+    "ob1_zaw4d_max": "",
+    "ob2_typ": "",
+    "ob2_prog": "",
+    "ob2_tzad": "",
+    "ob2_tobn": "",
+    "ob2_tmax": "",
+    "ob2_pomp_on": "",
+    "ob2_pomp_off": "",
+    "ob2_pok_lo": "",
+    "ob2_pok_norm": "",
+    "ob2_pok_hi": "",
+    "ob2_pok_hist": "",
+    "ob2_pok_pre": "",
+    "ob2_pok_tact": "",
+    "ob2_pok_tzad": "",
+    "ob2_pok_typ": "",
+    "zima_lato": "",
+    "zima_lato_state": "",
+    "autolato_prog": "",
+    "autolato_tzew": "",
+    "tryb_auto_state": "Tryb pracy",
+    "autolato_hist": "",
+    "cwu_prog": "",
+    "cwu_tact": "",
+    "cwu_tzad": "",
+    "cwu_tobn": "",
+    "cwu_hist1": "",
+    "cwu_hist2": "",
+    "cwu_podb_kot": "",
+    "cwu_out_state": "",
+    "cwu_state": "",
+    "cwu_st_tobn": "",
+    "cyrk_prog": "",
+    "cyrk_pomp_on": "",
+    "cyrk_pomp_off": "",
+    "cyrk_pomp_ton": "",
+    "tpow_min": "",
+    "pomp_ton": "",
+    "tzew_sensor": "",
+    "ochr_pow": "",
+    "pomp_ext_func": "",
+    "pod_tmax": "",
+    "pod_typ": "",
+    "di_alarm_time": "",
+    "di_alarm_inv": "",
+    "di_alarm_stop": "",
+    "di_zas_en": "",
+    "di_zas_delay": "",
+    "install_type": "",
+    "zaw4d_open_time": "",
+    "zaw4d_hist": "",
+    "zaw4d_p": "",
+    "zaw4d_i": "",
+    "zaw4d_dir": "",
+    "fuel_level": "Poziom pelletu",
+    "fuel_level_enum": "",
+    "pod_run_time": "",
+    "pod_run_time_str": "",
+    "pod_run_time_last": "",
+    "pod_run_time_hour": "",
+    "next_fuel_time": "Data następnego zasypu",
+    "add_fuel": "Waga pelletu dodanego podczas zasypu",
+    "add_fuel_time": "",
+    "time_to_empty": "Czas oprożnienia zasobnika",
+    "stats_pwr": "",
+    "act_dm_speed": "",
+    "kot_hist": "",
+    "kot_hist2": "",
+    "pl_status": "",
+    "pl_fuel_flow": "",
+    "pl_flame": "",
+    "pl_flame_b": "",
+    "pl_tfire": "Ilość rozpaleń",
+    "pl_hfire": "",
+    "pl_power": "",
+    "pl_clean": "",
+    "pl_clean_toff": "Czas pomiędzy czyszczeniem",
+    "pl_roz_dm": "",
+    "pl_roz_fire": "",
+    "pl_roz_fuel": "",
+    "pl_roz_stab": "",
+    "pl_wyg_dm": "",
+    "pl_wyg_tmin": "",
+    "pl_wyg_tmax": "",
+    "pl_wyg_fire": "",
+    "pl_wyg_tclean": "Czas ruchu rusztu",
+    "pl_fuel_period": "Okres pracy podajnika",
+    "pl_calib_en": "",
+    "pl_calib_perf": "",
+    "pl_calib_time": "",
+    "pl_fuel_calor": "",
+    "pl_kot_pmax": "",
+    "pl_fuel_max": "Moc maksymalna",
+    "pl_fuel_min": "Moc minimalna",
+    "pl_dm_max": "Dmuchawa dla mocy maksymalnej",
+    "pl_dm_min": "Dmuchawa dla mocy mainimalnej",
+    "mpl_feed": "",
+    "mpl_heat": "",
+    "mpl_clean": "",
+    "mpl_temp": "",
+    "mpl_opto": "",
+    "mpl_dm_rpm": "Aktualne obroty dmuchawy",
+    "mpl_hall_en": "",
+    "mpl_dm_max": "",
+    "mpl_alarm": "",
+    "alarm_rozp": "",
+    "tr_gr_tsp": "",
+    "upd_fr_name": "",
+    "panel_cd1": "",
+    "en_scr": "",
+    "en_ext_out": "",
+    "upd_pgs": "",
+    "trv_calib_day": "",
+    "trv_calib_hour": "",
+    "trv_mode": "",
+    "wnd_time": "",
+    "wnd_hist": "",
+    "wnd_cfg": "",
+    "kot_tmin": "",
+    "pl_power_kw": "",
+    "exh_fan_speed": "",
+    "ob1_pl_wyg": "",
+    "ob2_pl_wyg": "",
+    "pid_k": "",
+    "pid_ti": "",
+    "pid_td": "",
+    "pid_factor": "",
+    "fuel_fill": "",
+    "pl_plimit": "Ograniczona moc kotła",
+    "burner": "",
+    "prot_serv": "",
+    "en_serv": "",
+    "pod_man_runtime": "",
+    "limit_power": "",
+    "mod1": "",
+    "mod2": "",
+    "mod2_imp_l": "Wydajność przepływomierza",
+    "mod2_flow": "",
+    "mod2_power": "",
+    "mod2_energy": "",
+    "exh_fan_mode": "",
+    "wh_global": "",
+    "wh_yr": "",
+    "wh_mon": "",
+    "ob3_typ": "",
+    "ob3_prog": "",
+    "ob3_tzad": "",
+    "ob3_tobn": "",
+    "ob3_tmax": "",
+    "ob3_pomp_on": "",
+    "ob3_pomp_off": "",
+    "ob3_pok_lo": "",
+    "ob3_pok_norm": "",
+    "ob3_pok_hi": "",
+    "ob3_pok_hist": "",
+    "ob3_pok_pre": "",
+    "ob3_pok_tact": "",
+    "ob3_pok_tzad": "",
+    "ob3_pok_typ": "",
+    "ob3_zaw4d_prog": "",
+    "ob3_zaw4d_tzad": "",
+    "ob3_pog_en": "",
+    "ob3_pog_krzyw1": "",
+    "ob3_pog_krzyw2": "",
+    "ob3_pump_pok": "",
+    "ob3_zaw4d_pos": "",
+    "ob3_zaw4d_max": "",
+    "ob3_out_pump": "",
+    "ob3_out_zaw4d": "",
+    "ob3_t1_alarm": "",
+    "ob3_t2_alarm": "",
+    "ob3_t1": "",
+    "ob3_t2": "",
+    "ob3_t1_cal": "",
+    "ob3_t2_cal": "",
+    "ob3_hitemp_alarm": "",
+    "ob3_mr3_alarm": "",
+    "ob3_di_term": "",
+    "ob3_zaw4d_open_time": "",
+    "ob3_zaw4d_hist": "",
+    "ob3_zaw4d_p": "",
+    "ob3_zaw4d_i": "",
+    "ob3_zaw4d_dir": "",
+    "ob3_pl_wyg": "",
+    "ob4_typ": "",
+    "ob4_prog": "",
+    "ob4_tzad": "",
+    "ob4_tobn": "",
+    "ob4_tmax": "",
+    "ob4_pomp_on": "",
+    "ob4_pomp_off": "",
+    "ob4_pok_lo": "",
+    "ob4_pok_norm": "",
+    "ob4_pok_hi": "",
+    "ob4_pok_hist": "",
+    "ob4_pok_pre": "",
+    "ob4_pok_tact": "",
+    "ob4_pok_tzad": "",
+    "ob4_pok_typ": "",
+    "ob4_zaw4d_prog": "",
+    "ob4_zaw4d_tzad": "",
+    "ob4_pog_en": "",
+    "ob4_pog_krzyw1": "",
+    "ob4_pog_krzyw2": "",
+    "ob4_pump_pok": "",
+    "ob4_zaw4d_pos": "",
+    "ob4_zaw4d_max": "",
+    "ob4_out_pump": "",
+    "ob4_out_zaw4d": "",
+    "ob4_t1_alarm": "",
+    "ob4_t2_alarm": "",
+    "ob4_t1": "",
+    "ob4_t2": "",
+    "ob4_t1_cal": "",
+    "ob4_t2_cal": "",
+    "ob4_hitemp_alarm": "",
+    "ob4_mr3_alarm": "",
+    "ob4_di_term": "",
+    "ob4_zaw4d_open_time": "",
+    "ob4_zaw4d_hist": "",
+    "ob4_zaw4d_p": "",
+    "ob4_zaw4d_i": "",
+    "ob4_zaw4d_dir": "",
+    "ob4_pl_wyg": "",
+    "ob5_typ": "",
+    "ob5_prog": "",
+    "ob5_tzad": "",
+    "ob5_tobn": "",
+    "ob5_tmax": "",
+    "ob5_pomp_on": "",
+    "ob5_pomp_off": "",
+    "ob5_pok_lo": "",
+    "ob5_pok_norm": "",
+    "ob5_pok_hi": "",
+    "ob5_pok_hist": "",
+    "ob5_pok_pre": "",
+    "ob5_pok_tact": "",
+    "ob5_pok_tzad": "",
+    "ob5_pok_typ": "",
+    "ob5_zaw4d_prog": "",
+    "ob5_zaw4d_tzad": "",
+    "ob5_pog_en": "",
+    "ob5_pog_krzyw1": "",
+    "ob5_pog_krzyw2": "",
+    "ob5_pump_pok": "",
+    "ob5_zaw4d_pos": "",
+    "ob5_zaw4d_max": "",
+    "ob5_out_pump": "",
+    "ob5_out_zaw4d": "",
+    "ob5_t1_alarm": "",
+    "ob5_t2_alarm": "",
+    "ob5_t1": "",
+    "ob5_t2": "",
+    "ob5_t1_cal": "",
+    "ob5_t2_cal": "",
+    "ob5_hitemp_alarm": "",
+    "ob5_mr3_alarm": "",
+    "ob5_di_term": "",
+    "ob5_zaw4d_open_time": "",
+    "ob5_zaw4d_hist": "",
+    "ob5_zaw4d_p": "",
+    "ob5_zaw4d_i": "",
+    "ob5_zaw4d_dir": "",
+    "ob5_pl_wyg": "",
+    "ob6_typ": "",
+    "ob6_prog": "",
+    "ob6_tzad": "",
+    "ob6_tobn": "",
+    "ob6_tmax": "",
+    "ob6_pomp_on": "",
+    "ob6_pomp_off": "",
+    "ob6_pok_lo": "",
+    "ob6_pok_norm": "",
+    "ob6_pok_hi": "",
+    "ob6_pok_hist": "",
+    "ob6_pok_pre": "",
+    "ob6_pok_tact": "",
+    "ob6_pok_tzad": "",
+    "ob6_pok_typ": "",
+    "ob6_zaw4d_prog": "",
+    "ob6_zaw4d_tzad": "",
+    "ob6_pog_en": "",
+    "ob6_pog_krzyw1": "",
+    "ob6_pog_krzyw2": "",
+    "ob6_pump_pok": "",
+    "ob6_zaw4d_pos": "",
+    "ob6_zaw4d_max": "",
+    "ob6_out_pump": "",
+    "ob6_out_zaw4d": "",
+    "ob6_t1_alarm": "",
+    "ob6_t2_alarm": "",
+    "ob6_t1": "",
+    "ob6_t2": "",
+    "ob6_t1_cal": "",
+    "ob6_t2_cal": "",
+    "ob6_hitemp_alarm": "",
+    "ob6_mr3_alarm": "",
+    "ob6_di_term": "",
+    "ob6_zaw4d_open_time": "",
+    "ob6_zaw4d_hist": "",
+    "ob6_zaw4d_p": "",
+    "ob6_zaw4d_i": "",
+    "ob6_zaw4d_dir": "",
+    "ob6_pl_wyg": "",
+    "prod_date": "",
+    "rf_status": "",
+    "node_add": "",
+    "node_del": "",
+    "node_st": "",
+    "node_time": "",
+    "ob1_pok_heat": "",
+    "ob2_pok_heat": "",
+    "ob3_pok_heat": "",
+    "ob4_pok_heat": "",
+    "ob5_pok_heat": "",
+    "ob6_pok_heat": "",
+    "pl_roz_tmax": "",
+    "pl_roz_dm2": "",
+    "pl_roz_theat": "",
+    "pl_min_time": "",
+    "pl_tptotal": "",
+    "mpl_di_hall2": "",
+    "dp_value": "",
+    "dp_alarm": "",
+    "pl_roz_tsp": "",
+    "pl_wyg_tsp": "",
+    "alarm_poz_ruszt": "",
+    "dm_set_rpm": "Ustaw obrotów dmuchawy",
+    "pod_ton": "Czas pracy podajnika",
+    "pod_toff": "Czas przerwy podajnika",
+    "pl_stab_fuel": "",
+    "pl_stab_dm": "",
+    "rp_min_cis": "",
+    "rp_min_obr": "",
+    "rp_min_hist": "",
+    "rp_max_cis": "",
+    "rp_max_obr": "",
+    "rp_max_hist": "",
+    "rp_kor_obr": "",
+    "rp_delay": "",
+    "rp_active": "",
+    "od_cis": "",
+    "od_delay": "",
+    "alarm_cis": "",
+    "typ_kotla": "",
+    "proc_state": "",
+    "proc_time": "",
+    "przedm_en": "",
+    "przedm_toff": "",
+    "przedm_ton": "",
+    "przedm_dm": "",
+    "pl_status_ext": "",
+    "clean_hsleep": "",
+    "clean_tsleep": "",
+    "proc_stop": "",
+    "dop_dm_up": "",
+    "dop_wait": "",
+    "clean_burn_time": "",
+    "clean_act_kg": "",
+    "clean_exch_kg": "",
+    "alarm_clean_exch": "",
+    "od_pmin": "",
+    "pl_wyg_state": "",
+    "lcd_hdr": "",
+    "dp_en": "",
+    "pl_wyg_cnt": "",
+    "out_clean_wym": "",
+    "clwym_en": "",
+    "alarm_clwym": "",
+    "clwym_toff": "",
+    "clwym_ton": "",
+    "clwym_err": "",
+    "clwym_time": "",
+    "pl_cykl_pmax": "",
+    "pl_ruszt_en": "",
+    "tank_en": "",
+    "fun_cwu": "",
+    "temp_tank_hi": "",
+    "tank_hi_cal": "Poprawka temperatury bufora góra",
+    "temp_tank_lo": "",
+    "tank_lo_cal": "Poprawka temperatury bufora dół",
+    "alarm_tank_hi": "",
+    "alarm_tank_lo": "",
+    "alarm_tank_hitemp": "",
+    "out_tank": "",
+    "tank_tzad": "",
+    "tank_hist": "",
+    "pomp_co_ton": "",
+    "dm_man": "",
+    "hist_pump": "",
+    "hist_miesz": "",
+    "hist_pump_co": "",
+    "wsp_moc": "",
+    "clsln_en": "",
+    "clsln_ton": "",
+    "clsln_toff": "",
+    "clsln_dm": "",
+    "fire_time": "",
+    "alarm_rozp_ext": "",
+    "silent": "",
+    "ob1_term_delay": "",
+    "ob1_term_state": "",
+    "ob2_term_delay": "",
+    "ob2_term_state": "",
+    "ob3_term_delay": "",
+    "ob3_term_state": "",
+    "ob4_term_delay": "",
+    "ob4_term_state": "",
+    "ob5_term_delay": "",
+    "ob5_term_state": "",
+    "ob6_term_delay": "",
+    "ob6_term_state": "",
+}
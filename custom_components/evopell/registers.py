@@ -0,0 +1,255 @@
+"""Compact columnar storage for register values read from the device."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator, Mapping
+from datetime import UTC, datetime
+import math
+import sys
+
+from .const import VALUE_TYPE_FLOAT, VALUE_TYPE_RAW, VALUE_TYPE_TIMESTAMP
+
+NativeValue = str | float | datetime | None
+
+
+def _to_float(value: str | None, divider: float) -> float | None:
+    """Convert a device string to float, divided and rounded like the UI shows it."""
+    if value is None:
+        return None
+    try:
+        number = float(value.strip().replace(",", "."))
+    except ValueError:
+        return None
+    return number if divider == 1.0 else round(number / divider, 2)
+
+
+def _to_datetime(value: str) -> datetime | None:
+    """Convert an epoch timestamp string to an aware UTC datetime."""
+    try:
+        return datetime.fromtimestamp(int(value), tz=UTC)
+    except (ValueError, OverflowError, OSError):
+        return None
+
+
+class RegisterView:
+    """Read-only view of one register slot in a RegisterTable."""
+
+    __slots__ = ("_slot", "_table", "tid")
+
+    def __init__(self, table: RegisterTable, slot: int, tid: str) -> None:
+        """Initialize the view."""
+        self._table = table
+        self._slot = slot
+        self.tid = tid
+
+    @property
+    def value(self) -> str:
+        """Return the last value read from the device."""
+        return self._table.raw_values[self._slot]
+
+    @property
+    def min_value(self) -> str | None:
+        """Return the lower bound reported by the device."""
+        return self._table.raw_min_values[self._slot]
+
+    @property
+    def max_value(self) -> str | None:
+        """Return the upper bound reported by the device."""
+        return self._table.raw_max_values[self._slot]
+
+    @property
+    def native_value(self) -> NativeValue:
+        """Return the value decoded to the register's declared type."""
+        return self._table.native_values[self._slot]
+
+    @property
+    def native_min_value(self) -> float | None:
+        """Return the decoded lower bound of a numeric register."""
+        return self._table.native_min_values[self._slot]
+
+    @property
+    def native_max_value(self) -> float | None:
+        """Return the decoded upper bound of a numeric register."""
+        return self._table.native_max_values[self._slot]
+
+    @property
+    def description(self) -> str | None:
+        """Return the register description from the catalog."""
+        return self._table.descriptions[self._slot]
+
+    @property
+    def updated_at(self) -> float | None:
+        """Return time.monotonic() of the last read, None if never read live."""
+        updated_at = self._table.updated_at[self._slot]
+        return None if math.isnan(updated_at) else updated_at
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return (
+            f"RegisterView(tid={self.tid!r}, value={self.value!r}, "
+            f"min_value={self.min_value!r}, max_value={self.max_value!r})"
+        )
+
+
+class RegisterValues(Mapping[str, str]):
+    """Read-only tid -> value mapping backed by a RegisterTable."""
+
+    __slots__ = ("_table",)
+
+    def __init__(self, table: RegisterTable) -> None:
+        """Initialize the mapping."""
+        self._table = table
+
+    def __getitem__(self, tid: str) -> str:
+        """Return the value of a register."""
+        return self._table.raw_values[self._table.slots[tid]]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over register tids."""
+        return iter(self._table.tids)
+
+    def __len__(self) -> int:
+        """Return the number of registers."""
+        return len(self._table.tids)
+
+
+class RegisterTable(Mapping[str, RegisterView]):
+    """Register values kept in parallel columns indexed by a fixed slot per tid.
+
+    Slot jest przydzielany raz, przy pierwszym odczycie rejestru; kolejne
+    odczyty nadpisują kolumny w miejscu. Widoki dla encji i mapa wartości dla
+    koordynatora powstają raz, więc odpytywanie nie tworzy nowych obiektów.
+
+    Obok surowych napisów tabela trzyma wartości zdekodowane według typu
+    zadeklarowanego w katalogu. Dekodowane są tylko rejestry zmienione od
+    ostatniego decode_pending(), raz na odpowiedź urządzenia.
+
+    Kolumny (tids, slots, raw_values, native_values, ...) są publiczne tylko
+    do odczytu przez widoki; zapisuje je wyłącznie update() i decode_pending().
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self.slots: dict[str, int] = {}
+        self.tids: list[str] = []
+        self.raw_values: list[str] = []
+        self.raw_min_values: list[str | None] = []
+        self.raw_max_values: list[str | None] = []
+        self.descriptions: list[str | None] = []
+        self.updated_at = array("d")
+        self._value_types: list[str] = []
+        self._dividers = array("d")
+        self.native_values: list[NativeValue] = []
+        self.native_min_values: list[float | None] = []
+        self.native_max_values: list[float | None] = []
+        self._views: list[RegisterView] = []
+        self._declared: dict[str, tuple[str, float]] = {}
+        self._dirty: list[int] = []
+        self.value_map = RegisterValues(self)
+
+    def declare(self, tid: str, value_type: str, divider: int | None = None) -> None:
+        """Declare how values of a register are decoded."""
+        divisor = float(divider or 1)
+        self._declared[tid] = (value_type, divisor)
+        if (slot := self.slots.get(tid)) is not None:
+            self._value_types[slot] = value_type
+            self._dividers[slot] = divisor
+            self._dirty.append(slot)
+
+    def __getitem__(self, tid: str) -> RegisterView:
+        """Return the view of a register."""
+        return self._views[self.slots[tid]]
+
+    def __contains__(self, tid: object) -> bool:
+        """Return True if the register was ever stored."""
+        return tid in self.slots
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over register tids in slot order."""
+        return iter(self.tids)
+
+    def __len__(self) -> int:
+        """Return the number of registers."""
+        return len(self.tids)
+
+    def update(
+        self,
+        tid: str,
+        value: str,
+        min_value: str | None,
+        max_value: str | None,
+        updated_at: float | None,
+        description: str | None = None,
+    ) -> bool:
+        """Store a register read; return True if value, min or max changed.
+
+        updated_at is None for values not read live, e.g. restored from a
+        snapshot. The description is only used when the register gets its slot.
+        """
+        # Kolumna array("d") nie przechowuje None, brak odczytu zapisujemy jako NaN
+        if updated_at is None:
+            updated_at = math.nan
+        slot = self.slots.get(tid)
+        if slot is None:
+            slot = len(self.tids)
+            self.slots[tid] = slot
+            self.tids.append(tid)
+            self.raw_values.append(value)
+            self.raw_min_values.append(min_value)
+            self.raw_max_values.append(max_value)
+            self.descriptions.append(
+                sys.intern(description) if description is not None else None
+            )
+            self.updated_at.append(updated_at)
+            value_type, divider = self._declared.get(tid, (VALUE_TYPE_RAW, 1.0))
+            self._value_types.append(value_type)
+            self._dividers.append(divider)
+            self.native_values.append(None)
+            self.native_min_values.append(None)
+            self.native_max_values.append(None)
+            self._views.append(RegisterView(self, slot, tid))
+            self._dirty.append(slot)
+            return True
+
+        self.updated_at[slot] = updated_at
+        if (
+            self.raw_values[slot] == value
+            and self.raw_min_values[slot] == min_value
+            and self.raw_max_values[slot] == max_value
+        ):
+            return False
+        self.raw_values[slot] = value
+        self.raw_min_values[slot] = min_value
+        self.raw_max_values[slot] = max_value
+        self._dirty.append(slot)
+        return True
+
+    def set_value(self, tid: str, value: str) -> bool:
+        """Overwrite the value of a known register, e.g. after a write."""
+        slot = self.slots.get(tid)
+        if slot is None:
+            return False
+        self.raw_values[slot] = value
+        self._dirty.append(slot)
+        self.decode_pending()
+        return True
+
+    def decode_pending(self) -> None:
+        """Decode registers stored or changed since the last call."""
+        dirty, self._dirty = self._dirty, []
+        types = self._value_types
+        for slot in dirty:
+            if types[slot] == VALUE_TYPE_FLOAT:
+                divider = self._dividers[slot]
+                self.native_values[slot] = _to_float(self.raw_values[slot], divider)
+                self.native_min_values[slot] = _to_float(
+                    self.raw_min_values[slot], divider
+                )
+                self.native_max_values[slot] = _to_float(
+                    self.raw_max_values[slot], divider
+                )
+            elif types[slot] == VALUE_TYPE_TIMESTAMP:
+                self.native_values[slot] = _to_datetime(self.raw_values[slot])
+            else:
+                self.native_values[slot] = self.raw_values[slot]
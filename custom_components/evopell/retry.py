@@ -0,0 +1,111 @@
+"""Retry policy and circuit breaker for Evopell requests."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import random
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a device known to be unreachable."""
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Exponential backoff with jitter between attempts of one request."""
+
+    max_retries: int = 3
+    base_delay: float = 1.5
+    max_delay: float = 30.0
+    jitter: float = 0.5
+
+    def delay(self, attempt: int) -> float:
+        """Return how long to wait after the given failed attempt (1-based)."""
+        backoff = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(backoff * (1 - self.jitter), backoff)
+
+
+class CircuitBreaker:
+    """Per-device circuit breaker.
+
+    After failure_threshold consecutive network failures the circuit opens and
+    requests fail fast with CircuitOpenError. Once reset_timeout passes a
+    single probe request is let through (half-open); its result closes the
+    circuit again or re-opens it for another reset_timeout.
+    """
+
+    def __init__(
+        self, name: str, failure_threshold: int = 5, reset_timeout: float = 60.0
+    ) -> None:
+        """Initialize the circuit breaker."""
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CIRCUIT_CLOSED
+        self.trips = 0
+        self.recoveries = 0
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def before_request(self) -> bool:
+        """Raise CircuitOpenError if the request must not be sent now.
+
+        Returns True when the request is the half-open probe; the caller has
+        to call release_probe() once it ends, whatever the outcome.
+        """
+        if self.state == CIRCUIT_CLOSED:
+            return False
+        if self.state == CIRCUIT_OPEN:
+            remaining = self._opened_at + self.reset_timeout - time.monotonic()
+            if remaining > 0:
+                raise CircuitOpenError(
+                    f"{self.name} unreachable, next probe in {remaining:.0f}s"
+                )
+            self.state = CIRCUIT_HALF_OPEN
+        if self._probe_in_flight:
+            raise CircuitOpenError(f"{self.name} unreachable, probe in progress")
+        self._probe_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """Account a request answered by the device."""
+        if self.state != CIRCUIT_CLOSED:
+            self.recoveries += 1
+            _LOGGER.info("%s is reachable again, closing circuit", self.name)
+        self.state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Let the next request probe the device if the probe had no outcome."""
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Account a request that did not reach the device."""
+        self._probe_in_flight = False
+        if self.state == CIRCUIT_HALF_OPEN:
+            self._open()
+            return
+        self._failures += 1
+        if self.state == CIRCUIT_CLOSED and self._failures >= self.failure_threshold:
+            self.trips += 1
+            _LOGGER.warning(
+                "%s failed %d times in a row, failing fast for %.0fs",
+                self.name,
+                self._failures,
+                self.reset_timeout,
+            )
+            self._open()
+
+    def _open(self) -> None:
+        self.state = CIRCUIT_OPEN
+        self._opened_at = time.monotonic()
@@ -0,0 +1,84 @@
+"""Scan interval adapted to the state of the boiler."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+import logging
+
+from .const import (
+    MIN_SCAN_INTERVAL,
+    SCAN_INTERVAL_ALARM,
+    SCAN_INTERVAL_ALARM_REGISTERS,
+    SCAN_INTERVAL_FACTORS,
+    SCAN_INTERVAL_SLOWDOWN_AFTER,
+    SCAN_INTERVAL_STATE_REGISTER,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AdaptiveScanInterval:
+    """Pick the update interval from pl_status and alarm registers.
+
+    Interwał to skonfigurowany scan_interval pomnożony przez współczynnik
+    stanu kotła. Przyspieszenie następuje od razu, a zwolnienie dopiero po
+    SCAN_INTERVAL_SLOWDOWN_AFTER kolejnych odczytach wolniejszego stanu, więc
+    chwilowe zmiany statusu nie powodują skakania interwału.
+    """
+
+    def __init__(self, base_interval: float) -> None:
+        """Initialize with the interval configured by the user."""
+        self.base_interval = base_interval
+        self.state: str | None = None
+        self._candidate: str | None = None
+        self._candidate_count = 0
+
+    @property
+    def interval(self) -> float:
+        """Return the interval for the current state in seconds."""
+        return self._interval_for(self.state)
+
+    def update(self, values: Mapping[str, str]) -> bool:
+        """Feed the latest register values; return True if the interval changed."""
+        observed = self._observed_state(values)
+        if observed == self.state:
+            self._candidate = None
+            self._candidate_count = 0
+            return False
+
+        if self._interval_for(observed) < self.interval:
+            return self._switch(observed)
+
+        if observed != self._candidate:
+            self._candidate = observed
+            self._candidate_count = 0
+        self._candidate_count += 1
+        if self._candidate_count < SCAN_INTERVAL_SLOWDOWN_AFTER:
+            return False
+        return self._switch(observed)
+
+    def _switch(self, state: str | None) -> bool:
+        previous = self.interval
+        self.state = state
+        self._candidate = None
+        self._candidate_count = 0
+        _LOGGER.debug(
+            "Boiler state %s, scan interval %.0fs -> %.0fs",
+            state,
+            previous,
+            self.interval,
+        )
+        return self.interval != previous
+
+    def _interval_for(self, state: str | None) -> float:
+        factor = SCAN_INTERVAL_FACTORS.get(state, 1.0) if state is not None else 1.0
+        # Krótszy interwał niż MIN_SCAN_INTERVAL tylko, jeśli ustawił go użytkownik
+        floor = min(MIN_SCAN_INTERVAL, self.base_interval)
+        return max(floor, self.base_interval * factor)
+
+    @staticmethod
+    def _observed_state(values: Mapping[str, str]) -> str | None:
+        for tid, alarm_value in SCAN_INTERVAL_ALARM_REGISTERS.items():
+            if values.get(tid) == alarm_value:
+                return SCAN_INTERVAL_ALARM
+        return values.get(SCAN_INTERVAL_STATE_REGISTER)
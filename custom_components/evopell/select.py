@@ -1,16 +1,17 @@
 """async_setup_entry dla select Evopell."""
 
-from dataclasses import replace
+from collections.abc import Mapping
 import logging
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME
+from homeassistant.const import CONF_NAME, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import EvopellCoordinator, EvopellEntity
-from .const import DOMAIN, EVOPELL_PARAM_MAP1, EVOPELL_PARMAS_TO_TEXT_MAP
+from .catalog import get_catalog
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,43 +25,16 @@ async def async_setup_entry(
     name = config_entry.data[CONF_NAME]
     evopell = hass.data[DOMAIN][name]["evopell"]
 
-    entities = []
-    for tid, cfg in EVOPELL_PARAM_MAP1.items():
-        if cfg.get("type") != "script":
-            continue
-
-        name = str(cfg.get("description", tid))
-        options_dict = cfg.get("options")
-        if not isinstance(options_dict, dict):
-            continue
-        options = list(options_dict.keys())
-
-        entities.append(
-            EvopellSelect(
-                evopell,
-                SelectEntityDescription(
-                    key=tid,
-                    name=name,
-                    options=options,
-                ),
-                readOnly=False,
-                registers=options_dict,
-            )
-        )
-
-    for k, v in EVOPELL_PARMAS_TO_TEXT_MAP.items():
-        entities.append(
-            EvopellSelect(
-                evopell,
-                SelectEntityDescription(
-                    key=k,
-                    name=str(EVOPELL_PARAM_MAP1[k].get("description", k)),
-                    options=list(v.values()),
-                ),
-                readOnly=True,
-                registers=None,
-            )
+    entities = [
+        EvopellSelect(
+            evopell,
+            descriptor.entity_description,
+            readOnly=descriptor.options is None,
+            registers=descriptor.options,
+            text_map=descriptor.text_map,
         )
+        for descriptor in get_catalog().by_platform[Platform.SELECT]
+    ]
 
     async_add_entities(entities)
 
@@ -73,15 +47,17 @@ class EvopellSelect(EvopellEntity, SelectEntity):
         coordinator: EvopellCoordinator,
         description: SelectEntityDescription,
         readOnly: bool,
-        registers: dict[str, dict[str, str]] | None,
+        registers: Mapping[str, Mapping[str, str]] | None,
+        text_map: Mapping[str, str] | None = None,
     ) -> None:
         """Inicjalizuje encję sensora Evopell."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
         self.entity_description = description
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{self.coordinator.name}_{description.key}"
         self._registers = registers
         self._readOnly = readOnly
+        self._text_map = text_map
 
     @property
     def current_option(self) -> str | None:
@@ -94,8 +70,7 @@ class EvopellSelect(EvopellEntity, SelectEntity):
                 _LOGGER.debug(
                     "Value for select %s: %s", self.entity_description.key, value
                 )
-                if self.entity_description.key in EVOPELL_PARMAS_TO_TEXT_MAP:
-                    text_map = EVOPELL_PARMAS_TO_TEXT_MAP[self.entity_description.key]
+                if (text_map := self._text_map) is not None:
                     _LOGGER.debug(
                         "Text map for select %s: %s -> %s",
                         self.entity_description.key,
@@ -119,7 +94,7 @@ class EvopellSelect(EvopellEntity, SelectEntity):
                     _LOGGER.debug("Would write %s to register %s", v, k)
 
                 registers = await self.coordinator.hub.async_write_register_values(
-                    0, self._registers[option]
+                    0, dict(self._registers[option])
                 )
                 if not registers:
                     _LOGGER.debug("No registers written")
@@ -127,23 +102,13 @@ class EvopellSelect(EvopellEntity, SelectEntity):
 
                 _LOGGER.debug("Written registers: %s", registers)
                 for k in registers:
-                    if k.status == "ok":
-                        if k.tid in self.coordinator.hub.registers_data:
-                            self.coordinator.data[k.tid] = k.value
-                            _LOGGER.debug(
-                                "Updated coordinator data: %s to %s", k.tid, k.value
-                            )
-                            reg = self.coordinator.hub.registers_data[k.tid]
-                            self.coordinator.hub.registers_data[k.tid] = replace(
-                                reg,
-                                value=k.value,
-                                description=reg.description,
-                                min_value=reg.min_value,
-                                max_value=reg.max_value,
-                            )
-                    else:
+                    if k.status != "ok":
                         _LOGGER.error(
                             "Failed to write register %s: status %s", k.tid, k.status
                         )
+                self.coordinator.async_set_written_values(registers)
+                self.coordinator.async_schedule_verify(
+                    *(k.tid for k in registers if k.status == "ok")
+                )
 
         self.async_write_ha_state()
@@ -3,29 +3,39 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 import logging
+from typing import Any
 
 from homeassistant.components.sensor import (
+    SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME
+from homeassistant.const import (
+    CONF_NAME,
+    EntityCategory,
+    Platform,
+    UnitOfInformation,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.typing import StateType
 
 from . import EvopellCoordinator, EvopellEntity
-from .const import DOMAIN, EVOPELL_PARAM_MAP1, EVOPELL_PARMAS_TO_TEXT_MAP
-from .store import AvgStore
+from .catalog import get_catalog
+from .const import DOMAIN
+from .evopell import EvopellHub
+from .metrics import ENDPOINT_READ, ENDPOINT_WRITE, window_ms
+from .store import AvgState, AvgStore
 from .utils import (
-    epoch_to_datetime,
     find_sensor_entity_id,
     parse_float,
-    parse_sensor_device_class,
-    parse_sensor_state_class,
-    parse_sensor_unit,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,6 +43,176 @@ _LOGGER = logging.getLogger(__name__)
 EVOPELL_WORK_STATUS = "2"
 
 
+@dataclass(frozen=True, kw_only=True)
+class EvopellDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor reporting the state of the hub itself."""
+
+    value_fn: Callable[[EvopellHub], StateType]
+    attr_fn: Callable[[EvopellHub], dict[str, Any]] | None = None
+
+
+DIAGNOSTIC_SENSORS: tuple[EvopellDiagnosticSensorEntityDescription, ...] = (
+    EvopellDiagnosticSensorEntityDescription(
+        key="chunk_size",
+        name="Rejestrów w zapytaniu",
+        icon="mdi:format-list-numbered",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda hub: hub.tuner.chunk_size,
+    ),
+    EvopellDiagnosticSensorEntityDescription(
+        key="concurrency",
+        name="Równoległe zapytania",
+        icon="mdi:arrow-split-vertical",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda hub: hub.tuner.concurrency,
+    ),
+    EvopellDiagnosticSensorEntityDescription(
+        key="connections_created",
+        name="Nawiązane połączenia",
+        icon="mdi:lan-connect",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda hub: hub.connections_created,
+    ),
+    EvopellDiagnosticSensorEntityDescription(
+        key="connections_reused",
+        name="Ponownie użyte połączenia",
+        icon="mdi:lan-check",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda hub: hub.connections_reused,
+    ),
+    EvopellDiagnosticSensorEntityDescription(
+        key="circuit_trips",
+        name="Utraty połączenia",
+        icon="mdi:lan-disconnect",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda hub: hub.circuit_breaker.trips,
+    ),
+    EvopellDiagnosticSensorEntityDescription(
+        key="circuit_recoveries",
+        name="Przywrócenia połączenia",
+        icon="mdi:lan-check",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda hub: hub.circuit_breaker.recoveries,
+    ),
+    EvopellDiagnosticSensorEntityDescription(
+        key="quarantined_registers",
+        name="Rejestry z błędem",
+        icon="mdi:alert-circle-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda hub: len(hub.quarantined_registers),
+        attr_fn=lambda hub: hub.quarantined_registers,
+    ),
+    EvopellDiagnosticSensorEntityDescription(
+        key="read_latency_p50",
+        name="Czas odczytu (mediana)",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda hub: hub.metrics.latency_ms(ENDPOINT_READ, 50),
+    ),
+    EvopellDiagnosticSensorEntityDescription(
+        key="read_latency_p95",
+        name="Czas odczytu (p95)",
+        icon="mdi:timer-alert-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda hub: hub.metrics.latency_ms(ENDPOINT_READ, 95),
+    ),
+    EvopellDiagnosticSensorEntityDescription(
+        key="write_latency_p95",
+        name="Czas zapisu (p95)",
+        icon="mdi:timer-edit-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda hub: hub.metrics.latency_ms(ENDPOINT_WRITE, 95),
+    ),
+    EvopellDiagnosticSensorEntityDescription(
+        key="request_retries",
+        name="Ponowione zapytania",
+        icon="mdi:repeat",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda hub: hub.metrics.retries,
+    ),
+    EvopellDiagnosticSensorEntityDescription(
+        key="request_timeouts",
+        name="Przekroczenia czasu zapytań",
+        icon="mdi:timer-off-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda hub: hub.metrics.timeouts,
+    ),
+    EvopellDiagnosticSensorEntityDescription(
+        key="bytes_per_cycle",
+        name="Dane w cyklu odczytu",
+        icon="mdi:download-network-outline",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda hub: hub.metrics.bytes_last_cycle,
+    ),
+    EvopellDiagnosticSensorEntityDescription(
+        key="parse_time",
+        name="Czas parsowania (p95)",
+        icon="mdi:code-tags",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda hub: window_ms(hub.metrics.parse_time, 95),
+    ),
+    EvopellDiagnosticSensorEntityDescription(
+        key="fanout_time",
+        name="Czas powiadamiania encji",
+        icon="mdi:broadcast",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda hub: window_ms(hub.metrics.fanout_time),
+    ),
+    EvopellDiagnosticSensorEntityDescription(
+        key="cycle_time",
+        name="Czas cyklu odczytu",
+        icon="mdi:timer-sync-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda hub: window_ms(hub.metrics.cycle_time),
+    ),
+    EvopellDiagnosticSensorEntityDescription(
+        key="cycle_overruns",
+        name="Przekroczenia interwału odczytu",
+        icon="mdi:clock-alert-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda hub: hub.metrics.cycle_overruns,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -43,68 +223,31 @@ async def async_setup_entry(
     evopell = hass.data[DOMAIN][name]["evopell"]
 
     entities = []
-    for tid, cfg in EVOPELL_PARAM_MAP1.items():
-        if cfg.get("type") != "sensor":
-            continue
-
-        name = str(cfg.get("description", tid))
-
-        evopell.hub.param_map[tid] = name  # Register parameter in hub's param_map
-        device_class = parse_sensor_device_class(cfg.get("device_class"))  # type: ignore[arg-type]
-        unit = parse_sensor_unit(cfg.get("native_unit_of_measurement"))  # type: ignore[arg-type]
-        state_class = parse_sensor_state_class(cfg.get("state_class"))  # type: ignore[arg-type]
-        icon = cfg.get("icon")  # type: ignore[arg-type]
-        divider = cfg.get("divider")  # type: ignore[arg-type]
-
-        if icon:
-            icon_str = str(icon)
-        else:
-            icon_str = None
-
-        if divider:
-            divider_int = int(str(divider))
-            if divider_int <= 1:
-                divider_int = None
-        else:
-            divider_int = None
-
-        avg = cfg.get("avg")  # type: ignore[arg-type]
-        if avg:
-            avg_str = str(avg)
-        else:
-            avg_str = None
-        try:
-            display_precision = int(str(cfg.get("display_precision")))
-        except ValueError:
-            display_precision = None
-
+    for descriptor in get_catalog().by_platform[Platform.SENSOR]:
         entities.append(
             EvopellSensor(
                 evopell,
-                SensorEntityDescription(
-                    key=tid,
-                    name=name,
-                    device_class=device_class,
-                    native_unit_of_measurement=unit,
-                    state_class=state_class,
-                    icon=icon_str,
-                    suggested_display_precision=display_precision,
-                ),
-                divider=divider_int,
+                descriptor.entity_description,
+                text_attributes=descriptor.text_attributes,
             )
         )
-        if avg_str is not None:
-            _LOGGER.debug("Creating EvopellAverageSensor for %s", tid)
+        if descriptor.avg_name is not None:
+            _LOGGER.debug("Creating EvopellAverageSensor for %s", descriptor.tid)
             avg = EvopellAverageSensor(
                 hass,
                 evopell,
                 config_entry,
-                name=avg_str,
-                source_key=tid,
+                name=descriptor.avg_name,
+                source_key=descriptor.tid,
             )
-            evopell.avg[tid] = avg
+            evopell.avg[descriptor.tid] = avg
             entities.append(avg)
 
+    entities.extend(
+        EvopellDiagnosticSensor(evopell, description)
+        for description in DIAGNOSTIC_SENSORS
+    )
+
     async_add_entities(entities)
 
 
@@ -115,38 +258,20 @@ class EvopellSensor(EvopellEntity, SensorEntity):
         self,
         coordinator: EvopellCoordinator,
         description: SensorEntityDescription,
-        divider: int | None = None,
+        text_attributes: Mapping[str, str] | None = None,
     ) -> None:
         """Inicjalizuje encję sensora Evopell."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key.removesuffix("_text"))
         self.entity_description = description
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{self.coordinator.name}_{description.key}"
-        if divider is None or divider <= 1:
-            self._divider = None
-        else:
-            self._divider = divider
+        self._text_attributes = text_attributes
 
     @property
     def native_value(self):
-        """Zwraca wartość sensora."""
-        tid = self.entity_description.key
-        _LOGGER.debug("Native value for sensor %s", tid)
-        result = None
-        if tid in self.coordinator.hub.registers_data:
-            register = self.coordinator.hub.registers_data[tid]
-            if register is not None:
-                result = register.value
-        if result is None and isinstance(self.coordinator.data, dict):
-            result = self.coordinator.data.get(tid)
-
-        if result is not None and self.entity_description.device_class == "timestamp":
-            result = epoch_to_datetime(result)
-
-        if result is not None and self._divider is not None:
-            result = round(float(str(result)) / self._divider, 2)
-
-        return result
+        """Zwraca wartość sensora, zdekodowaną przez hub przy odczycie."""
+        register = self.coordinator.hub.registers_data.get(self.entity_description.key)
+        return None if register is None else register.native_value
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -168,14 +293,41 @@ class EvopellSensor(EvopellEntity, SensorEntity):
                     extra_attrs["min"] = register.min_value
                 if register.max_value:
                     extra_attrs["max"] = register.max_value
-                if tid in EVOPELL_PARMAS_TO_TEXT_MAP:
-                    extra_attrs.update(
-                        {v: k for k, v in EVOPELL_PARMAS_TO_TEXT_MAP[tid].items()}
-                    )
+                if self._text_attributes:
+                    extra_attrs.update(self._text_attributes)
 
                 self._attr_extra_state_attributes = extra_attrs
 
 
+class EvopellDiagnosticSensor(EvopellEntity, SensorEntity):
+    """Reprezentuje sensor diagnostyczny huba Evopell."""
+
+    entity_description: EvopellDiagnosticSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: EvopellCoordinator,
+        description: EvopellDiagnosticSensorEntityDescription,
+    ) -> None:
+        """Inicjalizuje sensor diagnostyczny."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_has_entity_name = True
+        self._attr_unique_id = f"{self.coordinator.name}_diag_{description.key}"
+
+    @property
+    def native_value(self) -> StateType:
+        """Zwraca wartość odczytaną z huba."""
+        return self.entity_description.value_fn(self.coordinator.hub)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Zwraca dodatkowe atrybuty odczytane z huba."""
+        if self.entity_description.attr_fn is None:
+            return None
+        return self.entity_description.attr_fn(self.coordinator.hub)
+
+
 class EvopellAverageSensor(EvopellEntity, SensorEntity):
     """Running average (samples) of flue temperature."""
 
@@ -219,6 +371,11 @@ class EvopellAverageSensor(EvopellEntity, SensorEntity):
         self._unsub = None
         self._dirty_samples = 0
 
+    @property
+    def average_state(self) -> AvgState:
+        """Return the running average kept by the sensor."""
+        return self._store.state
+
     @property
     def native_value(self) -> float | None:
         """Return the average value."""
@@ -1,16 +1,35 @@
-"""Small persisted store for running average."""
+"""Small persisted stores for averages, tuning, capabilities and device state."""
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
 import logging
+import time
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.storage import Store
 
+from .const import DOMAIN
+from .tuning import AdaptiveTuner, TuningState
+
 _STORAGE_VERSION = 1
 _LOGGER = logging.getLogger(__name__)
 
+# Rodzaje danych zapisywanych osobno dla każdego wpisu konfiguracji
+ENTRY_STORE_KINDS = ("tuning", "device", "snapshot")
+
+
+def entry_store_key(entry_id: str, kind: str) -> str:
+    """Return the storage key of per-entry data of the given kind."""
+    return f"{DOMAIN}_{entry_id}_{kind}"
+
+
+async def async_remove_stores(hass: HomeAssistant, *keys: str) -> None:
+    """Delete the storage files of the given keys."""
+    for key in keys:
+        await Store(hass, _STORAGE_VERSION, key).async_remove()
+
 
 @dataclass
 class AvgState:
@@ -79,3 +98,140 @@ class AvgStore:
         """Reset the stored average state."""
         self.state = AvgState()
         await self.async_save()
+
+
+class TuningStore:
+    """Small persisted store for learned request parameters."""
+
+    def __init__(self, hass: HomeAssistant, key: str, tuner: AdaptiveTuner) -> None:
+        """Initialize the TuningStore."""
+        self._store: Store[dict] = Store(hass, _STORAGE_VERSION, key)
+        self._tuner = tuner
+
+    async def async_load(self) -> None:
+        """Load learned values from storage into the tuner."""
+        data = await self._store.async_load()
+        if not data:
+            return
+        self._tuner.restore(
+            TuningState(
+                chunk_size=int(data.get("chunk_size", self._tuner.chunk_size)),
+                concurrency=int(data.get("concurrency", self._tuner.concurrency)),
+            )
+        )
+        _LOGGER.debug(
+            "TuningStore loaded state for %s: chunk_size=%s concurrency=%s",
+            self._store.key,
+            self._tuner.chunk_size,
+            self._tuner.concurrency,
+        )
+
+    def async_delay_save(self, delay: float = 60.0) -> None:
+        """Schedule a delayed save if the tuner learned new values."""
+        if not self._tuner.changed:
+            return
+        self._tuner.changed = False
+        self._store.async_delay_save(lambda: asdict(self._tuner.state), delay)
+
+
+@dataclass
+class CapabilityState:
+    """Registers found supported or unsupported by a device profile."""
+
+    supported: set[str] = field(default_factory=set)
+    unsupported: set[str] = field(default_factory=set)
+    complete: bool = False
+
+
+class CapabilityStore:
+    """Small persisted store for the capability map of a device profile."""
+
+    def __init__(self, hass: HomeAssistant, key: str) -> None:
+        """Initialize the CapabilityStore."""
+        self._store: Store[dict] = Store(hass, _STORAGE_VERSION, key)
+        self.state = CapabilityState()
+
+    async def async_load(self) -> None:
+        """Load the capability map from storage."""
+        data = await self._store.async_load()
+        if not data:
+            return
+        self.state = CapabilityState(
+            supported=set(data.get("supported", ())),
+            unsupported=set(data.get("unsupported", ())),
+            complete=bool(data.get("complete", False)),
+        )
+        _LOGGER.debug(
+            "CapabilityStore loaded state for %s: supported=%d unsupported=%d complete=%s",
+            self._store.key,
+            len(self.state.supported),
+            len(self.state.unsupported),
+            self.state.complete,
+        )
+
+    def async_delay_save(self, delay: float = 30.0) -> None:
+        """Schedule a delayed save of the capability map."""
+        self._store.async_delay_save(
+            lambda: {
+                "supported": sorted(self.state.supported),
+                "unsupported": sorted(self.state.unsupported),
+                "complete": self.state.complete,
+            },
+            delay,
+        )
+
+
+class DeviceInfoStore:
+    """Small persisted store for the identity registers of a device."""
+
+    def __init__(self, hass: HomeAssistant, key: str) -> None:
+        """Initialize the DeviceInfoStore."""
+        self._store: Store[dict] = Store(hass, _STORAGE_VERSION, key)
+
+    async def async_load(self) -> dict[str, str] | None:
+        """Return the cached identity registers, if any."""
+        data = await self._store.async_load()
+        if not data:
+            return None
+        return {str(k): str(v) for k, v in data.items()}
+
+    async def async_save(self, identity: dict[str, str]) -> None:
+        """Save the identity registers."""
+        await self._store.async_save(identity)
+        _LOGGER.debug("DeviceInfoStore saved identity for %s", self._store.key)
+
+
+class SnapshotStore:
+    """Small persisted store for the last known register values."""
+
+    def __init__(self, hass: HomeAssistant, key: str) -> None:
+        """Initialize the SnapshotStore."""
+        self._store: Store[dict] = Store(hass, _STORAGE_VERSION, key)
+
+    async def async_load(self, max_age: float) -> dict[str, list[str | None]] | None:
+        """Return saved registers as tid -> [value, min, max], if any.
+
+        Snapshots older than max_age seconds are ignored.
+        """
+        data = await self._store.async_load()
+        if not data or not data.get("registers"):
+            return None
+        saved_at = data.get("saved_at")
+        if not isinstance(saved_at, (int, float)) or time.time() - saved_at > max_age:
+            _LOGGER.debug("Ignoring outdated snapshot %s", self._store.key)
+            return None
+        _LOGGER.debug(
+            "SnapshotStore loaded %d registers for %s saved at %s",
+            len(data["registers"]),
+            self._store.key,
+            data.get("saved_at"),
+        )
+        return data["registers"]
+
+    def async_delay_save(
+        self, registers: Callable[[], dict[str, list[str | None]]], delay: float = 10.0
+    ) -> None:
+        """Schedule a delayed save of the registers returned by the callable."""
+        self._store.async_delay_save(
+            lambda: {"saved_at": time.time(), "registers": registers()}, delay
+        )
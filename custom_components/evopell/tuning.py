@@ -0,0 +1,147 @@
+"""Adaptive tuning of request chunk size and concurrency."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class TuningState:
+    """Dataclass for storing learned request parameters."""
+
+    chunk_size: int
+    concurrency: int
+
+
+class AdaptiveTuner:
+    """AIMD controller for chunk size and number of requests in flight.
+
+    Every fast, successful request counts towards an additive increase;
+    a failed or slow request halves the parameters straight away.
+
+    Odpowiedź jest wolna względem wyuczonej średniej opóźnienia (EWMA), a nie
+    stałego progu, więc sterownik, który zawsze odpowiada wolno, nie jest
+    dławiony do minimum. Liczy się tylko wzrost opóźnienia.
+    """
+
+    MIN_CHUNK_SIZE = 5
+    MAX_CHUNK_SIZE = 40
+    # Odpowiedź tyle razy wolniejsza od średniej uznajemy za oznakę przeciążenia,
+    # o ile różnica przekracza też SLOW_LATENCY_MARGIN [s] (szum szybkich sieci)
+    SLOW_LATENCY_FACTOR = 2.0
+    SLOW_LATENCY_MARGIN = 0.5
+    # Tyle udanych zapytań z rzędu przed zwiększeniem parametrów
+    INCREASE_AFTER = 20
+    CHUNK_SIZE_STEP = 2
+    EWMA_WEIGHT = 0.1
+
+    def __init__(self, chunk_size: int, max_concurrency: int) -> None:
+        """Initialize the tuner with starting values and upper bounds."""
+        self.max_concurrency = max(1, max_concurrency)
+        self.state = TuningState(
+            chunk_size=self._clamp_chunk_size(chunk_size),
+            concurrency=self.max_concurrency,
+        )
+        self.latency: float | None = None
+        self.error_rate = 0.0
+        self.changed = False
+        self._successes = 0
+
+    @property
+    def chunk_size(self) -> int:
+        """Return the currently chosen number of params per request."""
+        return self.state.chunk_size
+
+    @property
+    def concurrency(self) -> int:
+        """Return the currently chosen number of requests in flight."""
+        return self.state.concurrency
+
+    def restore(self, state: TuningState) -> None:
+        """Restore learned values, clamped to the current bounds."""
+        self.state = TuningState(
+            chunk_size=self._clamp_chunk_size(state.chunk_size),
+            concurrency=min(max(1, state.concurrency), self.max_concurrency),
+        )
+
+    def record_success(self, latency: float) -> None:
+        """Account a successful request and its round-trip time."""
+        baseline = self.latency
+        self._update_stats(latency, 0.0)
+        if (
+            baseline is not None
+            and latency > baseline * self.SLOW_LATENCY_FACTOR
+            and latency - baseline > self.SLOW_LATENCY_MARGIN
+        ):
+            _LOGGER.debug("Slow response %.2fs, average %.2fs", latency, baseline)
+            self._decrease("slow response")
+            return
+
+        self._successes += 1
+        if self._successes < self.INCREASE_AFTER:
+            return
+        self._successes = 0
+
+        state = self.state
+        if state.concurrency < self.max_concurrency:
+            self._set(state.chunk_size, state.concurrency + 1)
+        elif state.chunk_size < self.MAX_CHUNK_SIZE:
+            self._set(
+                self._clamp_chunk_size(state.chunk_size + self.CHUNK_SIZE_STEP),
+                state.concurrency,
+            )
+
+    def record_failure(self, reason: str, chunk_too_large: bool = False) -> None:
+        """Account a failed request."""
+        self._update_stats(None, 1.0)
+        if chunk_too_large:
+            self._successes = 0
+            self._set(
+                self._clamp_chunk_size(self.state.chunk_size // 2),
+                self.state.concurrency,
+                reason,
+            )
+            return
+        self._decrease(reason)
+
+    def _decrease(self, reason: str) -> None:
+        self._successes = 0
+        state = self.state
+        if state.concurrency > 1:
+            self._set(state.chunk_size, max(1, state.concurrency // 2), reason)
+        else:
+            self._set(
+                self._clamp_chunk_size(state.chunk_size // 2),
+                state.concurrency,
+                reason,
+            )
+
+    def _set(self, chunk_size: int, concurrency: int, reason: str = "") -> None:
+        if (chunk_size, concurrency) == (self.state.chunk_size, self.state.concurrency):
+            return
+        _LOGGER.debug(
+            "Tuning chunk size %d -> %d, concurrency %d -> %d %s",
+            self.state.chunk_size,
+            chunk_size,
+            self.state.concurrency,
+            concurrency,
+            reason,
+        )
+        self.state = TuningState(chunk_size=chunk_size, concurrency=concurrency)
+        self.changed = True
+
+    def _update_stats(self, latency: float | None, error: float) -> None:
+        weight = self.EWMA_WEIGHT
+        self.error_rate += weight * (error - self.error_rate)
+        if latency is not None:
+            self.latency = (
+                latency
+                if self.latency is None
+                else self.latency + weight * (latency - self.latency)
+            )
+
+    def _clamp_chunk_size(self, chunk_size: int) -> int:
+        return min(max(chunk_size, self.MIN_CHUNK_SIZE), self.MAX_CHUNK_SIZE)
@@ -0,0 +1,325 @@
+"""Local Evopell controller simulator for offline testing and benchmarks.
+
+Serves /getregister.cgi and /setregister.cgi for every register of the
+integration catalog (EVOPELL_PARAM_MAP and EVOPELL_PARAM_MAP1), with the
+same XML shape, status attribute and min/max semantics as the controller.
+Latency, jitter, error rates, Basic-auth failures and the per-request
+parameter limit are configurable, and register values can follow a scripted
+trajectory (by default a burn cycle driving pl_status and tsp_value).
+
+    python tools/simulator.py [--port 8080] [--latency 0.05] [--speed 10]
+
+From code (e.g. benchmarks):
+
+    simulator = EvopellSimulator(SimulatorConfig(latency=0.0))
+    base_url = await simulator.start()
+    ...
+    await simulator.stop()
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+from dataclasses import dataclass, field
+import importlib.util
+import json
+from pathlib import Path
+import random
+import time
+from types import ModuleType
+from typing import Any
+from xml.sax.saxutils import quoteattr
+
+from aiohttp import web
+
+_PACKAGE = Path(__file__).parent.parent / "custom_components" / "evopell"
+
+_XML_PROLOG = '<?xml version="1.0" encoding="UTF-8"?>\n'
+
+IDENTITY = {
+    "device_id": "1",
+    "device_name": "Evopell simulator",
+    "device_type": "EVOPELL",
+    "device_soft_version": "1.0.0",
+    "device_hard_version": "1.0",
+    "eth_mac": "0011223344AA",
+    "eth_ip": "127.0.0.1",
+}
+
+# Odcinki cyklu spalania: czas [s], stałe wartości i liniowe rampy (od, do)
+BURN_CYCLE: list[dict[str, Any]] = [
+    {"duration": 60, "values": {"pl_status": "0"}, "ramps": {"tsp_value": [40, 35]}},
+    {"duration": 120, "values": {"pl_status": "1"}, "ramps": {"tsp_value": [35, 90]}},
+    {
+        "duration": 600,
+        "values": {"pl_status": "2"},
+        "ramps": {"tsp_value": [90, 160], "tpow_value": [45, 62]},
+    },
+    {
+        "duration": 180,
+        "values": {"pl_status": "3"},
+        "ramps": {"tsp_value": [160, 60], "tpow_value": [62, 50]},
+    },
+    {"duration": 60, "values": {"pl_status": "4"}, "ramps": {"tsp_value": [60, 40]}},
+]
+
+
+def _load_module(name: str) -> ModuleType:
+    """Load a catalog module without importing Home Assistant."""
+    spec = importlib.util.spec_from_file_location(
+        f"evopell_{name}", _PACKAGE / f"{name}.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@dataclass
+class SimulatedRegister:
+    """State of one simulated register."""
+
+    value: str
+    min_value: str | None = None
+    max_value: str | None = None
+
+
+@dataclass
+class SimulatorConfig:
+    """Behaviour of the simulated controller."""
+
+    latency: float = 0.05
+    jitter: float = 0.02
+    # Odsetek zapytań kończonych HTTP 503 (przeciążenie sterownika)
+    error_rate: float = 0.0
+    username: str | None = None
+    password: str | None = None
+    # Odsetek zapytań odrzucanych HTTP 401 mimo poprawnych danych logowania
+    auth_failure_rate: float = 0.0
+    # Więcej parametrów w zapytaniu kończy się HTTP 414
+    max_params: int | None = None
+    # Rejestry odpowiadające atrybutem status zamiast wartości
+    unsupported: set[str] = field(default_factory=set)
+    unsupported_fraction: float = 0.0
+    trajectory: list[dict[str, Any]] | None = field(default_factory=lambda: BURN_CYCLE)
+    # Przyspieszenie upływu czasu trajektorii
+    speed: float = 1.0
+    seed: int | None = None
+
+
+class EvopellSimulator:
+    """aiohttp application imitating an Evopell controller."""
+
+    def __init__(self, config: SimulatorConfig | None = None) -> None:
+        """Initialize the simulator and its registers from the catalog."""
+        self.config = config or SimulatorConfig()
+        self._random = random.Random(self.config.seed)
+        self.registers = self._build_registers()
+        self.unsupported = set(self.config.unsupported)
+        if self.config.unsupported_fraction:
+            candidates = sorted(set(self.registers) - set(IDENTITY))
+            self.unsupported.update(
+                self._random.sample(
+                    candidates, int(len(candidates) * self.config.unsupported_fraction)
+                )
+            )
+        self.requests = 0
+        self.params = 0
+        self._started = time.monotonic()
+        self._runner: web.AppRunner | None = None
+
+        self.app = web.Application()
+        self.app.router.add_get("/getregister.cgi", self._handle_get)
+        self.app.router.add_get("/setregister.cgi", self._handle_set)
+
+    @staticmethod
+    def _build_registers() -> dict[str, SimulatedRegister]:
+        const = _load_module("const")
+        register_map = _load_module("register_map")
+        registers = {
+            tid: SimulatedRegister("0") for tid in register_map.EVOPELL_PARAM_MAP
+        }
+        for tid, cfg in const.EVOPELL_PARAM_MAP1.items():
+            if cfg.get("type") == "number":
+                registers[tid] = SimulatedRegister("50", "0", "100")
+            elif (
+                cfg.get("type") == "sensor"
+                and tid not in const.EVOPELL_PARMAS_TO_TEXT_MAP
+            ):
+                registers[tid] = SimulatedRegister("20")
+            elif cfg.get("type") in ("sensor", "binary_sensor"):
+                registers[tid] = SimulatedRegister("0")
+        for tid, value in IDENTITY.items():
+            registers[tid] = SimulatedRegister(value)
+        return registers
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the base URL."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        return f"http://{host}:{self._runner.addresses[0][1]}"
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _apply_trajectory(self) -> None:
+        """Set scripted register values for the current simulated time."""
+        segments = self.config.trajectory
+        if not segments:
+            return
+        period = sum(segment["duration"] for segment in segments)
+        elapsed = (time.monotonic() - self._started) * self.config.speed % period
+        for segment in segments:
+            if elapsed >= segment["duration"]:
+                elapsed -= segment["duration"]
+                continue
+            for tid, value in segment.get("values", {}).items():
+                self.registers[tid].value = str(value)
+            progress = elapsed / segment["duration"]
+            for tid, (start, end) in segment.get("ramps", {}).items():
+                value = start + (end - start) * progress
+                self.registers[tid].value = str(round(value))
+            return
+
+    async def _preamble(self, request: web.Request, params: int) -> None:
+        """Apply latency, authentication, error and size rules of a request."""
+        self.requests += 1
+        self.params += params
+        config = self.config
+        delay = config.latency + self._random.uniform(-config.jitter, config.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if config.username is not None:
+            expected = base64.b64encode(
+                f"{config.username}:{config.password or ''}".encode()
+            ).decode()
+            if request.headers.get("Authorization") != f"Basic {expected}":
+                raise web.HTTPUnauthorized(headers={"WWW-Authenticate": "Basic"})
+            if self._random.random() < config.auth_failure_rate:
+                raise web.HTTPUnauthorized(headers={"WWW-Authenticate": "Basic"})
+        if self._random.random() < config.error_rate:
+            raise web.HTTPServiceUnavailable
+        if config.max_params is not None and params > config.max_params:
+            raise web.HTTPRequestURITooLong
+
+    async def _handle_get(self, request: web.Request) -> web.Response:
+        tids = [key for key in request.query if key != "device"]
+        await self._preamble(request, len(tids))
+        self._apply_trajectory()
+
+        regs = []
+        for vid, tid in enumerate(tids):
+            register = self.registers.get(tid)
+            if register is None or tid in self.unsupported:
+                regs.append(
+                    f'<reg vid="{vid}" tid={quoteattr(tid)} v="" status="error"/>'
+                )
+                continue
+            attrs = f'vid="{vid}" tid={quoteattr(tid)} v={quoteattr(register.value)}'
+            if register.min_value is not None:
+                attrs += f" min={quoteattr(register.min_value)}"
+            if register.max_value is not None:
+                attrs += f" max={quoteattr(register.max_value)}"
+            regs.append(f"<reg {attrs}/>")
+        return self._xml_response(regs)
+
+    async def _handle_set(self, request: web.Request) -> web.Response:
+        values = {key: value for key, value in request.query.items() if key != "device"}
+        await self._preamble(request, len(values))
+
+        regs = []
+        for vid, (tid, value) in enumerate(values.items()):
+            register = self.registers.get(tid)
+            status = "ok"
+            if (
+                register is None
+                or tid in self.unsupported
+                or not self._in_range(register, value)
+            ):
+                status = "error"
+            else:
+                register.value = value
+            shown = register.value if register is not None else value
+            regs.append(
+                f'<reg vid="{vid}" tid={quoteattr(tid)} v={quoteattr(shown)} '
+                f'status="{status}"/>'
+            )
+        return self._xml_response(regs)
+
+    @staticmethod
+    def _in_range(register: SimulatedRegister, value: str) -> bool:
+        """Return True if value fits the register's min/max."""
+        if register.min_value is None and register.max_value is None:
+            return True
+        try:
+            number = float(value)
+        except ValueError:
+            return False
+        if register.min_value is not None and number < float(register.min_value):
+            return False
+        return register.max_value is None or number <= float(register.max_value)
+
+    @staticmethod
+    def _xml_response(regs: list[str]) -> web.Response:
+        body = f'{_XML_PROLOG}<cmd status="ok">{"".join(regs)}</cmd>'
+        return web.Response(body=body.encode(), content_type="text/xml")
+
+
+def main() -> None:
+    """Run the simulator from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--username")
+    parser.add_argument("--password")
+    parser.add_argument("--auth-failure-rate", type=float, default=0.0)
+    parser.add_argument("--max-params", type=int)
+    parser.add_argument("--unsupported", nargs="*", default=[])
+    parser.add_argument("--unsupported-fraction", type=float, default=0.0)
+    parser.add_argument(
+        "--trajectory",
+        type=Path,
+        help="JSON list of segments like the built-in BURN_CYCLE",
+    )
+    parser.add_argument("--static", action="store_true", help="no trajectory")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    trajectory = BURN_CYCLE
+    if args.static:
+        trajectory = None
+    elif args.trajectory:
+        trajectory = json.loads(args.trajectory.read_text())
+
+    simulator = EvopellSimulator(
+        SimulatorConfig(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            username=args.username,
+            password=args.password,
+            auth_failure_rate=args.auth_failure_rate,
+            max_params=args.max_params,
+            unsupported=set(args.unsupported),
+            unsupported_fraction=args.unsupported_fraction,
+            trajectory=trajectory,
+            speed=args.speed,
+            seed=args.seed,
+        )
+    )
+    web.run_app(simulator.app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()